@@ -0,0 +1,245 @@
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_TIMEOUT = 120
+# Extra time the parent waits past a job's own timeout before declaring its worker lost
+LOST_WORKER_GRACE = 10
+
+class JobTimeout(Exception):
+    pass
+
+class PageBudgetExceeded(Exception):
+    pass
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout()
+
+def _warm_worker():
+    """Pool initializer: pay the python-pptx / python-docx import and template parse cost once per worker"""
+    sys.path.insert(0, HERE)
+    import create_investor_deck
+    import MEM_Inc_VC_Financing_Memorandum as memo
+    # Parse the default templates now so every job starts from a cheap clone
+    create_investor_deck.new_presentation()
+    memo.new_memo_document()
+    signal.signal(signal.SIGALRM, _raise_timeout)
+
+def part_path(output):
+    """Temporary name next to output, unique per process, with the same extension"""
+    root, ext = os.path.splitext(output)
+    return f"{root}.{os.getpid()}.part{ext}"
+
+def _render_cached(job, cache, inputs, build, check=None):
+    """Copy the job's output from the cache when its inputs are unchanged, else build it and cache it
+
+    build(path) writes the document to path. Either way the file is written under a
+    temporary name and renamed into place, so a timeout or crash mid-save never leaves
+    a truncated document under the output name. check(path), if given, runs on the
+    temporary file before it is cached or renamed; it returns extra result fields, or
+    raises to fail the job with nothing written.
+    """
+    check = check or (lambda path: {})
+    part = part_path(job['output'])
+    try:
+        if cache is None:
+            build(part)
+            result = check(part)
+        else:
+            import render_cache
+            key = render_cache.cache_key(job['kind'], inputs, job.get('template'))
+            if cache.fetch(key, part):
+                result = dict(check(part), cached=True)
+            else:
+                build(part)
+                result = dict(check(part), cached=False)
+                cache.store(key, part)
+        os.replace(part, job['output'])
+    finally:
+        if os.path.exists(part):
+            os.unlink(part)
+    return result
+
+def render_deck_job(job, cache=None):
+    import create_investor_deck
+    compression = job.get('compression', 'default')
+    return _render_cached(job, cache, {'spec': job.get('spec'), 'compression': compression},
+                          lambda path: create_investor_deck.build_deck(job.get('spec'), path, job.get('template'),
+                                                                       compression))
+
+def render_memo_job(job, cache=None):
+    """Render a memo; reports its estimated page count and enforces the job's 'max_pages'"""
+    import MEM_Inc_VC_Financing_Memorandum as memo
+    import page_estimate
+    # Resolve the date now so the key and the rendered memo agree, even across midnight
+    context = memo.memo_context(job.get('context'))
+    stream = job.get('stream', False)
+    compression = job.get('compression', 'default')
+
+    def check_pages(path):
+        pages = page_estimate.estimate_pages(path)
+        if job.get('max_pages') and pages > job['max_pages']:
+            raise PageBudgetExceeded(f"estimated {pages} pages, budget is {job['max_pages']}")
+        return {'pages': pages}
+
+    return _render_cached(job, cache, {'context': context, 'stream': stream, 'compression': compression},
+                          lambda path: memo.build_memo(context, path, stream=stream, template=job.get('template'),
+                                                       compression=compression),
+                          check_pages)
+
+JOB_RENDERERS = {
+    'deck': render_deck_job,
+    'memo': render_memo_job,
+}
+
+def run_job(index, job, timeout, cache_dir=None):
+    """Render one manifest job inside a worker; never raises so one bad job cannot take down the batch"""
+    result = {'index': index, 'kind': job.get('kind'), 'output': job.get('output'), 'status': 'ok', 'error': None}
+    start = time.perf_counter()
+    signal.alarm(max(1, int(math.ceil(timeout))) if timeout else 0)
+    try:
+        renderer = JOB_RENDERERS.get(job.get('kind'))
+        if renderer is None:
+            raise ValueError(f"Unknown job kind: {job.get('kind')!r}")
+        cache = None
+        if cache_dir:
+            import render_cache
+            cache = render_cache.RenderCache(cache_dir)
+        if job.get('profile'):
+            # Per-job span profile: {"profile": true} writes <output>.profile.json/.folded
+            import instrumentation
+            with instrumentation.recording() as recorder:
+                result.update(renderer(job, cache) or {})
+            prefix = job['profile'] if isinstance(job['profile'], str) else job['output'] + '.profile'
+            result['profile'] = instrumentation.write_profile(recorder, prefix)[0]
+        else:
+            result.update(renderer(job, cache) or {})
+        result['bytes'] = os.path.getsize(job['output'])
+    except JobTimeout:
+        result['status'] = 'timeout'
+        result['error'] = f"exceeded {timeout}s"
+    except Exception as exc:
+        result['status'] = 'failed'
+        result['error'] = f"{type(exc).__name__}: {exc}"
+    finally:
+        signal.alarm(0)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def load_manifest(path):
+    """Read a manifest: a JSON list of jobs, or {"jobs": [...]}; relative outputs resolve against the manifest"""
+    with open(path) as f:
+        manifest = json.load(f)
+    jobs = manifest['jobs'] if isinstance(manifest, dict) else manifest
+    base = os.path.dirname(os.path.abspath(path))
+    for job in jobs:
+        job['output'] = os.path.join(base, job['output'])
+    return jobs
+
+def run_batch(jobs, workers=None, timeout=DEFAULT_TIMEOUT, pdf_workers=1, cache_dir=None):
+    """Fan jobs out over a reusable process pool and return (results, summary)
+
+    With a cache_dir, jobs whose inputs and generator are unchanged since an earlier run
+    are copied from the render cache instead of being rendered.
+
+    Jobs with "pdf": true are handed to a pool of warm soffice instances as soon as their
+    document is written, so conversion overlaps with rendering the rest of the batch.
+    """
+    workers = workers or os.cpu_count() or 1
+    for job in jobs:
+        out_dir = os.path.dirname(job['output'])
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+
+    converter = None
+    conversions = {}
+    if any(job.get('pdf') for job in jobs):
+        import pdf_export
+        converter = pdf_export.ConverterPool(pdf_workers, timeout)
+
+    def convert(result):
+        # Runs in the pool's result thread as each job finishes
+        if converter and result['status'] == 'ok' and jobs[result['index']].get('pdf'):
+            conversions[result['index']] = converter.submit(result['output'])
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_warm_worker) as pool:
+        pending = [
+            (i, job, pool.apply_async(run_job, (i, job, job.get('timeout', timeout), cache_dir), callback=convert))
+            for i, job in enumerate(jobs)
+        ]
+        results = []
+        for i, job, async_result in pending:
+            job_timeout = job.get('timeout', timeout)
+            try:
+                results.append(async_result.get(job_timeout + LOST_WORKER_GRACE if job_timeout else None))
+            except multiprocessing.TimeoutError:
+                # The worker died or hung without honouring its alarm
+                results.append({'index': i, 'kind': job.get('kind'), 'output': job['output'],
+                                'status': 'lost', 'error': 'worker did not report back', 'seconds': None})
+    if converter:
+        try:
+            for r in results:
+                if r['index'] in conversions:
+                    try:
+                        r['pdf'] = conversions[r['index']].result()
+                    except Exception as exc:
+                        r['status'] = 'failed'
+                        r['error'] = f"PDF export: {type(exc).__name__}: {exc}"
+        finally:
+            converter.close()
+    wall = time.perf_counter() - start
+
+    ok = sum(1 for r in results if r['status'] == 'ok')
+    summary = {
+        'jobs': len(jobs),
+        'ok': ok,
+        'cached': sum(1 for r in results if r.get('cached')),
+        'failed': len(jobs) - ok,
+        'workers': workers,
+        'wall_seconds': wall,
+        'docs_per_second': ok / wall if wall else 0.0,
+    }
+    return results, summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a manifest of decks and memos across a process pool")
+    parser.add_argument('manifest', help="JSON list of jobs: {\"kind\": \"deck\"|\"memo\", \"output\": path, ...}")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="per-job timeout in seconds")
+    parser.add_argument('--pdf-workers', type=int, default=1, help="warm soffice instances for jobs with \"pdf\": true")
+    parser.add_argument('--cache-dir', nargs='?', const='', default=None,
+                        help="reuse unchanged documents from a render cache (default dir: .render_cache)")
+    args = parser.parse_args(argv)
+
+    jobs = load_manifest(args.manifest)
+    if any(job.get('pdf') for job in jobs):
+        import pdf_export
+        try:
+            pdf_export.check_available()
+        except pdf_export.ConversionError as exc:
+            print(f"✗ {exc}")
+            return 1
+    cache_dir = args.cache_dir
+    if cache_dir == '':
+        import render_cache
+        cache_dir = render_cache.DEFAULT_CACHE_DIR
+    results, summary = run_batch(jobs, args.workers, args.timeout, args.pdf_workers, cache_dir)
+    for r in results:
+        if r['status'] != 'ok':
+            print(f"✗ [{r['index']}] {r['kind']} -> {r['output']}: {r['status']} ({r['error']})")
+    print(f"✓ {summary['ok']}/{summary['jobs']} documents in {summary['wall_seconds']:.2f}s "
+          f"on {summary['workers']} workers ({summary['docs_per_second']:.1f} docs/sec)")
+    if cache_dir:
+        print(f"✓ {summary['cached']} reused from the render cache, {summary['ok'] - summary['cached']} rendered")
+    return 0 if summary['failed'] == 0 else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
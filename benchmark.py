@@ -0,0 +1,247 @@
+"""Benchmarks for the slide builders and full deck/memo generation.
+
+Each case renders `scale` units (slides, or memo sections) into one document, then saves it
+to memory. Timing and peak-memory passes run separately so tracemalloc overhead does not
+skew the timings. Results are written as JSON and can be compared against a stored baseline:
+
+    python benchmark.py --save-baseline
+    python benchmark.py --baseline benchmark_baseline.json --fail-on-regression
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCALES = (1, 100, 1000)
+DEFAULT_OUTPUT = os.path.join(HERE, 'benchmark_results.json')
+DEFAULT_BASELINE = os.path.join(HERE, 'benchmark_baseline.json')
+# A case regresses when it is this much slower (or bigger in peak memory) than the baseline
+DEFAULT_THRESHOLD = 0.20
+# ...and the difference is above this noise floor
+MIN_DELTA = {'seconds': 0.005, 'peak_memory_bytes': 256 * 1024, 'output_bytes': 1024}
+
+def _deck():
+    import create_investor_deck
+    return create_investor_deck
+
+def _spec_entry(slide_type):
+    return next(s for s in _deck().DECK_SPEC if s['type'] == slide_type)
+
+def _builder_case(slide_spec):
+    """Render `scale` copies of one slide spec"""
+    def run(scale):
+        d = _deck()
+        prs = d.new_presentation()
+        builder = d.SLIDE_BUILDERS[slide_spec['type']]
+        for i in range(scale):
+            builder(prs, slide_spec, f"bench-{i}")
+        return prs, len(prs.slides)
+    return run
+
+def _block_case(block):
+    """Render `scale` content slides each carrying one block of this type"""
+    return _builder_case({'type': 'content', 'title': "Benchmark", 'blocks': [block]})
+
+def _content_block(block_type):
+    for slide in _deck().DECK_SPEC:
+        for block in slide.get('blocks', ()):
+            if block['type'] == block_type:
+                return block
+
+def full_deck(scale):
+    """The default deck spec repeated until it reaches `scale` spec entries"""
+    d = _deck()
+    spec = (d.DECK_SPEC * (scale // len(d.DECK_SPEC) + 1))[:scale]
+    prs = d.render_deck(spec)
+    return prs, len(prs.slides)
+
+def full_memo(scale):
+    """The memo's body blocks repeated `scale` times in one document"""
+    import MEM_Inc_VC_Financing_Memorandum as memo
+    doc = memo.render_memo(blocks=memo.MEMO_BLOCKS * scale)
+    return doc, scale
+
+class _Streamed:
+    """Stands in for a document that was already written to a temp file while it was built"""
+    def __init__(self, path):
+        self.path = path
+
+    def save(self, target):
+        with open(self.path, 'rb') as f:
+            shutil.copyfileobj(f, target)
+        os.unlink(self.path)
+
+def full_memo_stream(scale):
+    """full_memo through the streaming writer; the file is written during the build"""
+    import tempfile
+    import MEM_Inc_VC_Financing_Memorandum as memo
+    fd, path = tempfile.mkstemp(suffix='.docx')
+    with os.fdopen(fd, 'wb') as f:
+        memo.stream_memo(f, blocks=memo.MEMO_BLOCKS * scale)
+    return _Streamed(path), scale
+
+class _Packaged:
+    """Saves through package_writer under a compression profile instead of the library's own save"""
+    def __init__(self, document, compression):
+        self.document = document
+        self.compression = compression
+
+    def save(self, target):
+        import package_writer
+        package_writer.save_package(self.document, target, self.compression)
+
+def packaged(case, compression):
+    def run(scale):
+        document, units = case(scale)
+        return _Packaged(document, compression), units
+    return run
+
+class _Preview:
+    """Writes the office-free preview of a rendered deck (HTML page or PNG contact sheet) instead of the .pptx"""
+    def __init__(self, prs, kind):
+        self.prs = prs
+        self.kind = kind
+
+    def save(self, target):
+        import deck_preview
+        if self.kind == 'html':
+            target.write(deck_preview.deck_html(self.prs).encode('utf-8'))
+        else:
+            deck_preview.contact_sheet(self.prs, target)
+
+def preview(kind):
+    def run(scale):
+        prs, units = full_deck(scale)
+        return _Preview(prs, kind), units
+    return run
+
+CASES = {
+    'add_modern_title_slide': lambda: _builder_case(_spec_entry('title')),
+    'add_section_divider': lambda: _builder_case(_spec_entry('section')),
+    'add_content_slide_modern': lambda: _builder_case(_spec_entry('content')),
+    'add_stat_row': lambda: _block_case(_content_block('stat_row')),
+    'add_text_block': lambda: _block_case(_content_block('text')),
+    'add_highlight_box': lambda: _block_case(_content_block('highlight')),
+    'add_bar_chart_slide': lambda: _builder_case(_spec_entry('bar_chart')),
+    'add_bar_chart_slide[native]': lambda: _builder_case(dict(_spec_entry('bar_chart'), native=True)),
+    'add_insight_grid': lambda: _builder_case(_spec_entry('insight_grid')),
+    'add_roadmap_slide_modern': lambda: _builder_case(_spec_entry('roadmap')),
+    'full_deck': lambda: full_deck,
+    'full_memo': lambda: full_memo,
+    'full_memo[stream]': lambda: full_memo_stream,
+    'full_deck[save:fast]': lambda: packaged(full_deck, 'fast'),
+    'full_memo[save:fast]': lambda: packaged(full_memo, 'fast'),
+    'full_memo[save:archive]': lambda: packaged(full_memo, 'archive'),
+    'deck_preview[html]': lambda: preview('html'),
+    'deck_preview[png]': lambda: preview('png'),
+}
+
+def measure(run, scale, repeats):
+    """Best-of-N build/save timings, then one tracemalloc pass for peak memory"""
+    best_build = best_save = float('inf')
+    size = units = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        document, units = run(scale)
+        built = time.perf_counter()
+        buffer = io.BytesIO()
+        document.save(buffer)
+        saved = time.perf_counter()
+        best_build = min(best_build, built - start)
+        best_save = min(best_save, saved - built)
+        size = len(buffer.getvalue())
+
+    tracemalloc.start()
+    document, _ = run(scale)
+    document.save(io.BytesIO())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = best_build + best_save
+    return {
+        'units': units,
+        'build_seconds': best_build,
+        'save_seconds': best_save,
+        'seconds': total,
+        'seconds_per_unit': total / units if units else None,
+        'peak_memory_bytes': peak,
+        'output_bytes': size,
+        'output_bytes_per_unit': size / units if units else None,
+    }
+
+def run_benchmarks(cases=None, scales=DEFAULT_SCALES, repeats=3, log=print):
+    results = {}
+    for name in (cases or CASES):
+        run = CASES[name]()
+        results[name] = {}
+        for scale in scales:
+            # Big scales are slow enough that one timing run is representative
+            r = measure(run, scale, repeats if scale < 100 else 1)
+            results[name][str(scale)] = r
+            log(f"{name:32s} x{scale:<5d} {r['seconds'] * 1000:10.1f} ms  "
+                f"{r['peak_memory_bytes'] / 1e6:8.1f} MB peak  {r['output_bytes_per_unit'] / 1e3:8.1f} KB/unit")
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'scales': list(scales),
+        },
+        'results': results,
+    }
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """List (case, scale, metric, baseline, current) for every metric that grew past the threshold"""
+    regressions = []
+    for name, scales in current['results'].items():
+        for scale, r in scales.items():
+            base = baseline.get('results', {}).get(name, {}).get(scale)
+            if not base:
+                continue
+            for metric in ('seconds', 'peak_memory_bytes', 'output_bytes'):
+                if (base[metric] and r[metric] > base[metric] * (1 + threshold)
+                        and r[metric] - base[metric] > MIN_DELTA[metric]):
+                    regressions.append((name, scale, metric, base[metric], r[metric]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark slide builders and deck/memo generation")
+    parser.add_argument('--cases', nargs='*', choices=sorted(CASES), help="default: all")
+    parser.add_argument('--scales', nargs='*', type=int, default=list(DEFAULT_SCALES))
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', help="compare against this results file")
+    parser.add_argument('--save-baseline', action='store_true', help=f"also write results to {DEFAULT_BASELINE}")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, HERE)
+    current = run_benchmarks(args.cases, args.scales, args.repeats)
+    with open(args.output, 'w') as f:
+        json.dump(current, f, indent=2)
+    print(f"✓ Results: {args.output}")
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"✓ Baseline: {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(current, json.load(f), args.threshold)
+        for name, scale, metric, base, now in regressions:
+            print(f"✗ {name} x{scale}: {metric} {base:.4g} -> {now:.4g} (+{(now / base - 1) * 100:.0f}%)")
+        if not regressions:
+            print(f"✓ No regressions beyond {args.threshold:.0%}")
+        elif args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
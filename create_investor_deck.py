@@ -1,13 +1,22 @@
-import pandas as pd
-from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, PP_PARAGRAPH_ALIGNMENT
+import os
+import re
+
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import CategoryChartData
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
-from pptx.oxml.xmlchemy import OxmlElement
-import math
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from lxml import etree
+
+import deck_theme
+import instrumentation
+import package_writer
+import template_pool
+import text_layout
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'PPM_Survey_Presentation.pptx')
 
 # PREMIUM COLOR PALETTE - Modern Investor Deck
 NAVY = RGBColor(20, 33, 61)           # Primary dark
@@ -22,11 +31,52 @@ GRAY_800 = RGBColor(31, 41, 55)       # Deep text
 WHITE = RGBColor(255, 255, 255)
 BLACK = RGBColor(0, 0, 0)
 
+PALETTE = {
+    'NAVY': NAVY, 'SLATE': SLATE, 'EMERALD': EMERALD, 'AMBER': AMBER, 'BLUE': BLUE, 'ROSE': ROSE,
+    'GRAY_50': GRAY_50, 'GRAY_100': GRAY_100, 'GRAY_800': GRAY_800, 'WHITE': WHITE, 'BLACK': BLACK,
+}
+
+# Where the palette lives in the theme. Shapes and text reference these slots rather than
+# repeating RGB values, so swapping the theme part rebrands a finished deck (deck_theme.retheme).
+# Body text is left uncoloured and picks up dk1 (tx1) through the master's default text style.
+THEME_COLORS = {
+    'dk1': GRAY_800, 'lt1': WHITE, 'dk2': NAVY, 'lt2': GRAY_50,
+    'accent1': EMERALD, 'accent2': BLUE, 'accent3': AMBER, 'accent4': ROSE, 'accent5': SLATE, 'accent6': GRAY_100,
+    'hlink': BLUE, 'folHlink': SLATE,
+}
+# Headings (+mj-lt) and body text (+mn-lt) both resolve to this through the theme
+THEME_FONT = "Helvetica Neue"
+
+# Palette colour -> slot reference; BLUE and SLATE resolve to their accent slots, not the hyperlink ones
+THEME_REFS = {}
+for _slot, _rgb in THEME_COLORS.items():
+    THEME_REFS.setdefault(_rgb, deck_theme.SLOT_REFS[_slot])
+
+def resolve_color(color):
+    """Accept an RGBColor, a palette name ('EMERALD'), a hex string or an [r, g, b] list from a JSON spec"""
+    if isinstance(color, RGBColor):
+        return color
+    if isinstance(color, str):
+        if color.upper() in PALETTE:
+            return PALETTE[color.upper()]
+        return RGBColor.from_string(color.lstrip('#').upper())
+    return RGBColor(*color)
+
+def set_color(color_format, color):
+    """Point a ColorFormat at the theme slot holding color; colours outside the theme stay literal RGB"""
+    rgb = resolve_color(color)
+    ref = THEME_REFS.get(rgb)
+    if ref is None:
+        color_format.rgb = rgb
+    else:
+        color_format.theme_color = MSO_THEME_COLOR.from_xml(ref)
+
 def set_shape_transparency(shape, transparency):
     """Set shape transparency (0-100)"""
     fill = shape.fill
     fill._element.get_or_add_srgbClr().set('alpha', str(100000 - (transparency * 1000)))
 
+@instrumentation.traced
 def add_gradient_background(slide, prs):
     """Add subtle gradient background"""
     background = slide.shapes.add_shape(
@@ -35,152 +85,246 @@ def add_gradient_background(slide, prs):
     fill = background.fill
     fill.gradient()
     fill.gradient_angle = 45
-    fill.gradient_stops[0].color.rgb = WHITE
-    fill.gradient_stops[1].color.rgb = GRAY_50
+    set_color(fill.gradient_stops[0].color, WHITE)
+    set_color(fill.gradient_stops[1].color, GRAY_50)
     background.line.fill.background()
 
     # Send to back
     slide.shapes._spTree.remove(background._element)
     slide.shapes._spTree.insert(2, background._element)
 
-def add_modern_title_slide(prs):
+CONTENT_LAYOUT_NAME = "Modern Content"
+
+# Shared chrome for content slides (theme colours): white background, emerald header bar and a styled title placeholder
+CONTENT_LAYOUT_XML = (
+    '<p:cSld %s name="%s">'
+    '<p:bg><p:bgPr><a:solidFill><a:schemeClr val="%s"/></a:solidFill><a:effectLst/></p:bgPr></p:bg>'
+    '<p:spTree>'
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+    '<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Header Accent"/><p:cNvSpPr/><p:nvPr userDrawn="1"/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:schemeClr val="%s"/></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr></p:sp>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="3" name="Title 1"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+    '<p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none" lIns="91440" tIns="45720" rIns="91440" bIns="45720" anchor="t">'
+    '<a:noAutofit/></a:bodyPr>'
+    '<a:lstStyle><a:lvl1pPr algn="l"><a:defRPr sz="2800" b="1"><a:solidFill><a:schemeClr val="%s"/></a:solidFill>'
+    '<a:latin typeface="+mj-lt"/></a:defRPr></a:lvl1pPr></a:lstStyle>'
+    '<a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody></p:sp>'
+    '</p:spTree></p:cSld>'
+)
+
+def get_content_layout(prs):
+    """Return the shared content-slide layout, converting the template's Title Only layout on first use"""
+    for layout in prs.slide_layouts:
+        if layout.name == CONTENT_LAYOUT_NAME:
+            return layout
+
+    layout = prs.slide_layouts[5]
+    cSld = parse_xml(CONTENT_LAYOUT_XML % (
+        nsdecls('a', 'p'), CONTENT_LAYOUT_NAME, THEME_REFS[WHITE],
+        Inches(0.6), Inches(0.7), Inches(0.08), Inches(0.4), THEME_REFS[EMERALD],
+        Inches(0.85), Inches(0.65), Inches(8.5), Inches(0.5), THEME_REFS[NAVY],
+    ))
+    layout._element.replace(layout._element.cSld, cSld)
+    return layout
+
+def name_shape(shape, key, role):
+    """Give a shape a stable name ("<slide key>/<role>") that deck_patch can address"""
+    if key:
+        shape.name = f"{key}/{role}"
+    return shape
+
+@instrumentation.traced
+def add_titled_slide(prs, title, key=None):
+    """Add a slide on the shared content layout; only the title text lives on the slide itself"""
+    slide = prs.slides.add_slide(get_content_layout(prs))
+    slide.shapes.title.text = title
+    name_shape(slide.shapes.title, key, 'title')
+    return slide
+
+@instrumentation.traced
+def add_modern_title_slide(prs, title_text="Life Insurance", subtitle_text="Customer Experience Analysis",
+                           tagline_text="Product-Market Fit Study | 2024", key=None):
     """Create investor-grade title slide"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])
 
     # Clean white background
     bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
     bg.fill.solid()
-    bg.fill.fore_color.rgb = WHITE
+    set_color(bg.fill.fore_color, WHITE)
     bg.line.fill.background()
+    name_shape(bg, key, 'background')
 
     # Accent bar - left side
     accent = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE, 0, 0, Inches(0.15), prs.slide_height
     )
     accent.fill.solid()
-    accent.fill.fore_color.rgb = EMERALD
+    set_color(accent.fill.fore_color, EMERALD)
     accent.line.fill.background()
+    name_shape(accent, key, 'accent')
 
     # Title area
-    title = slide.shapes.add_textbox(Inches(1.5), Inches(2.5), Inches(7), Inches(1.2))
+    title = name_shape(slide.shapes.add_textbox(Inches(1.5), Inches(2.5), Inches(7), Inches(1.2)), key, 'title')
     tf = title.text_frame
-    tf.text = "Life Insurance"
+    tf.text = title_text
     p = tf.paragraphs[0]
     p.font.size = Pt(64)
     p.font.bold = True
-    p.font.color.rgb = NAVY
-    p.font.name = "Helvetica Neue"
+    set_color(p.font.color, NAVY)
 
     # Subtitle line 1
-    subtitle1 = slide.shapes.add_textbox(Inches(1.5), Inches(3.8), Inches(7), Inches(0.6))
+    subtitle1 = name_shape(slide.shapes.add_textbox(Inches(1.5), Inches(3.8), Inches(7), Inches(0.6)), key, 'subtitle')
     tf1 = subtitle1.text_frame
-    tf1.text = "Customer Experience Analysis"
+    tf1.text = subtitle_text
     p1 = tf1.paragraphs[0]
     p1.font.size = Pt(32)
-    p1.font.color.rgb = SLATE
-    p1.font.name = "Helvetica Neue"
+    set_color(p1.font.color, SLATE)
 
     # Subtitle line 2
-    subtitle2 = slide.shapes.add_textbox(Inches(1.5), Inches(4.5), Inches(7), Inches(0.5))
+    subtitle2 = name_shape(slide.shapes.add_textbox(Inches(1.5), Inches(4.5), Inches(7), Inches(0.5)), key, 'tagline')
     tf2 = subtitle2.text_frame
-    tf2.text = "Product-Market Fit Study | 2024"
+    tf2.text = tagline_text
     p2 = tf2.paragraphs[0]
     p2.font.size = Pt(20)
-    p2.font.color.rgb = SLATE
-    p2.font.name = "Helvetica Neue"
+    set_color(p2.font.color, SLATE)
 
     # Decorative element
     circle = slide.shapes.add_shape(
         MSO_SHAPE.OVAL, Inches(8), Inches(1.2), Inches(0.8), Inches(0.8)
     )
     circle.fill.solid()
-    circle.fill.fore_color.rgb = EMERALD
+    set_color(circle.fill.fore_color, EMERALD)
     circle.line.fill.background()
+    name_shape(circle, key, 'circle')
 
-def add_section_divider(prs, section_number, section_title, subtitle):
+@instrumentation.traced
+def add_section_divider(prs, section_number, section_title, subtitle, key=None):
     """Create clean section divider"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])
 
     # Background
     bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
     bg.fill.solid()
-    bg.fill.fore_color.rgb = NAVY
+    set_color(bg.fill.fore_color, NAVY)
     bg.line.fill.background()
+    name_shape(bg, key, 'background')
 
     # Section number
-    num = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
+    num = name_shape(slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1)), key, 'number')
     tf = num.text_frame
     tf.text = f"0{section_number}"
     p = tf.paragraphs[0]
     p.font.size = Pt(120)
     p.font.bold = True
-    p.font.color.rgb = EMERALD
-    p.font.name = "Helvetica Neue"
+    set_color(p.font.color, EMERALD)
 
     # Section title
-    title = slide.shapes.add_textbox(Inches(1), Inches(3.3), Inches(8), Inches(0.8))
+    title = name_shape(slide.shapes.add_textbox(Inches(1), Inches(3.3), Inches(8), Inches(0.8)), key, 'title')
     tf_title = title.text_frame
     tf_title.text = section_title
     p_title = tf_title.paragraphs[0]
     p_title.font.size = Pt(48)
     p_title.font.bold = True
-    p_title.font.color.rgb = WHITE
-    p_title.font.name = "Helvetica Neue"
+    set_color(p_title.font.color, WHITE)
 
     # Subtitle
-    sub = slide.shapes.add_textbox(Inches(1), Inches(4.3), Inches(8), Inches(0.5))
+    sub = name_shape(slide.shapes.add_textbox(Inches(1), Inches(4.3), Inches(8), Inches(0.5)), key, 'subtitle')
     tf_sub = sub.text_frame
     tf_sub.text = subtitle
     p_sub = tf_sub.paragraphs[0]
     p_sub.font.size = Pt(18)
-    p_sub.font.color.rgb = GRAY_100
-    p_sub.font.name = "Helvetica Neue"
-
-def add_content_slide_modern(prs, title, content_blocks):
-    """Create modern content slide with smart layout"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    # White background
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = WHITE
-    bg.line.fill.background()
-
-    # Minimal header
-    header_line = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(0.6), Inches(0.7), Inches(0.08), Inches(0.4)
-    )
-    header_line.fill.solid()
-    header_line.fill.fore_color.rgb = EMERALD
-    header_line.line.fill.background()
-
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.85), Inches(0.65), Inches(8.5), Inches(0.5))
-    tf = title_box.text_frame
-    tf.text = title
-    p = tf.paragraphs[0]
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = NAVY
-    p.font.name = "Helvetica Neue"
-
-    # Content blocks
-    y_pos = Inches(1.5)
-    for block in content_blocks:
-        if block['type'] == 'stat_row':
-            add_stat_row(slide, y_pos, block['stats'])
-            y_pos += Inches(1.6)
-        elif block['type'] == 'text':
-            add_text_block(slide, y_pos, block['content'])
-            y_pos += Inches(0.4) * len(block['content'])
-        elif block['type'] == 'highlight':
-            add_highlight_box(slide, y_pos, block['text'], block.get('color', BLUE))
-            y_pos += Inches(1.2)
-        elif block['type'] == 'chart':
-            add_simple_chart(slide, y_pos, block['data'], block['chart_type'])
-            y_pos += Inches(3.5)
-
-def add_stat_row(slide, y_pos, stats):
+    set_color(p_sub.font.color, GRAY_100)
+
+# Content area below the title and fixed block heights (text blocks are measured)
+CONTENT_TOP = Inches(1.5)
+CONTENT_BOTTOM = Inches(7.0)
+TEXT_BLOCK_WIDTH = Inches(8)
+BLOCK_HEIGHTS = {
+    'stat_row': Inches(1.6),
+    'highlight': Inches(1.2),
+    'chart': Inches(3.5),
+}
+
+def text_paragraph_height(text):
+    """Measured height of one 14pt text-block paragraph with its 6pt spacing"""
+    return text_layout.paragraph_height(text, 14, TEXT_BLOCK_WIDTH - 2 * text_layout.TEXTBOX_INSET_X, 6, 6)
+
+def text_block_height(texts):
+    return sum(text_paragraph_height(t) for t in texts) + 2 * text_layout.TEXTBOX_INSET_Y
+
+def block_height(block):
+    if block['type'] == 'text':
+        return text_block_height(block['content'])
+    return BLOCK_HEIGHTS[block['type']]
+
+@instrumentation.traced(name='layout')
+def paginate_blocks(blocks, top=CONTENT_TOP, bottom=CONTENT_BOTTOM):
+    """Split content blocks into pages that fit between top and bottom; text blocks that overflow are split by paragraph"""
+    pages = [[]]
+    y = top
+    for block in blocks:
+        height = block_height(block)
+        if y + height <= bottom or block['type'] != 'text':
+            if y + height > bottom and pages[-1]:
+                pages.append([])
+                y = top
+            pages[-1].append(block)
+            y += height
+            continue
+
+        lines = list(block['content'])
+        while lines:
+            # Take paragraphs while they fit; a lone paragraph taller than a page still gets placed
+            used = 2 * text_layout.TEXTBOX_INSET_Y
+            fit = 0
+            while fit < len(lines) and y + used + text_paragraph_height(lines[fit]) <= bottom:
+                used += text_paragraph_height(lines[fit])
+                fit += 1
+            if fit == 0 and pages[-1]:
+                pages.append([])
+                y = top
+                continue
+            fit = max(fit, 1)
+            pages[-1].append(dict(block, content=lines[:fit]))
+            y += text_block_height(lines[:fit])
+            lines = lines[fit:]
+            while lines and not lines[0].strip():
+                lines.pop(0)
+            if lines:
+                pages.append([])
+                y = top
+    return pages
+
+@instrumentation.traced
+def add_content_slide_modern(prs, title, content_blocks, key=None):
+    """Create modern content slide with smart layout; overflowing content continues on "(cont.)" slides"""
+    for page_number, page in enumerate(paginate_blocks(content_blocks)):
+        page_key = key if page_number == 0 or not key else f"{key}-cont{page_number}"
+        page_title = title if page_number == 0 else f"{title} (cont.)"
+        slide = add_titled_slide(prs, page_title, page_key)
+
+        # Content blocks
+        y_pos = CONTENT_TOP
+        for i, block in enumerate(page):
+            block_key = f"{page_key}/block{i}" if page_key else None
+            if block['type'] == 'stat_row':
+                add_stat_row(slide, y_pos, block['stats'], block_key)
+            elif block['type'] == 'text':
+                add_text_block(slide, y_pos, block['content'], block_key)
+            elif block['type'] == 'highlight':
+                add_highlight_box(slide, y_pos, block['text'], block.get('color', BLUE), block_key)
+            elif block['type'] == 'chart':
+                add_simple_chart(slide, y_pos, block['data'], block.get('chart_type', 'bar'), block_key)
+            y_pos += block_height(block)
+
+@instrumentation.traced
+def add_stat_row(slide, y_pos, stats, key=None):
     """Add a row of statistics with modern design"""
     num_stats = len(stats)
     stat_width = Inches(2.6)
@@ -196,42 +340,46 @@ def add_stat_row(slide, y_pos, stats):
             MSO_SHAPE.ROUNDED_RECTANGLE, x_pos, y_pos, stat_width, Inches(1.4)
         )
         container.fill.solid()
-        container.fill.fore_color.rgb = GRAY_50
+        set_color(container.fill.fore_color, GRAY_50)
         container.line.fill.background()
+        name_shape(container, key, f"stat{i}/container")
 
         # Accent line
         accent = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE, x_pos, y_pos, stat_width, Inches(0.08)
         )
         accent.fill.solid()
-        accent.fill.fore_color.rgb = color
+        set_color(accent.fill.fore_color, color)
         accent.line.fill.background()
+        name_shape(accent, key, f"stat{i}/accent")
 
         # Value
         val_box = slide.shapes.add_textbox(x_pos, y_pos + Inches(0.3), stat_width, Inches(0.5))
+        name_shape(val_box, key, f"stat{i}/value")
         tf = val_box.text_frame
         tf.text = value
         p = tf.paragraphs[0]
         p.font.size = Pt(40)
         p.font.bold = True
-        p.font.color.rgb = NAVY
-        p.font.name = "Helvetica Neue"
+        set_color(p.font.color, NAVY)
         p.alignment = PP_ALIGN.CENTER
 
         # Label
         lbl_box = slide.shapes.add_textbox(x_pos + Inches(0.1), y_pos + Inches(0.85), stat_width - Inches(0.2), Inches(0.4))
+        name_shape(lbl_box, key, f"stat{i}/label")
         tf_lbl = lbl_box.text_frame
         tf_lbl.text = label
         tf_lbl.word_wrap = True
         p_lbl = tf_lbl.paragraphs[0]
         p_lbl.font.size = Pt(12)
-        p_lbl.font.color.rgb = SLATE
-        p_lbl.font.name = "Helvetica Neue"
+        set_color(p_lbl.font.color, SLATE)
         p_lbl.alignment = PP_ALIGN.CENTER
 
-def add_text_block(slide, y_pos, texts):
+@instrumentation.traced
+def add_text_block(slide, y_pos, texts, key=None):
     """Add clean text block with bullets"""
-    text_box = slide.shapes.add_textbox(Inches(1), y_pos, Inches(8), Inches(0.3) * len(texts))
+    text_box = slide.shapes.add_textbox(Inches(1), y_pos, TEXT_BLOCK_WIDTH, text_block_height(texts))
+    name_shape(text_box, key, 'text')
     tf = text_box.text_frame
     tf.word_wrap = True
 
@@ -241,70 +389,130 @@ def add_text_block(slide, y_pos, texts):
         p = tf.paragraphs[i]
         p.text = text
         p.font.size = Pt(14)
-        p.font.color.rgb = GRAY_800
-        p.font.name = "Helvetica Neue"
         p.space_before = Pt(6)
         p.space_after = Pt(6)
         p.level = 0
 
-def add_highlight_box(slide, y_pos, text, color):
+@instrumentation.traced
+def add_highlight_box(slide, y_pos, text, color, key=None):
     """Add highlighted insight box"""
     # Box
     box = slide.shapes.add_shape(
         MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1), y_pos, Inches(8), Inches(1)
     )
     box.fill.solid()
-    box.fill.fore_color.rgb = color
+    set_color(box.fill.fore_color, color)
     box.line.fill.background()
+    name_shape(box, key, 'box')
 
     # Text
     text_box = slide.shapes.add_textbox(Inches(1.3), y_pos + Inches(0.15), Inches(7.4), Inches(0.7))
+    name_shape(text_box, key, 'text')
     tf = text_box.text_frame
     tf.text = text
     tf.word_wrap = True
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
     p = tf.paragraphs[0]
     p.font.size = Pt(18)
-    p.font.color.rgb = WHITE
-    p.font.name = "Helvetica Neue"
+    set_color(p.font.color, WHITE)
     p.font.bold = True
 
-def add_bar_chart_slide(prs, title, data, subtitle=None):
-    """Add horizontal bar chart slide"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    # White background
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = WHITE
-    bg.line.fill.background()
-
-    # Header
-    header_line = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(0.6), Inches(0.7), Inches(0.08), Inches(0.4)
-    )
-    header_line.fill.solid()
-    header_line.fill.fore_color.rgb = EMERALD
-    header_line.line.fill.background()
-
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.85), Inches(0.65), Inches(8.5), Inches(0.5))
-    tf = title_box.text_frame
-    tf.text = title
-    p = tf.paragraphs[0]
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = NAVY
-    p.font.name = "Helvetica Neue"
+def value_color(value):
+    """Threshold colour for a percentage: ROSE from 70, AMBER from 50, EMERALD below"""
+    if value >= 70:
+        return ROSE
+    elif value >= 50:
+        return AMBER
+    return EMERALD
+
+CHART_TYPES = {
+    'bar': 'BAR_CLUSTERED',
+    'column': 'COLUMN_CLUSTERED',
+    'line': 'LINE_MARKERS',
+    'pie': 'PIE',
+    'doughnut': 'DOUGHNUT',
+}
+
+def drop_chart_workbook(chart):
+    """Remove the embedded .xlsx behind a chart; it still renders from its cached values but can't be edited as data"""
+    external_data = chart._chartSpace.externalData
+    if external_data is not None:
+        rId = external_data.rId
+        chart._chartSpace.remove(external_data)
+        chart.part.drop_rel(rId)
+
+@instrumentation.traced
+def add_native_chart(slide, x, y, width, height, data, chart_type='bar', max_value=None, embed_data=False, key=None):
+    """Add (label, value) data as a single native chart graphicFrame with threshold-coloured points"""
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION
+
+    if not isinstance(chart_type, XL_CHART_TYPE):
+        chart_type = getattr(XL_CHART_TYPE, CHART_TYPES.get(chart_type, chart_type).upper())
+
+    chart_data = CategoryChartData(number_format='0"%"')
+    chart_data.categories = [label for label, _ in data]
+    chart_data.add_series('Value', [value for _, value in data])
+    graphic_frame = slide.shapes.add_chart(chart_type, x, y, width, height, chart_data)
+    name_shape(graphic_frame, key, 'chart')
+    chart = graphic_frame.chart
+    if not embed_data:
+        drop_chart_workbook(chart)
+
+    chart.has_legend = False
+    chart.font.size = Pt(13)
+    set_color(chart.font.color, GRAY_800)
+    plot = chart.plots[0]
+    plot.has_data_labels = True
+    labels = plot.data_labels
+    labels.font.size = Pt(16)
+    labels.font.bold = True
+    set_color(labels.font.color, NAVY)
+    labels.number_format = '0"%"'
+    labels.number_format_is_linked = False
+
+    if chart_type in (XL_CHART_TYPE.PIE, XL_CHART_TYPE.DOUGHNUT, XL_CHART_TYPE.LINE_MARKERS):
+        if chart_type != XL_CHART_TYPE.LINE_MARKERS:
+            chart.has_legend = True
+        return chart
+
+    # Bar/column: threshold colours per point, no gridlines or value axis, widest bars first
+    plot.gap_width = 70
+    labels.position = XL_LABEL_POSITION.OUTSIDE_END
+    series = plot.series[0]
+    for i, (_, value) in enumerate(data):
+        point = series.points[i]
+        point.format.fill.solid()
+        set_color(point.format.fill.fore_color, value_color(value))
+    value_axis = chart.value_axis
+    value_axis.visible = False
+    value_axis.has_major_gridlines = False
+    value_axis.minimum_scale = 0
+    value_axis.maximum_scale = max_value or max(value for _, value in data)
+    category_axis = chart.category_axis
+    category_axis.format.line.fill.background()
+    category_axis.has_major_gridlines = False
+    if chart_type == XL_CHART_TYPE.BAR_CLUSTERED:
+        category_axis.reverse_order = True
+    return chart
+
+@instrumentation.traced
+def add_simple_chart(slide, y_pos, data, chart_type='bar', key=None):
+    """Add a native chart content block"""
+    add_native_chart(slide, Inches(1), y_pos, Inches(8), Inches(3.2), data, chart_type, key=key)
+
+@instrumentation.traced
+def add_bar_chart_slide(prs, title, data, subtitle=None, native=False, key=None):
+    """Add horizontal bar chart slide; native=True draws one chart object instead of shapes per bar"""
+    slide = add_titled_slide(prs, title, key)
 
     if subtitle:
-        sub_box = slide.shapes.add_textbox(Inches(0.85), Inches(1.1), Inches(8.5), Inches(0.3))
+        sub_box = name_shape(slide.shapes.add_textbox(Inches(0.85), Inches(1.1), Inches(8.5), Inches(0.3)), key, 'subtitle')
         tf_sub = sub_box.text_frame
         tf_sub.text = subtitle
         p_sub = tf_sub.paragraphs[0]
         p_sub.font.size = Pt(14)
-        p_sub.font.color.rgb = SLATE
-        p_sub.font.name = "Helvetica Neue"
+        set_color(p_sub.font.color, SLATE)
 
     # Custom bar visualization
     start_y = Inches(2.2) if subtitle else Inches(1.8)
@@ -314,27 +522,32 @@ def add_bar_chart_slide(prs, title, data, subtitle=None):
 
     max_value = max([val for _, val in data])
 
+    if native:
+        # Label column + bar area + percentage labels, sized to match the shape-drawn layout
+        height = len(data) * (bar_height + bar_spacing)
+        add_native_chart(slide, Inches(0.7), start_y, Inches(8.6), height, data, 'bar', max_value * 1.1, key=key)
+        return
+
     for i, (label, value) in enumerate(data):
         y = start_y + i * (bar_height + bar_spacing)
 
         # Label
-        label_box = slide.shapes.add_textbox(Inches(0.8), y, Inches(2.5), bar_height)
+        label_box = name_shape(slide.shapes.add_textbox(Inches(0.8), y, Inches(2.5), bar_height), key, f"bar{i}/label")
         tf_label = label_box.text_frame
         tf_label.text = label
         tf_label.word_wrap = True
         tf_label.vertical_anchor = MSO_ANCHOR.MIDDLE
         p_label = tf_label.paragraphs[0]
         p_label.font.size = Pt(13)
-        p_label.font.color.rgb = GRAY_800
-        p_label.font.name = "Helvetica Neue"
 
         # Background bar
         bg_bar = slide.shapes.add_shape(
             MSO_SHAPE.ROUNDED_RECTANGLE, Inches(3.5), y + Inches(0.1), max_bar_width, bar_height - Inches(0.2)
         )
         bg_bar.fill.solid()
-        bg_bar.fill.fore_color.rgb = GRAY_100
+        set_color(bg_bar.fill.fore_color, GRAY_100)
         bg_bar.line.fill.background()
+        name_shape(bg_bar, key, f"bar{i}/track")
 
         # Value bar
         bar_width = (value / max_value) * max_bar_width
@@ -344,52 +557,24 @@ def add_bar_chart_slide(prs, title, data, subtitle=None):
         val_bar.fill.solid()
 
         # Color gradient based on value
-        if value >= 70:
-            val_bar.fill.fore_color.rgb = ROSE
-        elif value >= 50:
-            val_bar.fill.fore_color.rgb = AMBER
-        else:
-            val_bar.fill.fore_color.rgb = EMERALD
+        set_color(val_bar.fill.fore_color, value_color(value))
         val_bar.line.fill.background()
+        name_shape(val_bar, key, f"bar{i}/fill")
 
         # Percentage text
-        pct_box = slide.shapes.add_textbox(bar_width + Inches(3.6), y, Inches(0.6), bar_height)
+        pct_box = name_shape(slide.shapes.add_textbox(bar_width + Inches(3.6), y, Inches(0.6), bar_height), key, f"bar{i}/value")
         tf_pct = pct_box.text_frame
         tf_pct.text = f"{value}%"
         tf_pct.vertical_anchor = MSO_ANCHOR.MIDDLE
         p_pct = tf_pct.paragraphs[0]
         p_pct.font.size = Pt(16)
         p_pct.font.bold = True
-        p_pct.font.color.rgb = NAVY
-        p_pct.font.name = "Helvetica Neue"
+        set_color(p_pct.font.color, NAVY)
 
-def add_insight_grid(prs, title, insights):
+@instrumentation.traced
+def add_insight_grid(prs, title, insights, key=None):
     """Add grid of insights"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    # White background
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = WHITE
-    bg.line.fill.background()
-
-    # Header
-    header_line = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(0.6), Inches(0.7), Inches(0.08), Inches(0.4)
-    )
-    header_line.fill.solid()
-    header_line.fill.fore_color.rgb = EMERALD
-    header_line.line.fill.background()
-
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.85), Inches(0.65), Inches(8.5), Inches(0.5))
-    tf = title_box.text_frame
-    tf.text = title
-    p = tf.paragraphs[0]
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = NAVY
-    p.font.name = "Helvetica Neue"
+    slide = add_titled_slide(prs, title, key)
 
     # Grid of insights (2x2)
     box_width = Inches(4.3)
@@ -412,76 +597,56 @@ def add_insight_grid(prs, title, insights):
             MSO_SHAPE.ROUNDED_RECTANGLE, x, y, box_width, box_height
         )
         container.fill.solid()
-        container.fill.fore_color.rgb = GRAY_50
-        container.line.color.rgb = colors[i]
+        set_color(container.fill.fore_color, GRAY_50)
+        set_color(container.line.color, colors[i])
         container.line.width = Pt(3)
+        name_shape(container, key, f"insight{i}/container")
 
         # Icon/Number
         icon_circle = slide.shapes.add_shape(
             MSO_SHAPE.OVAL, x + Inches(0.25), y + Inches(0.25), Inches(0.6), Inches(0.6)
         )
         icon_circle.fill.solid()
-        icon_circle.fill.fore_color.rgb = colors[i]
+        set_color(icon_circle.fill.fore_color, colors[i])
         icon_circle.line.fill.background()
+        name_shape(icon_circle, key, f"insight{i}/icon")
 
         icon_text = slide.shapes.add_textbox(x + Inches(0.25), y + Inches(0.25), Inches(0.6), Inches(0.6))
+        name_shape(icon_text, key, f"insight{i}/icon-text")
         tf_icon = icon_text.text_frame
         tf_icon.text = icon
         tf_icon.vertical_anchor = MSO_ANCHOR.MIDDLE
         p_icon = tf_icon.paragraphs[0]
         p_icon.font.size = Pt(20)
         p_icon.font.bold = True
-        p_icon.font.color.rgb = WHITE
+        set_color(p_icon.font.color, WHITE)
         p_icon.alignment = PP_ALIGN.CENTER
 
         # Heading
         heading_box = slide.shapes.add_textbox(x + Inches(0.25), y + Inches(1), box_width - Inches(0.5), Inches(0.4))
+        name_shape(heading_box, key, f"insight{i}/heading")
         tf_heading = heading_box.text_frame
         tf_heading.text = heading
         tf_heading.word_wrap = True
         p_heading = tf_heading.paragraphs[0]
         p_heading.font.size = Pt(16)
         p_heading.font.bold = True
-        p_heading.font.color.rgb = NAVY
-        p_heading.font.name = "Helvetica Neue"
+        set_color(p_heading.font.color, NAVY)
 
         # Description
         desc_box = slide.shapes.add_textbox(x + Inches(0.25), y + Inches(1.45), box_width - Inches(0.5), Inches(0.8))
+        name_shape(desc_box, key, f"insight{i}/description")
         tf_desc = desc_box.text_frame
         tf_desc.text = description
         tf_desc.word_wrap = True
         p_desc = tf_desc.paragraphs[0]
         p_desc.font.size = Pt(12)
-        p_desc.font.color.rgb = SLATE
-        p_desc.font.name = "Helvetica Neue"
+        set_color(p_desc.font.color, SLATE)
 
-def add_roadmap_slide_modern(prs, title, phases):
+@instrumentation.traced
+def add_roadmap_slide_modern(prs, title, phases, key=None):
     """Modern roadmap with timeline"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    # White background
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = WHITE
-    bg.line.fill.background()
-
-    # Header
-    header_line = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(0.6), Inches(0.7), Inches(0.08), Inches(0.4)
-    )
-    header_line.fill.solid()
-    header_line.fill.fore_color.rgb = EMERALD
-    header_line.fill.background()
-
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.85), Inches(0.65), Inches(8.5), Inches(0.5))
-    tf = title_box.text_frame
-    tf.text = title
-    p = tf.paragraphs[0]
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = NAVY
-    p.font.name = "Helvetica Neue"
+    slide = add_titled_slide(prs, title, key)
 
     # Timeline
     timeline_y = Inches(2.5)
@@ -490,8 +655,9 @@ def add_roadmap_slide_modern(prs, title, phases):
 
     # Timeline line
     line = slide.shapes.add_connector(1, timeline_start_x, timeline_y, timeline_end_x, timeline_y)
-    line.line.color.rgb = GRAY_100
+    set_color(line.line.color, GRAY_100)
     line.line.width = Pt(3)
+    name_shape(line, key, 'timeline')
 
     # Phases
     num_phases = len(phases)
@@ -506,24 +672,26 @@ def add_roadmap_slide_modern(prs, title, phases):
             MSO_SHAPE.OVAL, x - Inches(0.2), timeline_y - Inches(0.2), Inches(0.4), Inches(0.4)
         )
         dot.fill.solid()
-        dot.fill.fore_color.rgb = colors[i % len(colors)]
-        dot.line.color.rgb = WHITE
+        set_color(dot.fill.fore_color, colors[i % len(colors)])
+        set_color(dot.line.color, WHITE)
         dot.line.width = Pt(3)
+        name_shape(dot, key, f"phase{i}/dot")
 
         # Phase name
         name_box = slide.shapes.add_textbox(x - Inches(0.7), timeline_y - Inches(0.8), Inches(1.4), Inches(0.4))
+        name_shape(name_box, key, f"phase{i}/name")
         tf_name = name_box.text_frame
         tf_name.text = phase_name
         tf_name.word_wrap = True
         p_name = tf_name.paragraphs[0]
         p_name.font.size = Pt(13)
         p_name.font.bold = True
-        p_name.font.color.rgb = colors[i % len(colors)]
-        p_name.font.name = "Helvetica Neue"
+        set_color(p_name.font.color, colors[i % len(colors)])
         p_name.alignment = PP_ALIGN.CENTER
 
         # Items
         items_box = slide.shapes.add_textbox(x - Inches(0.8), timeline_y + Inches(0.4), Inches(1.6), Inches(3))
+        name_shape(items_box, key, f"phase{i}/items")
         tf_items = items_box.text_frame
         tf_items.word_wrap = True
 
@@ -533,275 +701,394 @@ def add_roadmap_slide_modern(prs, title, phases):
             p_item = tf_items.paragraphs[j]
             p_item.text = f"• {item}"
             p_item.font.size = Pt(10)
-            p_item.font.color.rgb = GRAY_800
-            p_item.font.name = "Helvetica Neue"
             p_item.space_before = Pt(4)
 
-# Create presentation
-prs = Presentation()
-prs.slide_width = Inches(10)
-prs.slide_height = Inches(7.5)
-
-# SLIDE 1: Title
-add_modern_title_slide(prs)
-
-# SLIDE 2: Executive Summary
-add_content_slide_modern(
-    prs,
-    "Executive Summary",
-    [
-        {
-            'type': 'stat_row',
-            'stats': [
-                ("25", "Participants Interviewed", EMERALD),
-                ("21", "Active Policyholders", BLUE),
-                ("86%", "Adoption Rate", AMBER)
-            ]
-        },
-        {
-            'type': 'text',
-            'content': [
-                "Comprehensive qualitative study examining life insurance customer experience and engagement",
-                "Mixed-method approach: Primary user interviews + Secondary market research",
-                "Key focus: Policy understanding, provider relationships, post-purchase satisfaction",
-                "Critical insight: Significant gaps in customer education and ongoing support"
-            ]
-        },
-        {
-            'type': 'highlight',
-            'text': "72% of policyholders cannot confidently explain their own coverage",
-            'color': ROSE
-        }
-    ]
-)
-
-# SLIDE 3: Research Approach
-add_section_divider(prs, 1, "Research Methodology", "Understanding the Customer Journey")
-
-add_content_slide_modern(
-    prs,
-    "Research Design",
-    [
-        {
-            'type': 'stat_row',
-            'stats': [
-                ("7", "Primary Interviews", EMERALD),
-                ("18", "Secondary Profiles", BLUE),
-                ("4", "Study Weeks", AMBER)
-            ]
-        },
-        {
-            'type': 'text',
-            'content': [
-                "Primary Research: Deep-dive interviews with 7 current policyholders",
-                "   → Ages 25-54, diverse employment sectors (education, healthcare, tech)",
-                "   → Mix of individual and employer-sponsored coverage",
-                "",
-                "Secondary Research: Market data and industry benchmarking (18 profiles)",
-                "   → Competitive analysis of provider engagement models",
-                "   → Customer satisfaction trends and pain point analysis",
-                "",
-                "Interview Focus Areas:",
-                "   → Purchase journey and decision-making process",
-                "   → Policy comprehension and confidence levels",
-                "   → Provider interaction frequency and quality",
-                "   → Unmet needs and improvement opportunities"
-            ]
-        }
-    ]
-)
-
-# SLIDE 4: Demographics
-add_content_slide_modern(
-    prs,
-    "Participant Profile",
-    [
-        {
-            'type': 'stat_row',
-            'stats': [
-                ("38", "Average Age", EMERALD),
-                ("43%", "Female", BLUE),
-                ("67%", "Employer Plans", AMBER)
-            ]
-        },
-        {
-            'type': 'text',
-            'content': [
-                "Age Range: 25-54 years (Young professionals to mid-career)",
-                "Gender: 43% Female, 57% Male",
-                "Relationship Status: 58% Married, 28% Single, 14% Engaged/Other",
-                "",
-                "Coverage Details:",
-                "   → 67% Employer-provided (standard benefit packages)",
-                "   → 24% Individual policies (self-purchased)",
-                "   → 9% Mixed coverage (employer + personal)",
-                "",
-                "Policy Types: Majority term life (30-year), limited awareness of whole/universal options"
-            ]
-        }
-    ]
-)
-
-# SLIDE 5: Key Findings Section
-add_section_divider(prs, 2, "Key Findings", "Insights from Primary & Secondary Research")
-
-# SLIDE 6: Policy Awareness Gap
-add_bar_chart_slide(
-    prs,
-    "Critical Gap: Policy Comprehension",
-    [
-        ("Cannot explain coverage confidently", 72),
-        ("Unaware of conversion options", 89),
-        ("Don't know policy details", 68),
-        ("Confused by insurance terms", 82),
-        ("Never reviewed policy documents", 64)
-    ],
-    "Percentage of respondents struggling with policy understanding"
-)
-
-# SLIDE 7: Provider Engagement
-add_bar_chart_slide(
-    prs,
-    "Provider Engagement Deficit",
-    [
-        ("No regular contact from provider", 91),
-        ("Never heard from agent post-purchase", 68),
-        ("Only receive annual premium notices", 78),
-        ("No proactive support services", 84),
-        ("Difficult to reach when needed", 59)
-    ],
-    "Customer interaction with insurance providers"
-)
-
-# SLIDE 8: Pain Points Grid
-add_insight_grid(
-    prs,
-    "Customer Pain Points",
-    [
-        ("1", "Trust & Reliability", "64% concerned about claim payout timing and reliability. Fear of delays during critical life events."),
-        ("2", "Cost Barriers", "71% cite affordability as primary obstacle to adequate coverage. Unclear value proposition."),
-        ("3", "Complexity", "82% find policy terms confusing. Legal jargon and unclear benefit structures create frustration."),
-        ("4", "Transparency", "76% want clearer communication about changes, costs, and coverage limitations.")
-    ]
-)
-
-# SLIDE 9: Opportunity Areas
-add_content_slide_modern(
-    prs,
-    "Identified Opportunities",
-    [
-        {
-            'type': 'stat_row',
-            'stats': [
-                ("94%", "Want Education", EMERALD),
-                ("87%", "Want Digital Tools", BLUE),
-                ("91%", "Want Regular Check-ins", AMBER)
-            ]
-        },
-        {
-            'type': 'text',
-            'content': [
-                "Education & Enablement:",
-                "   → 94% interested in policy optimization tips and benefit education",
-                "   → Desire for plain-language guides and interactive calculators",
-                "",
-                "Digital Experience:",
-                "   → 87% prefer self-service portals for policy management",
-                "   → Interest in mobile apps for quick access to coverage details",
-                "",
-                "Proactive Support:",
-                "   → 91% want quarterly touchpoints from providers",
-                "   → 78% need guidance during life events (marriage, children, home purchase)",
-                "",
-                "Pricing Transparency:",
-                "   → 83% would consider coverage increases with clearer cost breakdowns"
-            ]
-        }
-    ]
-)
-
-# SLIDE 10: Recommendations Section
-add_section_divider(prs, 3, "Strategic Recommendations", "Actionable Initiatives to Close Gaps")
-
-# SLIDE 11: Recommendations
-add_insight_grid(
-    prs,
-    "Core Recommendations",
-    [
-        ("1", "Digital Education Platform", "Launch interactive hub with policy explainers, benefit calculators, and personalized recommendations. Plain language throughout."),
-        ("2", "Proactive Engagement Model", "Implement quarterly touchpoints via email/app. Life-stage guidance, coverage reviews, and optimization suggestions."),
-        ("3", "Simplified Communications", "Redesign all materials using clear language, visual aids, and step-by-step guides. Eliminate jargon."),
-        ("4", "Trust-Building Program", "Share claim success stories, transparent timelines, and beneficiary support resources. Build confidence.")
-    ]
-)
-
-# SLIDE 12: Implementation Roadmap
-add_roadmap_slide_modern(
-    prs,
-    "Implementation Roadmap",
-    [
-        ("Q1 2025\nFoundation", [
-            "Audit communications",
-            "Design education content",
-            "Build platform MVP"
-        ]),
-        ("Q2 2025\nLaunch", [
-            "Launch education hub",
-            "Begin outreach program",
-            "Train support teams"
-        ]),
-        ("Q3 2025\nOptimize", [
-            "Gather feedback",
-            "Refine engagement",
-            "Measure impact"
-        ]),
-        ("Q4 2025\nScale", [
-            "Full deployment",
-            "Advanced features",
-            "Market expansion"
-        ])
-    ]
-)
-
-# SLIDE 13: Success Metrics
-add_content_slide_modern(
-    prs,
-    "Success Metrics & Next Steps",
-    [
-        {
-            'type': 'stat_row',
-            'stats': [
-                ("75%", "Target Comprehension", EMERALD),
-                ("90%", "Satisfaction Goal", BLUE),
-                ("35%", "Retention Lift", AMBER)
-            ]
-        },
-        {
-            'type': 'text',
-            'content': [
-                "Key Performance Indicators:",
-                "   → Increase policy comprehension from 18% to 75% by Q4 2025",
-                "   → Achieve 90% customer satisfaction through proactive engagement",
-                "   → Reduce support inquiries by 40% via self-service tools",
-                "   → Improve retention rates by 35% through education initiatives",
-                "",
-                "Immediate Next Steps:",
-                "   → Assemble cross-functional implementation team (Week 1)",
-                "   → Begin content audit and design sprint (Week 2-4)",
-                "   → Develop platform MVP with key features (Q1 2025)",
-                "   → Pilot with 100 customers before full rollout (Q2 2025)"
-            ]
-        }
-    ]
-)
-
-# Save
-output_file = '/home/user/Portfolio/PPM_Survey_Presentation.pptx'
-prs.save(output_file)
-
-print("✓ Investor-grade presentation created successfully")
-print(f"✓ File: {output_file}")
-print(f"✓ Total slides: {len(prs.slides)}")
-print(f"✓ Design: Modern minimal with professional aesthetics")
-print(f"✓ Sample size: 25 participants (7 primary + 18 secondary)")
-print(f"✓ Layout: Smart content distribution with visual hierarchy")
+# DECK SPEC - one entry per slide, blocks use the same dicts add_content_slide_modern consumes
+DECK_SPEC = [
+    # SLIDE 1: Title
+    {'type': 'title', 'key': 'title'},
+
+    # SLIDE 2: Executive Summary
+    {
+        'type': 'content',
+        'title': "Executive Summary",
+        'blocks': [
+            {
+                'type': 'stat_row',
+                'stats': [
+                    ("25", "Participants Interviewed", EMERALD),
+                    ("21", "Active Policyholders", BLUE),
+                    ("86%", "Adoption Rate", AMBER)
+                ]
+            },
+            {
+                'type': 'text',
+                'content': [
+                    "Comprehensive qualitative study examining life insurance customer experience and engagement",
+                    "Mixed-method approach: Primary user interviews + Secondary market research",
+                    "Key focus: Policy understanding, provider relationships, post-purchase satisfaction",
+                    "Critical insight: Significant gaps in customer education and ongoing support"
+                ]
+            },
+            {
+                'type': 'highlight',
+                'text': "72% of policyholders cannot confidently explain their own coverage",
+                'survey_text': "{policy_type_unsure_pct:.0f}% of respondents are unsure which type of policy they hold",
+                'color': ROSE
+            }
+        ]
+    },
+
+    # SLIDE 3: Research Approach
+    {'type': 'section', 'number': 1, 'title': "Research Methodology", 'subtitle': "Understanding the Customer Journey"},
+
+    {
+        'type': 'content',
+        'title': "Research Design",
+        'blocks': [
+            {
+                'type': 'stat_row',
+                'stats': [
+                    ("7", "Primary Interviews", EMERALD),
+                    ("18", "Secondary Profiles", BLUE),
+                    ("4", "Study Weeks", AMBER)
+                ]
+            },
+            {
+                'type': 'text',
+                'content': [
+                    "Primary Research: Deep-dive interviews with 7 current policyholders",
+                    "   → Ages 25-54, diverse employment sectors (education, healthcare, tech)",
+                    "   → Mix of individual and employer-sponsored coverage",
+                    "",
+                    "Secondary Research: Market data and industry benchmarking (18 profiles)",
+                    "   → Competitive analysis of provider engagement models",
+                    "   → Customer satisfaction trends and pain point analysis",
+                    "",
+                    "Interview Focus Areas:",
+                    "   → Purchase journey and decision-making process",
+                    "   → Policy comprehension and confidence levels",
+                    "   → Provider interaction frequency and quality",
+                    "   → Unmet needs and improvement opportunities"
+                ],
+                # survey_data.apply_survey_stats fills these from the workbook's stats instead
+                'survey_content': [
+                    "Primary Research: Deep-dive interviews with {respondents} participants "
+                    "({policyholders} policyholders)",
+                    "   → Ages 25-54, diverse employment sectors (education, healthcare, tech)",
+                    "   → Mix of individual and employer-sponsored coverage",
+                    "",
+                    "Secondary Research: Market data and industry benchmarking (18 profiles)",
+                    "   → Competitive analysis of provider engagement models",
+                    "   → Customer satisfaction trends and pain point analysis",
+                    "",
+                    "Interview Focus Areas:",
+                    "   → Purchase journey and decision-making process",
+                    "   → Policy comprehension and confidence levels",
+                    "   → Provider interaction frequency and quality",
+                    "   → Unmet needs and improvement opportunities"
+                ]
+            }
+        ]
+    },
+
+    # SLIDE 4: Demographics
+    {
+        'type': 'content',
+        'title': "Participant Profile",
+        'blocks': [
+            {
+                'type': 'stat_row',
+                'stats': [
+                    ("38", "Average Age", EMERALD),
+                    ("43%", "Female", BLUE),
+                    ("67%", "Employer Plans", AMBER)
+                ]
+            },
+            {
+                'type': 'text',
+                'content': [
+                    "Age Range: 25-54 years (Young professionals to mid-career)",
+                    "Gender: 43% Female, 57% Male",
+                    "Relationship Status: 58% Married, 28% Single, 14% Engaged/Other",
+                    "",
+                    "Coverage Details:",
+                    "   → 67% Employer-provided (standard benefit packages)",
+                    "   → 24% Individual policies (self-purchased)",
+                    "   → 9% Mixed coverage (employer + personal)",
+                    "",
+                    "Policy Types: Majority term life (30-year), limited awareness of whole/universal options"
+                ],
+                'survey_content': [
+                    "Age Range: 25-54 years (Young professionals to mid-career)",
+                    "Gender: {female_pct:.0f}% Female, {male_pct:.0f}% Male",
+                    "Relationship Status: {married_pct:.0f}% Married, {single_pct:.0f}% Single, "
+                    "{other_relationship_pct:.0f}% Engaged/Other",
+                    "",
+                    "Coverage Details (policyholders):",
+                    "   → {employer_only_pct:.0f}% Employer-provided only (standard benefit packages)",
+                    "   → {self_only_pct:.0f}% Individual policies only (self-purchased)",
+                    "   → {mixed_plan_pct:.0f}% Mixed coverage (employer + personal)",
+                    "",
+                    "Policy Types: {term_policy_pct:.0f}% name term life, "
+                    "{policy_type_unsure_pct:.0f}% are unsure which type they hold"
+                ]
+            }
+        ]
+    },
+
+    # SLIDE 5: Key Findings Section
+    {'type': 'section', 'number': 2, 'title': "Key Findings", 'subtitle': "Insights from Primary & Secondary Research"},
+
+    # SLIDE 6: Policy Awareness Gap
+    {
+        'type': 'bar_chart',
+        'title': "Critical Gap: Policy Comprehension",
+        'data': [
+            ("Cannot explain coverage confidently", 72),
+            ("Unaware of conversion options", 89),
+            ("Don't know policy details", 68),
+            ("Confused by insurance terms", 82),
+            ("Never reviewed policy documents", 64)
+        ],
+        # With --survey only the bars the workbook measures are drawn, as (label, stats key)
+        'survey_data': [
+            ("Unsure which policy type they hold", 'policy_type_unsure_pct'),
+            ("Unaware of conversion options", 'conversion_unaware_pct'),
+        ],
+        'subtitle': "Percentage of respondents struggling with policy understanding"
+    },
+
+    # SLIDE 7: Provider Engagement
+    {
+        'type': 'bar_chart',
+        'title': "Provider Engagement Deficit",
+        'data': [
+            ("No regular contact from provider", 91),
+            ("Never heard from agent post-purchase", 68),
+            ("Only receive annual premium notices", 78),
+            ("No proactive support services", 84),
+            ("Difficult to reach when needed", 59)
+        ],
+        'survey_data': [
+            ("Never hear from their provider", 'never_contacted_pct'),
+            ("Hear from their provider once a year", 'annual_contact_pct'),
+        ],
+        'subtitle': "Customer interaction with insurance providers"
+    },
+
+    # SLIDE 8: Pain Points Grid
+    {
+        'type': 'insight_grid',
+        'title': "Customer Pain Points",
+        'insights': [
+            ("1", "Trust & Reliability", "64% concerned about claim payout timing and reliability. Fear of delays during critical life events."),
+            ("2", "Cost Barriers", "71% cite affordability as primary obstacle to adequate coverage. Unclear value proposition."),
+            ("3", "Complexity", "82% find policy terms confusing. Legal jargon and unclear benefit structures create frustration."),
+            ("4", "Transparency", "76% want clearer communication about changes, costs, and coverage limitations.")
+        ]
+    },
+
+    # SLIDE 9: Opportunity Areas
+    {
+        'type': 'content',
+        'title': "Identified Opportunities",
+        'blocks': [
+            {
+                'type': 'stat_row',
+                'stats': [
+                    ("94%", "Want Education", EMERALD),
+                    ("87%", "Want Digital Tools", BLUE),
+                    ("91%", "Want Regular Check-ins", AMBER)
+                ]
+            },
+            {
+                'type': 'text',
+                'content': [
+                    "Education & Enablement:",
+                    "   → 94% interested in policy optimization tips and benefit education",
+                    "   → Desire for plain-language guides and interactive calculators",
+                    "",
+                    "Digital Experience:",
+                    "   → 87% prefer self-service portals for policy management",
+                    "   → Interest in mobile apps for quick access to coverage details",
+                    "",
+                    "Proactive Support:",
+                    "   → 91% want quarterly touchpoints from providers",
+                    "   → 78% need guidance during life events (marriage, children, home purchase)",
+                    "",
+                    "Pricing Transparency:",
+                    "   → 83% would consider coverage increases with clearer cost breakdowns"
+                ]
+            }
+        ]
+    },
+
+    # SLIDE 10: Recommendations Section
+    {'type': 'section', 'number': 3, 'title': "Strategic Recommendations", 'subtitle': "Actionable Initiatives to Close Gaps"},
+
+    # SLIDE 11: Recommendations
+    {
+        'type': 'insight_grid',
+        'title': "Core Recommendations",
+        'insights': [
+            ("1", "Digital Education Platform", "Launch interactive hub with policy explainers, benefit calculators, and personalized recommendations. Plain language throughout."),
+            ("2", "Proactive Engagement Model", "Implement quarterly touchpoints via email/app. Life-stage guidance, coverage reviews, and optimization suggestions."),
+            ("3", "Simplified Communications", "Redesign all materials using clear language, visual aids, and step-by-step guides. Eliminate jargon."),
+            ("4", "Trust-Building Program", "Share claim success stories, transparent timelines, and beneficiary support resources. Build confidence.")
+        ]
+    },
+
+    # SLIDE 12: Implementation Roadmap
+    {
+        'type': 'roadmap',
+        'title': "Implementation Roadmap",
+        'phases': [
+            ("Q1 2025\nFoundation", [
+                "Audit communications",
+                "Design education content",
+                "Build platform MVP"
+            ]),
+            ("Q2 2025\nLaunch", [
+                "Launch education hub",
+                "Begin outreach program",
+                "Train support teams"
+            ]),
+            ("Q3 2025\nOptimize", [
+                "Gather feedback",
+                "Refine engagement",
+                "Measure impact"
+            ]),
+            ("Q4 2025\nScale", [
+                "Full deployment",
+                "Advanced features",
+                "Market expansion"
+            ])
+        ]
+    },
+
+    # SLIDE 13: Success Metrics
+    {
+        'type': 'content',
+        'title': "Success Metrics & Next Steps",
+        'blocks': [
+            {
+                'type': 'stat_row',
+                'stats': [
+                    ("75%", "Target Comprehension", EMERALD),
+                    ("90%", "Satisfaction Goal", BLUE),
+                    ("35%", "Retention Lift", AMBER)
+                ]
+            },
+            {
+                'type': 'text',
+                'content': [
+                    "Key Performance Indicators:",
+                    "   → Increase policy comprehension from 18% to 75% by Q4 2025",
+                    "   → Achieve 90% customer satisfaction through proactive engagement",
+                    "   → Reduce support inquiries by 40% via self-service tools",
+                    "   → Improve retention rates by 35% through education initiatives",
+                    "",
+                    "Immediate Next Steps:",
+                    "   → Assemble cross-functional implementation team (Week 1)",
+                    "   → Begin content audit and design sprint (Week 2-4)",
+                    "   → Develop platform MVP with key features (Q1 2025)",
+                    "   → Pilot with 100 customers before full rollout (Q2 2025)"
+                ]
+            }
+        ]
+    }
+]
+
+# Slide builders keyed by spec 'type'
+SLIDE_BUILDERS = {
+    'title': lambda prs, s, key: add_modern_title_slide(
+        prs, s.get('title', "Life Insurance"), s.get('subtitle', "Customer Experience Analysis"),
+        s.get('tagline', "Product-Market Fit Study | 2024"), key),
+    'section': lambda prs, s, key: add_section_divider(prs, s['number'], s['title'], s['subtitle'], key),
+    'content': lambda prs, s, key: add_content_slide_modern(prs, s['title'], s['blocks'], key),
+    'bar_chart': lambda prs, s, key: add_bar_chart_slide(
+        prs, s['title'], s['data'], s.get('subtitle'), s.get('native', False), key),
+    'insight_grid': lambda prs, s, key: add_insight_grid(prs, s['title'], s['insights'], key),
+    'roadmap': lambda prs, s, key: add_roadmap_slide_modern(prs, s['title'], s['phases'], key),
+}
+
+def slide_keys(spec):
+    """Stable per-slide keys: the spec's 'key', else a slug of its title (or type), de-duplicated in order"""
+    keys = []
+    seen = {}
+    for slide_spec in spec:
+        base = slide_spec.get('key') or re.sub(r'[^a-z0-9]+', '-', slide_spec.get('title', slide_spec['type']).lower()).strip('-')
+        seen[base] = seen.get(base, 0) + 1
+        keys.append(base if seen[base] == 1 else f"{base}-{seen[base]}")
+    return keys
+
+def setup_presentation(prs):
+    """Size a blank presentation to 10x7.5in, write the palette and font into its theme and prepare the content layout"""
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    deck_theme.apply_theme(prs, THEME_COLORS, THEME_FONT, THEME_FONT)
+    get_content_layout(prs)
+
+def new_presentation(template=None):
+    """An empty 10x7.5in presentation, cloned from the parsed template pool"""
+    return template_pool.presentation(template, setup_presentation)
+
+def slide_stats(prs, first):
+    """Instrumentation attributes for the slides from index `first` on: count, shapes and XML bytes"""
+    slides = list(prs.slides)[first:]
+    return {
+        'slides': len(slides),
+        'shapes': sum(len(slide.shapes) for slide in slides),
+        'xml_bytes': sum(len(etree.tostring(slide._element)) for slide in slides),
+    }
+
+def render_deck(spec=None, template=None):
+    """Build a Presentation from a deck spec (defaults to DECK_SPEC)"""
+    spec = DECK_SPEC if spec is None else spec
+    with instrumentation.span('template'):
+        prs = new_presentation(template)
+    with instrumentation.span('build', slides=len(spec)):
+        for slide_spec, key in zip(spec, slide_keys(spec)):
+            builder = SLIDE_BUILDERS.get(slide_spec['type'])
+            if builder is None:
+                raise ValueError(f"Unknown slide type: {slide_spec['type']!r}")
+            with instrumentation.span(f"slide:{key}", type=slide_spec['type']) as span:
+                first = len(prs.slides._sldIdLst) if instrumentation.enabled() else 0
+                builder(prs, slide_spec, key)
+                if instrumentation.enabled():
+                    span.set(**slide_stats(prs, first))
+    return prs
+
+def build_deck(spec=None, output=None, template=None, compression=package_writer.DEFAULT_COMPRESSION):
+    """Render a deck spec and save it to output (path or file object), or return the .pptx bytes
+
+    compression is a package_writer profile name ('fast', 'default', 'archive', 'store') or mapping.
+    """
+    with instrumentation.span('deck'):
+        return package_writer.save_package(render_deck(spec, template), output, compression)
+
+def spec_stat(spec, label):
+    """The value a deck spec's stat rows show for a label, or None"""
+    for slide_spec in DECK_SPEC if spec is None else spec:
+        for block in slide_spec.get('blocks', ()):
+            for value, stat_label, _ in block.get('stats', ()):
+                if stat_label == label:
+                    return value
+    return None
+
+def main(output_file=DEFAULT_OUTPUT, spec=None, template=None, compression=package_writer.DEFAULT_COMPRESSION):
+    with instrumentation.span('deck'):
+        prs = render_deck(spec, template)
+        package_writer.save_package(prs, output_file, compression)
+
+    print("✓ Investor-grade presentation created successfully")
+    print(f"✓ File: {output_file}")
+    print(f"✓ Total slides: {len(prs.slides)}")
+    print(f"✓ Design: Modern minimal with professional aesthetics")
+    print(f"✓ Sample size: {spec_stat(spec, 'Participants Interviewed')} participants, "
+          f"{spec_stat(spec, 'Active Policyholders')} active policyholders")
+    print(f"✓ Layout: Smart content distribution with visual hierarchy")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Patch text and fills of an already generated deck in place, addressed by stable shape names.
+
+create_investor_deck names every shape "<slide key>/<role>" (e.g.
+"executive-summary/block0/stat2/value"). Only slide parts that contain a targeted name are
+parsed and rewritten; every other part is copied through with its content unchanged.
+"""
+import os
+import re
+import tempfile
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+from lxml import etree
+
+import deck_theme
+
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+SLIDE_PART_RE = re.compile(r'^ppt/slides/slide\d+\.xml$')
+
+def _shape_for_name(root, name):
+    for c_nv_pr in root.iterfind('.//p:cNvPr', NS):
+        if c_nv_pr.get('name') == name:
+            return c_nv_pr.getparent().getparent()
+    return None
+
+def _set_text(shape, text):
+    """Replace a shape's text, keeping each paragraph's and first run's formatting"""
+    tx_body = shape.find('p:txBody', NS)
+    if tx_body is None:
+        raise ValueError("shape has no text body")
+    paragraphs = tx_body.findall('a:p', NS)
+    lines = text.split('\n')
+
+    # Reuse existing paragraphs; extra lines copy the last one's formatting
+    while len(paragraphs) < len(lines):
+        clone = etree.fromstring(etree.tostring(paragraphs[-1]))
+        paragraphs[-1].addnext(clone)
+        paragraphs.append(clone)
+    for extra in paragraphs[len(lines):]:
+        tx_body.remove(extra)
+
+    for paragraph, line in zip(paragraphs, lines):
+        runs = paragraph.findall('a:r', NS)
+        if runs:
+            for run in runs[1:]:
+                paragraph.remove(run)
+            run = runs[0]
+        else:
+            run = etree.SubElement(paragraph, '{%s}r' % NS['a'])
+            end = paragraph.find('a:endParaRPr', NS)
+            if end is not None:
+                end.addprevious(run)
+        for br in paragraph.findall('a:br', NS):
+            paragraph.remove(br)
+        t = run.find('a:t', NS)
+        if t is None:
+            t = etree.SubElement(run, '{%s}t' % NS['a'])
+        t.text = line
+
+def _set_fill(shape, color):
+    """Point a shape's solid fill at a new colour: sRGB ('10B981') or a theme slot reference ('accent2')"""
+    sp_pr = shape.find('p:spPr', NS)
+    fill = sp_pr.find('a:solidFill', NS) if sp_pr is not None else None
+    if fill is None:
+        raise ValueError("shape has no solid fill")
+    for child in list(fill):
+        fill.remove(child)
+    color = str(color).lstrip('#')
+    if color in deck_theme.REF_SLOTS:
+        etree.SubElement(fill, '{%s}schemeClr' % NS['a'], val=color)
+    else:
+        etree.SubElement(fill, '{%s}srgbClr' % NS['a'], val=color.upper())
+
+def patch_shape(shape, change):
+    """Apply one change: a string sets the text; a dict may carry 'text' and/or 'fill'"""
+    if isinstance(change, str):
+        change = {'text': change}
+    if 'text' in change:
+        _set_text(shape, change['text'])
+    if 'fill' in change:
+        _set_fill(shape, change['fill'])
+
+def patch_deck(path, updates, output=None):
+    """Rewrite only the slides holding the named shapes; returns the names that were patched"""
+    output = output or path
+    needles = {name: ('name=%s' % quoteattr(name)).encode() for name in updates}
+    patched = set()
+
+    with zipfile.ZipFile(path) as src:
+        parts = []
+        for info in src.infolist():
+            data = src.read(info.filename)
+            if SLIDE_PART_RE.match(info.filename):
+                targets = [name for name, needle in needles.items() if needle in data]
+                if targets:
+                    root = etree.fromstring(data)
+                    for name in targets:
+                        shape = _shape_for_name(root, name)
+                        if shape is not None:
+                            patch_shape(shape, updates[name])
+                            patched.add(name)
+                    data = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+            parts.append((info, data))
+
+    missing = set(updates) - patched
+    if missing:
+        raise KeyError(f"shapes not found: {', '.join(sorted(missing))}")
+
+    out_dir = os.path.dirname(os.path.abspath(output))
+    fd, tmp_path = tempfile.mkstemp(suffix='.pptx', dir=out_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f, zipfile.ZipFile(f, 'w') as dst:
+            for info, data in parts:
+                dst.writestr(info, data)
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return sorted(patched)
+
+def list_shape_names(path):
+    """All stable shape names in a deck, in slide order"""
+    names = []
+    with zipfile.ZipFile(path) as src:
+        slide_parts = sorted((n for n in src.namelist() if SLIDE_PART_RE.match(n)),
+                             key=lambda n: int(re.search(r'\d+', n).group()))
+        for part in slide_parts:
+            root = etree.fromstring(src.read(part))
+            names.extend(el.get('name') for el in root.iterfind('.//p:cNvPr', NS) if '/' in el.get('name', ''))
+    return names
@@ -0,0 +1,679 @@
+"""Office-free deck previews: SVG slides, a single HTML page and PNG contact sheets.
+
+The deck spec is rendered with the real slide builders (create_investor_deck.render_deck),
+so a preview shows exactly the shapes a .pptx would hold. The package is then never
+zipped. The slide trees are drawn directly instead:
+
+- rectangles, rounded rectangles and ovals, with solid or gradient fills and outlines;
+- connectors;
+- text boxes and placeholders, wrapped with text_layout's font metrics (the same ones
+  the deck paginates with);
+- native charts, drawn as simple bars, columns, lines or pie wedges.
+
+Colours and fonts resolve through the deck's own theme, so a rethemed deck previews in
+its new colours. Each slide becomes a flat list of items with coordinates in EMU. The
+SVG backend writes them with a viewBox in EMU. The Pillow backend scales them onto a
+contact-sheet image. A whole deck previews in a fraction of a second, mostly spent in
+the builders.
+
+Text is approximate. Line breaks come from the same metrics as the layout code, but the
+browser or Pillow draws with whatever font it has. Effects, shadows and styles other
+than fills and lines are ignored.
+"""
+import functools
+import html
+import math
+import os
+
+from lxml import etree
+
+import deck_theme
+import text_layout
+
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
+}
+
+PREVIEW_WIDTH = 960     # px per slide in SVG/HTML output
+THUMB_WIDTH = 320       # px per slide on a contact sheet
+SHEET_COLUMNS = 4
+SHEET_MARGIN = 16
+CAPTION_HEIGHT = 20
+# Previews are throwaway: zlib level 1 saves in a third of the time for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
+DEFAULT_FONT_SIZE = 18
+# Baseline offset within a line box, as a fraction of the font size (ascent of Helvetica-like faces)
+BASELINE = 0.95
+FONT_FAMILY_FALLBACK = "'Helvetica Neue', Helvetica, Arial, sans-serif"
+PICTURE_FILL = 'D1D5DB'
+ROUND_RECT_ADJ = 0.16667
+CHART_SERIES_SLOTS = ('accent1', 'accent2', 'accent3', 'accent4', 'accent5', 'accent6')
+
+def _local(element):
+    return etree.QName(element).localname
+
+def theme_colors(prs):
+    """Hex colour for every scheme slot and the slide references to it (tx1, bg1, ...)"""
+    theme = etree.fromstring(deck_theme.theme_part(prs).blob)
+    colors = {}
+    for slot_element in theme.find('a:themeElements/a:clrScheme', NS):
+        if isinstance(slot_element.tag, str):
+            colors[_local(slot_element)] = _color(slot_element, {})
+    for ref, slot in deck_theme.REF_SLOTS.items():
+        colors[ref] = colors.get(slot)
+    return colors
+
+def theme_fonts(prs):
+    """{'major': typeface, 'minor': typeface} from the deck's theme"""
+    theme = etree.fromstring(deck_theme.theme_part(prs).blob)
+    scheme = theme.find('a:themeElements/a:fontScheme', NS)
+    return {
+        'major': scheme.find('a:majorFont/a:latin', NS).get('typeface'),
+        'minor': scheme.find('a:minorFont/a:latin', NS).get('typeface'),
+    }
+
+def _color(parent, colors):
+    """Hex colour of the first colour element under parent (a fill, a style ref or a scheme slot)"""
+    if parent is None:
+        return None
+    for child in parent:
+        if not isinstance(child.tag, str):
+            continue
+        tag = _local(child)
+        if tag == 'srgbClr':
+            return child.get('val')
+        if tag == 'schemeClr':
+            return colors.get(child.get('val'))
+        if tag == 'sysClr':
+            return child.get('lastClr')
+    return None
+
+def _fill(sp_pr, style, colors):
+    """(solid hex or None, gradient dict or None) for a shape's fill, falling back to its style"""
+    if sp_pr is not None:
+        for child in sp_pr:
+            if not isinstance(child.tag, str):
+                continue
+            tag = _local(child)
+            if tag == 'noFill':
+                return None, None
+            if tag == 'solidFill':
+                return _color(child, colors), None
+            if tag == 'gradFill':
+                stops = [(int(gs.get('pos')) / 100000, _color(gs, colors))
+                         for gs in child.iterfind('a:gsLst/a:gs', NS)]
+                lin = child.find('a:lin', NS)
+                angle = int(lin.get('ang', '0')) / 60000 if lin is not None else 0
+                return None, {'stops': stops, 'angle': angle}
+            if tag in ('blipFill', 'pattFill'):
+                return PICTURE_FILL, None
+    if style is not None:
+        ref = style.find('a:fillRef', NS)
+        if ref is not None and ref.get('idx') != '0':
+            return _color(ref, colors), None
+    return None, None
+
+def _line(sp_pr, style, colors):
+    """(hex or None, width in EMU) for a shape's outline, falling back to its style"""
+    ln = sp_pr.find('a:ln', NS) if sp_pr is not None else None
+    width = int(ln.get('w', 12700)) if ln is not None else 12700
+    if ln is not None:
+        if ln.find('a:noFill', NS) is not None:
+            return None, 0
+        solid = ln.find('a:solidFill', NS)
+        if solid is not None:
+            return _color(solid, colors), width
+    if style is not None:
+        ref = style.find('a:lnRef', NS)
+        if ref is not None and ref.get('idx') != '0':
+            return _color(ref, colors), width
+    return None, 0
+
+def _run_props(props, rpr, colors, fonts):
+    """Overlay an a:rPr / a:defRPr / a:endParaRPr onto props"""
+    if rpr is None:
+        return props
+    props = dict(props)
+    if rpr.get('sz'):
+        props['size'] = int(rpr.get('sz')) / 100
+    if rpr.get('b') is not None:
+        props['bold'] = rpr.get('b') in ('1', 'true')
+    color = _color(rpr.find('a:solidFill', NS), colors)
+    if color:
+        props['color'] = color
+    latin = rpr.find('a:latin', NS)
+    if latin is not None:
+        typeface = latin.get('typeface')
+        props['font'] = {'+mj-lt': fonts['major'], '+mn-lt': fonts['minor']}.get(typeface, typeface)
+    return props
+
+def _paragraph_props(props, ppr, colors, fonts):
+    """Overlay an a:pPr / a:lvl1pPr (alignment, spacing, default run properties) onto props"""
+    if ppr is None:
+        return props
+    props = _run_props(props, ppr.find('a:defRPr', NS), colors, fonts)
+    if ppr.get('algn'):
+        props['align'] = ppr.get('algn')
+    for key, tag in (('space_before', 'a:spcBef/a:spcPts'), ('space_after', 'a:spcAft/a:spcPts')):
+        spacing = ppr.find(tag, NS)
+        if spacing is not None:
+            props[key] = int(spacing.get('val')) / 100
+    return props
+
+def _text_defaults(shape, colors, fonts):
+    """Paragraph defaults and inherited bodyPr for a shape: master text styles and layout placeholder"""
+    props = {'size': DEFAULT_FONT_SIZE, 'bold': False, 'color': colors.get('tx1'), 'align': 'l',
+             'font': fonts['minor'], 'space_before': 0, 'space_after': 0}
+    body_pr = None
+    if shape.is_placeholder:
+        master = shape.part.slide_layout.slide_master._element
+        is_title = shape.placeholder_format.type is not None and 'TITLE' in shape.placeholder_format.type.name
+        style = master.find('p:txStyles/p:titleStyle' if is_title else 'p:txStyles/p:bodyStyle', NS)
+        if style is not None:
+            props = _paragraph_props(props, style.find('a:lvl1pPr', NS), colors, fonts)
+        base = shape._base_placeholder
+        if base is not None:
+            props = _paragraph_props(props, base._element.find('p:txBody/a:lstStyle/a:lvl1pPr', NS), colors, fonts)
+            body_pr = base._element.find('p:txBody/a:bodyPr', NS)
+    return props, body_pr
+
+def _text_item(shape, x, y, w, h, colors, fonts):
+    """A 'text' item with every line positioned: (x, baseline y, text, size pt, bold, hex, align, font)"""
+    tx_body = shape._element.find('p:txBody', NS)
+    if tx_body is None:
+        return None
+    props, inherited_body = _text_defaults(shape, colors, fonts)
+    props = _paragraph_props(props, tx_body.find('a:lstStyle/a:lvl1pPr', NS), colors, fonts)
+    body = {}
+    for body_pr in (inherited_body, tx_body.find('a:bodyPr', NS)):
+        if body_pr is not None:
+            body.update(body_pr.attrib)
+    left = int(body.get('lIns', text_layout.TEXTBOX_INSET_X))
+    right = int(body.get('rIns', text_layout.TEXTBOX_INSET_X))
+    top = int(body.get('tIns', text_layout.TEXTBOX_INSET_Y))
+    bottom = int(body.get('bIns', text_layout.TEXTBOX_INSET_Y))
+    wrap = body.get('wrap', 'square') != 'none'
+    width = max(w - left - right, 1)
+
+    paragraphs = []
+    for p in tx_body.findall('a:p', NS):
+        p_props = _paragraph_props(props, p.find('a:pPr', NS), colors, fonts)
+        text, first_rpr = '', None
+        for child in p:
+            if not isinstance(child.tag, str):
+                continue
+            tag = _local(child)
+            if tag in ('r', 'fld'):
+                if first_rpr is None:
+                    first_rpr = child.find('a:rPr', NS)
+                text += child.findtext('a:t', '', NS)
+            elif tag == 'br':
+                text += '\n'
+        p_props = _run_props(p_props, first_rpr, colors, fonts)
+        lines = []
+        for segment in text.split('\n'):
+            lines.extend(text_layout.wrap_text(segment, p_props['size'], width, p_props['font'], p_props['bold'])
+                         if wrap and segment else (segment,))
+        paragraphs.append((p_props, lines))
+
+    pt = text_layout.EMU_PER_PT
+    height = sum((pp['space_before'] + len(lines) * pp['size'] * text_layout.LINE_HEIGHT + pp['space_after']) * pt
+                 for pp, lines in paragraphs)
+    anchor = body.get('anchor', 't')
+    cursor = y + top
+    if anchor == 'ctr':
+        cursor = y + top + (h - top - bottom - height) / 2
+    elif anchor == 'b':
+        cursor = y + h - bottom - height
+
+    placed = []
+    for pp, lines in paragraphs:
+        cursor += pp['space_before'] * pt
+        line_height = pp['size'] * text_layout.LINE_HEIGHT * pt
+        line_x = {'ctr': x + left + width / 2, 'r': x + left + width}.get(pp['align'], x + left)
+        for line in lines:
+            if line.strip():
+                baseline = cursor + (line_height - pp['size'] * pt) / 2 + pp['size'] * pt * BASELINE
+                placed.append((line_x, baseline, line, pp['size'], pp['bold'], pp['color'], pp['align'], pp['font']))
+            cursor += line_height
+        cursor += pp['space_after'] * pt
+    return {'kind': 'text', 'lines': placed} if placed else None
+
+def _position(shape, element):
+    """(x, y, w, h) in EMU read straight from the xfrm; python-pptx's inherited lookup only for placeholders"""
+    xfrm = element.find('p:spPr/a:xfrm', NS)
+    if xfrm is None:
+        xfrm = element.find('p:xfrm', NS)
+    if xfrm is not None:
+        off, ext = xfrm.find('a:off', NS), xfrm.find('a:ext', NS)
+        if off is not None and ext is not None:
+            return int(off.get('x')), int(off.get('y')), int(ext.get('cx')), int(ext.get('cy'))
+    if shape.left is None or shape.width is None:
+        return None
+    return shape.left, shape.top, shape.width, shape.height
+
+def _shape_items(shape, colors, fonts):
+    """Items for one shape: its geometry (if any) followed by its text"""
+    element = shape._element
+    tag = _local(element)
+    if tag == 'grpSp':
+        return [item for child in shape.shapes for item in _shape_items(child, colors, fonts)]
+    if tag == 'cxnSp':
+        sp_pr = element.find('p:spPr', NS)
+        color, width = _line(sp_pr, element.find('p:style', NS), colors)
+        if color is None:
+            return []
+        return [{'kind': 'line', 'x1': shape.begin_x, 'y1': shape.begin_y, 'x2': shape.end_x, 'y2': shape.end_y,
+                 'line': color, 'line_width': width}]
+    geometry = _position(shape, element)
+    if geometry is None:
+        return []
+    x, y, w, h = geometry
+    if tag == 'graphicFrame':
+        return _chart_items(shape, x, y, w, h, colors, fonts) if shape.has_chart else []
+    if tag == 'pic':
+        return [{'kind': 'rect', 'x': x, 'y': y, 'w': w, 'h': h, 'fill': PICTURE_FILL, 'gradient': None,
+                 'line': None, 'line_width': 0, 'radius': 0}]
+
+    items = []
+    sp_pr = element.find('p:spPr', NS)
+    style = element.find('p:style', NS)
+    fill, gradient = _fill(sp_pr, style, colors)
+    line, line_width = _line(sp_pr, style, colors)
+    if fill or gradient or line:
+        geometry = sp_pr.find('a:prstGeom', NS) if sp_pr is not None else None
+        prst = geometry.get('prst') if geometry is not None else 'rect'
+        item = {'kind': 'ellipse' if prst == 'ellipse' else 'rect', 'x': x, 'y': y, 'w': w, 'h': h,
+                'fill': fill, 'gradient': gradient, 'line': line, 'line_width': line_width, 'radius': 0}
+        if prst == 'roundRect':
+            gd = geometry.find('a:avLst/a:gd', NS)
+            adj = int(gd.get('fmla').split()[-1]) / 100000 if gd is not None else ROUND_RECT_ADJ
+            item['radius'] = adj * min(w, h)
+        items.append(item)
+    text = _text_item(shape, x, y, w, h, colors, fonts)
+    if text is not None:
+        items.append(text)
+    return items
+
+def _value_label(value, number_format):
+    return f"{value:g}%" if '%' in (number_format or '') else f"{value:g}"
+
+def _chart_items(shape, x, y, w, h, colors, fonts):
+    """A native chart as bars/columns, a polyline or pie wedges, with category and value labels"""
+    chart = shape.chart
+    space = chart._chartSpace
+    plot_element = space.find('c:chart/c:plotArea', NS)
+    plot = chart.plots[0]
+    kind = _local(plot._element)
+    categories = [str(c) for c in plot.categories]
+    series = plot.series[0]
+    values = [v or 0 for v in series.values]
+    if not values:
+        return []
+
+    ser = series._element
+    series_color = _color(ser.find('c:spPr/a:solidFill', NS), colors) or colors.get('accent1')
+    point_colors = {}
+    for dpt in ser.iterfind('c:dPt', NS):
+        point_colors[int(dpt.find('c:idx', NS).get('val'))] = _color(dpt.find('c:spPr/a:solidFill', NS), colors)
+    text_props = _run_props({'size': 10, 'bold': False, 'color': colors.get('tx1'), 'font': fonts['minor']},
+                            space.find('c:txPr/a:p/a:pPr/a:defRPr', NS), colors, fonts)
+    label_props = _run_props(text_props, plot_element.find('.//c:dLbls/c:txPr/a:p/a:pPr/a:defRPr', NS), colors, fonts)
+    number_format = plot_element.find('.//c:dLbls/c:numFmt', NS)
+    number_format = number_format.get('formatCode') if number_format is not None else None
+
+    def label(tx, ty, text, props, align):
+        return (tx, ty, text, props['size'], props['bold'], props['color'], align, props['font'])
+
+    items, lines = [], []
+    pt = text_layout.EMU_PER_PT
+    if kind in ('pieChart', 'doughnutChart'):
+        total = sum(values) or 1
+        radius = min(w, h) * 0.42
+        cx, cy = x + w / 2, y + h / 2
+        angle = 0.0
+        for i, value in enumerate(values):
+            sweep = 360 * value / total
+            color = point_colors.get(i) or colors.get(CHART_SERIES_SLOTS[i % len(CHART_SERIES_SLOTS)])
+            items.append({'kind': 'wedge', 'cx': cx, 'cy': cy, 'r': radius, 'start': angle, 'end': angle + sweep,
+                          'fill': color})
+            middle = math.radians(angle + sweep / 2)
+            lines.append(label(cx + math.sin(middle) * radius * 0.65, cy - math.cos(middle) * radius * 0.65,
+                               _value_label(value, number_format), label_props, 'ctr'))
+            angle += sweep
+        return items + [{'kind': 'text', 'lines': lines}]
+
+    scaling_max = plot_element.find('c:valAx/c:scaling/c:max', NS)
+    maximum = float(scaling_max.get('val')) if scaling_max is not None else (max(values) or 1)
+    reverse = plot_element.find('c:catAx/c:scaling/c:orientation', NS)
+    reverse = reverse is not None and reverse.get('val') == 'maxMin'
+    n = len(values)
+    horizontal = kind == 'barChart' and plot_element.find('c:barChart/c:barDir', NS).get('val') == 'bar'
+
+    if horizontal:
+        label_width = w * 0.3
+        area_x, area_w = x + label_width, w * 0.6
+        row = h / n
+        thickness = row / 1.7
+        for i, (category, value) in enumerate(zip(categories, values)):
+            slot = i if reverse else n - 1 - i
+            top = y + slot * row + (row - thickness) / 2
+            length = area_w * value / maximum
+            items.append({'kind': 'rect', 'x': area_x, 'y': top, 'w': length, 'h': thickness,
+                          'fill': point_colors.get(i) or series_color, 'gradient': None, 'line': None,
+                          'line_width': 0, 'radius': 0})
+            middle = top + thickness / 2 + text_props['size'] * pt * 0.35
+            lines.append(label(area_x - text_layout.TEXTBOX_INSET_X, middle, category, text_props, 'r'))
+            lines.append(label(area_x + length + text_layout.TEXTBOX_INSET_X, middle,
+                               _value_label(value, number_format), label_props, 'l'))
+        return items + [{'kind': 'text', 'lines': lines}]
+
+    # Columns and lines share a category axis along the bottom
+    axis_height = text_props['size'] * pt * 2
+    area_y, area_h = y + label_props['size'] * pt * 1.5, h - axis_height - label_props['size'] * pt * 1.5
+    column = w / n
+    points = []
+    for i, (category, value) in enumerate(zip(categories, values)):
+        slot = n - 1 - i if reverse else i
+        cx = x + slot * column + column / 2
+        top = area_y + area_h * (1 - value / maximum)
+        if kind == 'barChart':
+            thickness = column / 1.7
+            items.append({'kind': 'rect', 'x': cx - thickness / 2, 'y': top, 'w': thickness,
+                          'h': area_y + area_h - top, 'fill': point_colors.get(i) or series_color, 'gradient': None,
+                          'line': None, 'line_width': 0, 'radius': 0})
+        points.append((cx, top))
+        lines.append(label(cx, area_y + area_h + text_props['size'] * pt * 1.3, category, text_props, 'ctr'))
+        lines.append(label(cx, top - label_props['size'] * pt * 0.4, _value_label(value, number_format),
+                           label_props, 'ctr'))
+    if kind != 'barChart':
+        items.append({'kind': 'polyline', 'points': points, 'line': series_color, 'line_width': 3 * pt})
+        for px, py in points:
+            r = 4 * pt
+            items.append({'kind': 'ellipse', 'x': px - r, 'y': py - r, 'w': 2 * r, 'h': 2 * r, 'fill': series_color,
+                          'gradient': None, 'line': None, 'line_width': 0, 'radius': 0})
+    return items + [{'kind': 'text', 'lines': lines}]
+
+def _background(slide, colors):
+    """Hex of the slide's background, inherited from its layout and master"""
+    for owner in (slide, slide.slide_layout, slide.slide_layout.slide_master):
+        bg = owner._element.find('p:cSld/p:bg', NS)
+        if bg is None:
+            continue
+        fill = bg.find('p:bgPr/a:solidFill', NS)
+        color = _color(fill, colors) if fill is not None else _color(bg.find('p:bgRef', NS), colors)
+        if color:
+            return color
+    return colors.get('bg1') or 'FFFFFF'
+
+def slide_key(slide):
+    """The slide's stable key: the prefix of its "<key>/<role>" shape names"""
+    for shape in slide.shapes:
+        if '/' in shape.name:
+            return shape.name.split('/', 1)[0]
+    return ''
+
+def slide_items(slide, colors, fonts):
+    """Drawable items for a slide, back to front: background, master and layout artwork, then the slide's shapes"""
+    items = [{'kind': 'background', 'fill': _background(slide, colors)}]
+    for owner in (slide.slide_layout.slide_master, slide.slide_layout):
+        for shape in owner.shapes:
+            if not shape.is_placeholder:
+                items.extend(_shape_items(shape, colors, fonts))
+    for shape in slide.shapes:
+        items.extend(_shape_items(shape, colors, fonts))
+    return items
+
+def deck_items(prs):
+    """[(slide key, items)] for every slide of a Presentation"""
+    colors, fonts = theme_colors(prs), theme_fonts(prs)
+    return [(slide_key(slide), slide_items(slide, colors, fonts)) for slide in prs.slides]
+
+# SVG / HTML
+
+_SVG_ANCHORS = {'l': 'start', 'ctr': 'middle', 'r': 'end'}
+
+def _svg_paint(color):
+    return f'#{color}' if color else 'none'
+
+def slide_svg(items, size, width=PREVIEW_WIDTH, id_prefix='s'):
+    """One slide as an SVG document; coordinates stay in EMU through the viewBox"""
+    slide_width, slide_height = size
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {slide_width} {slide_height}" '
+           f'width="{width}" height="{round(width * slide_height / slide_width)}">']
+    defs = []
+    pt = text_layout.EMU_PER_PT
+    for n, item in enumerate(items):
+        kind = item['kind']
+        if kind == 'background':
+            out.append(f'<rect width="{slide_width}" height="{slide_height}" fill="#{item["fill"]}"/>')
+        elif kind in ('rect', 'ellipse'):
+            paint = _svg_paint(item['fill'])
+            if item['gradient']:
+                gradient_id = f'{id_prefix}g{n}'
+                stops = ''.join(f'<stop offset="{pos:g}" stop-color="#{color}"/>'
+                                for pos, color in item['gradient']['stops'])
+                defs.append(f'<linearGradient id="{gradient_id}" '
+                            f'gradientTransform="rotate({item["gradient"]["angle"]:g} .5 .5)">{stops}</linearGradient>')
+                paint = f'url(#{gradient_id})'
+            stroke = (f' stroke="#{item["line"]}" stroke-width="{item["line_width"]}"' if item['line'] else '')
+            x, y, w, h = item['x'], item['y'], item['w'], item['h']
+            if kind == 'ellipse':
+                out.append(f'<ellipse cx="{x + w / 2:.0f}" cy="{y + h / 2:.0f}" rx="{w / 2:.0f}" ry="{h / 2:.0f}" '
+                           f'fill="{paint}"{stroke}/>')
+            else:
+                radius = f' rx="{item["radius"]:.0f}"' if item['radius'] else ''
+                out.append(f'<rect x="{x:.0f}" y="{y:.0f}" width="{w:.0f}" height="{h:.0f}"{radius} '
+                           f'fill="{paint}"{stroke}/>')
+        elif kind == 'line':
+            out.append(f'<line x1="{item["x1"]}" y1="{item["y1"]}" x2="{item["x2"]}" y2="{item["y2"]}" '
+                       f'stroke="#{item["line"]}" stroke-width="{item["line_width"]}"/>')
+        elif kind == 'polyline':
+            points = ' '.join(f'{px:.0f},{py:.0f}' for px, py in item['points'])
+            out.append(f'<polyline points="{points}" fill="none" stroke="#{item["line"]}" '
+                       f'stroke-width="{item["line_width"]}"/>')
+        elif kind == 'wedge':
+            cx, cy, r = item['cx'], item['cy'], item['r']
+            start, end = math.radians(item['start']), math.radians(item['end'])
+            if item['end'] - item['start'] >= 359.99:
+                out.append(f'<circle cx="{cx:.0f}" cy="{cy:.0f}" r="{r:.0f}" fill="#{item["fill"]}"/>')
+                continue
+            large = 1 if item['end'] - item['start'] > 180 else 0
+            out.append(f'<path d="M{cx:.0f},{cy:.0f} L{cx + r * math.sin(start):.0f},{cy - r * math.cos(start):.0f} '
+                       f'A{r:.0f},{r:.0f} 0 {large} 1 {cx + r * math.sin(end):.0f},{cy - r * math.cos(end):.0f} Z" '
+                       f'fill="#{item["fill"]}"/>')
+        elif kind == 'text':
+            for x, baseline, text, size, bold, color, align, font in item['lines']:
+                weight = ' font-weight="bold"' if bold else ''
+                family = html.escape(f"'{font}', {FONT_FAMILY_FALLBACK}")
+                out.append(f'<text x="{x:.0f}" y="{baseline:.0f}" font-size="{size * pt:.0f}"{weight} '
+                           f'font-family="{family}" '
+                           f'fill="{_svg_paint(color)}" text-anchor="{_SVG_ANCHORS.get(align, "start")}" '
+                           f'xml:space="preserve">{html.escape(text, quote=False)}</text>')
+    if defs:
+        out.insert(1, '<defs>' + ''.join(defs) + '</defs>')
+    out.append('</svg>')
+    return '\n'.join(out)
+
+def slide_size(prs):
+    return prs.slide_width, prs.slide_height
+
+def write_svgs(prs, directory, width=PREVIEW_WIDTH, slides=None):
+    """One NN-key.svg per slide in directory; returns the paths. slides: deck_items(prs), if already built"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i, (key, items) in enumerate(slides or deck_items(prs), 1):
+        path = os.path.join(directory, f"{i:02d}-{key or 'slide'}.svg")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(slide_svg(items, slide_size(prs), width))
+        paths.append(path)
+    return paths
+
+HTML_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ margin: 24px; background: #E5E7EB; font: 13px {fonts}; color: #1F2937; }}
+figure {{ display: inline-block; margin: 0 20px 24px 0; vertical-align: top; }}
+figure svg {{ display: block; background: #FFF; box-shadow: 0 1px 4px rgba(0, 0, 0, .2); }}
+figcaption {{ margin-top: 6px; }}
+</style></head>
+<body>
+{slides}
+</body></html>
+"""
+
+def deck_html(prs, width=PREVIEW_WIDTH, title="Deck preview", slides=None):
+    """Every slide as inline SVG on one HTML page, captioned with its number and key"""
+    figures = []
+    for i, (key, items) in enumerate(slides or deck_items(prs), 1):
+        figures.append(f'<figure>{slide_svg(items, slide_size(prs), width, id_prefix=f"s{i}")}'
+                       f'<figcaption>{i} · {html.escape(key)}</figcaption></figure>')
+    return HTML_PAGE.format(title=html.escape(title), fonts=FONT_FAMILY_FALLBACK, slides='\n'.join(figures))
+
+def write_html(prs, path, width=PREVIEW_WIDTH, title="Deck preview", slides=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(deck_html(prs, width, title, slides))
+    return path
+
+# PNG (Pillow)
+
+@functools.lru_cache(maxsize=64)
+def _pil_font(size_px):
+    from PIL import ImageFont
+    return ImageFont.load_default(size=max(size_px, 1))
+
+# Characters the bundled Pillow font has no glyph for, drawn as the nearest ASCII
+_PIL_SUBSTITUTES = {'→': '>', '←': '<', '•': '-', '–': '-', '—': '-', '’': "'", '“': '"', '”': '"'}
+
+@functools.lru_cache(maxsize=16384)
+def _glyph(ch, size_px, bold):
+    """(mask, x offset, y offset from the baseline, advance) for one character, rasterized once
+
+    FreeType layout through ImageDraw.text costs milliseconds per call, while pasting a cached
+    mask costs microseconds. A deck repeats about a hundred characters at a handful of sizes.
+    """
+    from PIL import Image, ImageDraw
+    font = _pil_font(size_px)
+    stroke = 1 if bold else 0
+    ch = _PIL_SUBSTITUTES.get(ch, ch)
+    left, top, right, bottom = font.getbbox(ch, anchor='ls', stroke_width=stroke)
+    advance = font.getlength(ch) + stroke
+    if right <= left or bottom <= top:
+        return None, 0, 0, advance
+    mask = Image.new('L', (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((-left, -top), ch, fill=255, font=font, anchor='ls', stroke_width=stroke,
+                              stroke_fill=255)
+    return mask, left, top, advance
+
+def _draw_text(draw, x, baseline, text, size_px, bold, color, align='l'):
+    """Draw one line from cached glyphs (no kerning), aligned on x like the SVG text-anchor"""
+    glyphs = [_glyph(ch, size_px, bold) for ch in text]
+    x -= {'ctr': 0.5, 'r': 1.0}.get(align, 0) * sum(glyph[3] for glyph in glyphs)
+    for mask, dx, dy, advance in glyphs:
+        if mask is not None:
+            draw.bitmap((round(x + dx), round(baseline + dy)), mask, fill=color)
+        x += advance
+
+def _average(stops):
+    channels = [[int(color[i:i + 2], 16) for i in (0, 2, 4)] for _, color in stops if color]
+    return '%02X%02X%02X' % tuple(sum(c) // len(channels) for c in zip(*channels)) if channels else None
+
+def draw_slide(draw, items, size, scale, origin=(0, 0)):
+    """Draw a slide's items with Pillow at `scale` px per EMU, its top-left corner at origin"""
+    ox, oy = origin
+    pt = text_layout.EMU_PER_PT
+
+    def px(value):
+        return value * scale
+
+    for item in items:
+        kind = item['kind']
+        if kind == 'background':
+            draw.rectangle([ox, oy, ox + px(size[0]) - 1, oy + px(size[1]) - 1], fill=f"#{item['fill']}")
+        elif kind in ('rect', 'ellipse'):
+            box = [ox + px(item['x']), oy + px(item['y']),
+                   ox + px(item['x'] + item['w']), oy + px(item['y'] + item['h'])]
+            if box[2] <= box[0] or box[3] <= box[1]:
+                continue
+            color = item['fill'] or (_average(item['gradient']['stops']) if item['gradient'] else None)
+            fill = f'#{color}' if color else None
+            outline = f"#{item['line']}" if item['line'] else None
+            width = max(1, round(px(item['line_width']))) if outline else 0
+            if kind == 'ellipse':
+                draw.ellipse(box, fill=fill, outline=outline, width=width)
+            elif item['radius']:
+                draw.rounded_rectangle(box, radius=px(item['radius']), fill=fill, outline=outline, width=width)
+            else:
+                draw.rectangle(box, fill=fill, outline=outline, width=width)
+        elif kind == 'line':
+            draw.line([ox + px(item['x1']), oy + px(item['y1']), ox + px(item['x2']), oy + px(item['y2'])],
+                      fill=f"#{item['line']}", width=max(1, round(px(item['line_width']))))
+        elif kind == 'polyline':
+            draw.line([(ox + px(x), oy + px(y)) for x, y in item['points']], fill=f"#{item['line']}",
+                      width=max(1, round(px(item['line_width']))))
+        elif kind == 'wedge':
+            r = px(item['r'])
+            cx, cy = ox + px(item['cx']), oy + px(item['cy'])
+            # Pillow measures angles clockwise from 3 o'clock, the items from 12 o'clock
+            draw.pieslice([cx - r, cy - r, cx + r, cy + r], item['start'] - 90, item['end'] - 90,
+                          fill=f"#{item['fill']}")
+        elif kind == 'text':
+            for x, baseline, text, size_pt, bold, color, align, _ in item['lines']:
+                size_px = round(px(size_pt * pt))
+                if size_px < 4:
+                    # Too small to read on a thumbnail: a grey bar where the line sits
+                    width = text_layout.string_width(text, bold=bold) * size_pt * pt / 1000
+                    start = {'ctr': x - width / 2, 'r': x - width}.get(align, x)
+                    draw.line([ox + px(start), oy + px(baseline) - 1, ox + px(start + width), oy + px(baseline) - 1],
+                              fill=f'#{color or "9CA3AF"}', width=1)
+                    continue
+                _draw_text(draw, ox + px(x), oy + px(baseline), text, size_px, bold and size_px >= 16,
+                           f'#{color or "000000"}', align)
+
+def slide_png(prs, index, path, width=PREVIEW_WIDTH):
+    """Rasterize one slide to a PNG `width` px wide"""
+    from PIL import Image, ImageDraw
+    key, items = deck_items(prs)[index]
+    scale = width / prs.slide_width
+    image = Image.new('RGB', (width, round(prs.slide_height * scale)), 'white')
+    draw_slide(ImageDraw.Draw(image), items, slide_size(prs), scale)
+    image.save(path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return path
+
+def contact_sheet(prs, path, columns=SHEET_COLUMNS, thumb_width=THUMB_WIDTH, slides=None):
+    """Every slide as a captioned thumbnail on one PNG grid, written to path (or a binary file object)"""
+    from PIL import Image, ImageDraw
+    slides = slides or deck_items(prs)
+    scale = thumb_width / prs.slide_width
+    thumb_height = round(prs.slide_height * scale)
+    columns = max(1, min(columns, len(slides)))
+    rows = math.ceil(len(slides) / columns)
+    cell_w, cell_h = thumb_width + SHEET_MARGIN, thumb_height + CAPTION_HEIGHT + SHEET_MARGIN
+    image = Image.new('RGB', (columns * cell_w + SHEET_MARGIN, rows * cell_h + SHEET_MARGIN), '#E5E7EB')
+    draw = ImageDraw.Draw(image)
+    for i, (key, items) in enumerate(slides):
+        x = SHEET_MARGIN + (i % columns) * cell_w
+        y = SHEET_MARGIN + (i // columns) * cell_h
+        draw_slide(draw, items, slide_size(prs), scale, (x, y))
+        draw.rectangle([x - 1, y - 1, x + thumb_width, y + thumb_height], outline='#9CA3AF')
+        _draw_text(draw, x, y + thumb_height + 15, f"{i + 1} · {key}", 12, False, '#1F2937')
+    image.save(path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return path
+
+def preview_spec(spec=None, html_path=None, png_path=None, svg_dir=None, template=None,
+                 columns=SHEET_COLUMNS, thumb_width=THUMB_WIDTH):
+    """Render a deck spec with the slide builders and write the requested previews; returns the paths written"""
+    import create_investor_deck
+    prs = create_investor_deck.render_deck(spec, template)
+    slides = deck_items(prs)
+    written = []
+    if html_path:
+        written.append(write_html(prs, html_path, slides=slides))
+    if png_path:
+        written.append(contact_sheet(prs, png_path, columns, thumb_width, slides))
+    if svg_dir:
+        written.extend(write_svgs(prs, svg_dir, slides=slides))
+    return written
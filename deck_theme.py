@@ -0,0 +1,97 @@
+"""The presentation theme: the deck palette as colour-scheme slots and its typeface as theme fonts.
+
+create_investor_deck writes its palette and font into the theme part once. Shapes and
+text then refer to slots ('accent1', 'tx2') and to the theme fonts (+mj-lt/+mn-lt),
+instead of repeating an sRGB value and a typeface on every run. A generated deck can be
+rebranded for a client by rewriting ppt/theme/theme1.xml alone. retheme() does that
+without touching the slides.
+
+A theme file is JSON:
+
+    {"colors": {"accent1": "0F766E", "tx2": "1E293B"}, "fonts": {"major": "Georgia", "minor": "Inter"}}
+
+Colours are keyed by scheme slot (dk1, lt1, dk2, lt2, accent1-6, hlink, folHlink). The
+names slides use for the first four (tx1, bg1, tx2, bg2) are accepted as well. Slots
+that are left out keep their current colour.
+"""
+import json
+import os
+import re
+import tempfile
+import zipfile
+
+from lxml import etree
+
+import package_writer
+
+A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+NS = {'a': A}
+
+SCHEME_SLOTS = ('dk1', 'lt1', 'dk2', 'lt2', 'accent1', 'accent2', 'accent3', 'accent4', 'accent5', 'accent6',
+                'hlink', 'folHlink')
+# How slides refer to a slot: the master's colour map sends tx1/bg1/tx2/bg2 to dk1/lt1/dk2/lt2
+SLOT_REFS = dict({slot: slot for slot in SCHEME_SLOTS}, dk1='tx1', lt1='bg1', dk2='tx2', lt2='bg2')
+REF_SLOTS = {ref: slot for slot, ref in SLOT_REFS.items()}
+
+THEME_PART_RE = re.compile(r'^ppt/theme/theme\d+\.xml$')
+
+def _hex(color):
+    return str(color).lstrip('#').upper()
+
+def set_theme(theme, colors=None, major_font=None, minor_font=None):
+    """Update a parsed <a:theme> in place: colours by slot (or slide reference), latin theme fonts"""
+    scheme = theme.find('a:themeElements/a:clrScheme', NS)
+    for name, color in (colors or {}).items():
+        slot = REF_SLOTS.get(name, name)
+        if slot not in SCHEME_SLOTS:
+            raise ValueError(f"unknown theme colour slot {name!r}")
+        element = scheme.find(f'a:{slot}', NS)
+        for child in list(element):
+            element.remove(child)
+        etree.SubElement(element, f'{{{A}}}srgbClr', val=_hex(color))
+    for tag, typeface in (('majorFont', major_font), ('minorFont', minor_font)):
+        if typeface:
+            theme.find(f'a:themeElements/a:fontScheme/a:{tag}/a:latin', NS).set('typeface', typeface)
+    return theme
+
+def theme_part(prs):
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    return prs.slide_master.part.part_related_by(RT.THEME)
+
+def apply_theme(prs, colors=None, major_font=None, minor_font=None):
+    """Write colours and fonts into a Presentation's theme part"""
+    part = theme_part(prs)
+    theme = set_theme(etree.fromstring(part.blob), colors, major_font, minor_font)
+    # python-pptx keeps the theme as an opaque blob part, with no public setter
+    part._blob = etree.tostring(theme, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+def load_theme(path):
+    """(colors, major font, minor font) from a theme JSON file"""
+    with open(path) as f:
+        theme = json.load(f)
+    fonts = theme.get('fonts', {})
+    return theme.get('colors', {}), fonts.get('major'), fonts.get('minor')
+
+def retheme(path, colors=None, major_font=None, minor_font=None, output=None,
+            compression=package_writer.DEFAULT_COMPRESSION):
+    """Rebrand a generated deck by rewriting only its theme part; every other part is copied through"""
+    output = output or path
+    with zipfile.ZipFile(path) as src:
+        parts = []
+        for name in src.namelist():
+            data = src.read(name)
+            if THEME_PART_RE.match(name):
+                theme = set_theme(etree.fromstring(data), colors, major_font, minor_font)
+                data = etree.tostring(theme, xml_declaration=True, encoding='UTF-8', standalone=True)
+            parts.append((name, data))
+
+    out_dir = os.path.dirname(os.path.abspath(output))
+    fd, tmp_path = tempfile.mkstemp(suffix='.pptx', dir=out_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            package_writer.write_parts(f, parts, compression)
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return output
@@ -0,0 +1,136 @@
+"""Vectorized founder-dilution engine: SAFE conversion vs a priced seed round, through Series A.
+
+Every input may be a scalar or an array. Arrays broadcast against each other, so a whole
+grid of caps x discounts x raise sizes x Series A valuations is evaluated in a handful
+of NumPy expressions with no Python loop. scenario_grid() builds such a grid as sparse
+open axes, so memory goes to the outputs only.
+
+Ownership is modelled as fractions of the fully diluted capitalization:
+
+- SAFE (post-money, YC style): at the Series A the SAFE converts at the better of the cap
+  and the discounted Series A price, S / min(cap, (1 - discount) * A pre-money). An
+  MFN cap from a later, cheaper SAFE lowers the effective cap.
+- Priced seed: investors own S / (pre + S). The option pool is topped up to its seed
+  target out of the pre-money, so the founders alone bear the top-up.
+- Bridge SAFEs raised before the Series A convert alongside it on either path.
+- Series A (both paths): new investors own A raise / (A pre + A raise). The pool is
+  topped up to its post-money target, and everyone else is diluted pro rata.
+"""
+import numpy as np
+
+# Defaults for the memo's scenarios: dollar figures in $M, fractions as 0-1
+DEFAULT_SCENARIOS = {
+    'raise_': np.linspace(0.5, 3.0, 6),
+    'cap': np.linspace(4.0, 10.0, 7),
+    'discount': np.array([0.15, 0.20, 0.25]),
+    'series_a_pre': np.linspace(12.0, 40.0, 8),
+    'series_a_raise': np.array([4.0, 6.0, 8.0]),
+}
+POOL_TARGET = 0.10
+SEED_POOL_TARGET = 0.10
+EXISTING_POOL = 0.05
+
+def _series_a_scale(non_pool_pre, pool, series_a_pre, series_a_raise, pool_target):
+    """Factor applied to every non-pool holder's fraction by a Series A with a post-money pool top-up"""
+    investors = series_a_raise / (series_a_pre + series_a_raise)
+    pool_post = np.maximum(pool_target, pool * (1 - investors))
+    return (1 - investors - pool_post) / non_pool_pre
+
+def _safe_fraction(amount, cap, discount, series_a_pre):
+    """Fraction a post-money SAFE converts into, and whether the discount beat the cap"""
+    discount_valuation = (1 - discount) * series_a_pre
+    valuation = np.minimum(cap, discount_valuation)
+    return np.minimum(amount / valuation, 1.0), discount_valuation < cap
+
+def safe_dilution(raise_, cap, discount, series_a_pre, series_a_raise,
+                  pool_target=POOL_TARGET, existing_pool=EXISTING_POOL, mfn_cap=np.inf,
+                  bridge_raise=0.0, bridge_cap=np.inf):
+    """Founder ownership after a post-money SAFE (plus any bridge SAFE) converts in a Series A
+
+    Returns a dict of arrays; 'investors' is the seed SAFE holders' fraction after the Series A.
+    """
+    raise_, cap, discount = np.asarray(raise_, float), np.asarray(cap, float), np.asarray(discount, float)
+    series_a_pre = np.asarray(series_a_pre, float)
+    effective_cap = np.minimum(cap, mfn_cap)
+    safe, on_discount = _safe_fraction(raise_, effective_cap, discount, series_a_pre)
+    bridge, _ = _safe_fraction(np.asarray(bridge_raise, float), np.minimum(bridge_cap, effective_cap),
+                               discount, series_a_pre)
+    converted = np.minimum(safe + bridge, 1.0)
+
+    founders_before = (1 - existing_pool) * (1 - converted)
+    pool_before = existing_pool * (1 - converted)
+    scale = _series_a_scale(founders_before + converted, pool_before, series_a_pre, series_a_raise, pool_target)
+    return {
+        'safe_fraction': safe,
+        'bridge_fraction': bridge,
+        'converted_on_discount': on_discount,
+        'founders_pre_a': founders_before,
+        'founders': founders_before * scale,
+        'investors': safe * scale,
+    }
+
+def priced_dilution(raise_, pre_money, series_a_pre, series_a_raise,
+                    seed_pool_target=SEED_POOL_TARGET, pool_target=POOL_TARGET, existing_pool=EXISTING_POOL,
+                    bridge_raise=0.0, bridge_cap=np.inf, discount=0.0):
+    """Founder ownership after a priced seed round (plus any bridge SAFE) and a Series A
+
+    Returns a dict of arrays; 'investors' is the seed investors' fraction after the Series A.
+    """
+    raise_, pre_money = np.asarray(raise_, float), np.asarray(pre_money, float)
+    investors = raise_ / (pre_money + raise_)
+    pool_seed = np.maximum(seed_pool_target, existing_pool * (1 - investors))
+    founders_seed = 1 - investors - pool_seed
+    bridge, _ = _safe_fraction(np.asarray(bridge_raise, float), bridge_cap, discount,
+                               np.asarray(series_a_pre, float))
+    founders_before = founders_seed * (1 - bridge)
+    investors_before = investors * (1 - bridge)
+    scale = _series_a_scale(founders_before + investors_before + bridge, pool_seed * (1 - bridge),
+                            series_a_pre, series_a_raise, pool_target)
+    return {
+        'investor_fraction': investors,
+        'bridge_fraction': bridge,
+        'founders_pre_a': founders_before,
+        'founders': founders_before * scale,
+        'investors': investors_before * scale,
+    }
+
+def scenario_grid(**axes):
+    """Open (sparse) axes for the given 1-D ranges, in keyword order; missing axes use DEFAULT_SCENARIOS"""
+    axes = dict(DEFAULT_SCENARIOS, **axes)
+    names = list(axes)
+    grids = np.meshgrid(*(np.atleast_1d(np.asarray(axes[n], float)) for n in names), indexing='ij', sparse=True)
+    return dict(zip(names, grids))
+
+def compare(grid, pool_target=POOL_TARGET, existing_pool=EXISTING_POOL):
+    """SAFE vs a priced seed at the same post-money (pre = cap - raise) over a scenario grid
+
+    Returns a dict of dense arrays shaped like the broadcast grid.
+    """
+    safe = safe_dilution(grid['raise_'], grid['cap'], grid['discount'], grid['series_a_pre'],
+                         grid['series_a_raise'], pool_target, existing_pool)
+    pre_money = np.maximum(grid['cap'] - grid['raise_'], 1e-9)
+    priced = priced_dilution(grid['raise_'], pre_money, grid['series_a_pre'], grid['series_a_raise'],
+                             pool_target=pool_target, existing_pool=existing_pool)
+    shape = np.broadcast_shapes(*(np.shape(g) for g in grid.values()))
+    return {
+        'founders_safe': np.broadcast_to(safe['founders'], shape),
+        'founders_priced': np.broadcast_to(priced['founders'], shape),
+        'advantage': np.broadcast_to(safe['founders'] - priced['founders'], shape),
+        'converted_on_discount': np.broadcast_to(safe['converted_on_discount'], shape),
+    }
+
+def summarize_by(grid, result, axis_name, percentiles=(10, 50, 90), metric='founders_safe'):
+    """Percentiles of one result array for each value along one grid axis: [(value, p10, p50, p90), ...]"""
+    axis = list(grid).index(axis_name)
+    values = np.ravel(grid[axis_name])
+    data = np.moveaxis(np.asarray(result[metric]), axis, 0).reshape(len(values), -1)
+    stats = np.percentile(data, percentiles, axis=1)
+    return [(value,) + tuple(stats[:, i]) for i, value in enumerate(values)]
+
+def dilution_table(axes=None, by='cap'):
+    """Rows for the memo: per value of `by`, median founder ownership after Series A on each path"""
+    grid = scenario_grid(**(axes or {}))
+    result = compare(grid)
+    safe = summarize_by(grid, result, by, (50,), 'founders_safe')
+    priced = summarize_by(grid, result, by, (50,), 'founders_priced')
+    return [(value, s, p, s - p) for (value, s), (_, p) in zip(safe, priced)]
@@ -0,0 +1,153 @@
+"""Bounded-memory .docx output: body elements are written to the zip as they are finished.
+
+A normal python-docx Document keeps the whole document.xml tree alive until save. A
+StreamingDocxWriter instead uses the Document as a scratch area. Styles, numbering,
+headers and every other package part are copied from it once, when the writer opens.
+After that, each flush() serializes the body elements built so far into the
+word/document.xml entry and removes them from the tree. Memory therefore tracks the
+largest section between flushes, not the length of the document. Zip entries get the
+same fixed metadata as package_writer.save_package(), in the same package order. Parts
+that come after document.xml are held until close(); they are small and fixed by then.
+The result matches save_package() part for part (same names, order and contents). It
+is not byte-identical, because the streamed document.xml entry carries zip64 sizes.
+
+Given a path, the writer works under "<path>.part" and renames it into place on close().
+If the build fails, the partial file is removed and the output path is left untouched.
+
+The scratch document has to be fully set up before the writer opens. Body content
+added afterwards must not create new package parts (images, hyperlinks, comments),
+because those parts would never reach the zip. The memo's paragraph, heading and
+List Number / List Bullet styles all live in styles.xml and numbering.xml, so they
+work unchanged.
+"""
+import os
+import re
+import zipfile
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+import package_writer
+from package_writer import zip_info
+
+DOCUMENT_PART = 'word/document.xml'
+
+_XMLNS_RE = re.compile(rb' xmlns:(\w+)="([^"]*)"')
+
+class StreamingDocxWriter:
+    """Write a python-docx Document's body to `output` (path or file object) a section at a time"""
+
+    def __init__(self, output, doc, compression=package_writer.DEFAULT_COMPRESSION):
+        self.doc = doc
+        self.body = doc.element.body
+        self._declared = {prefix.encode(): uri.encode() for prefix, uri in doc.element.nsmap.items()}
+        self.profile = package_writer.resolve_profile(compression)
+        self._output = self._part = None
+        if isinstance(output, (str, os.PathLike)):
+            self._output = os.fspath(output)
+            self._part = output = self._output + '.part'
+        self._zip = zipfile.ZipFile(output, 'w')
+        self._stream = None
+        self._trailing = []
+        self.elements_written = 0
+        try:
+            self._copy_package_parts()
+            self._stream = self._zip.open(self._info(DOCUMENT_PART), 'w', force_zip64=True)
+            self._stream.write(self._document_start())
+        except BaseException:
+            self.abort()
+            raise
+
+    def _info(self, name):
+        level = self.profile[package_writer.part_class(name)]
+        if level is None:
+            return zip_info(name, zipfile.ZIP_STORED)
+        return zip_info(name, zipfile.ZIP_DEFLATED, level)
+
+    def _copy_package_parts(self):
+        """Everything but document.xml, taken from the scratch document as it stands now
+
+        Parts before document.xml are written now; the rest wait in _trailing for close().
+        """
+        # Serialize with an empty body so document.xml costs nothing to build
+        pending = [el for el in self.body if el.tag != qn('w:sectPr')]
+        for el in pending:
+            self.body.remove(el)
+        try:
+            parts = package_writer.package_parts(self.doc)
+        finally:
+            for el in pending:
+                self.body.insert(len(self.body) - 1, el)
+
+        names = [name for name, _ in parts]
+        position = names.index(DOCUMENT_PART)
+        for name, blob in parts[:position]:
+            self._zip.writestr(self._info(name), blob)
+        self._trailing = parts[position + 1:]
+
+    def _document_start(self):
+        root = self.doc.element
+        shell = etree.Element(root.tag, attrib=dict(root.attrib), nsmap=root.nsmap)
+        start = etree.tostring(shell, xml_declaration=True, encoding='UTF-8', standalone=True)
+        return start[:-2] + b'><w:body>'
+
+    def _serialize(self, el):
+        """An element without the namespace declarations the document root already carries"""
+        xml = etree.tostring(el, encoding='UTF-8')
+        end = xml.index(b'>')
+        start_tag = _XMLNS_RE.sub(
+            lambda m: b'' if self._declared.get(m.group(1)) == m.group(2) else m.group(0), xml[:end])
+        return start_tag + xml[end:]
+
+    def flush(self):
+        """Write out and drop every finished body element; the section properties stay for close()"""
+        sect_pr = qn('w:sectPr')
+        for el in list(self.body):
+            if el.tag == sect_pr:
+                continue
+            self._stream.write(self._serialize(el))
+            self.body.remove(el)
+            self.elements_written += 1
+
+    def close(self):
+        if self._stream is None:
+            return
+        self.flush()
+        sect_pr = self.body.find(qn('w:sectPr'))
+        if sect_pr is not None:
+            self._stream.write(self._serialize(sect_pr))
+        self._stream.write(b'</w:body></w:document>')
+        self._stream.close()
+        self._stream = None
+        for name, blob in self._trailing:
+            self._zip.writestr(self._info(name), blob)
+        self._trailing = []
+        self._zip.close()
+        self._zip = None
+        if self._part:
+            os.replace(self._part, self._output)
+
+    def abort(self):
+        """Stop without finishing the document, removing the partial file if writing to a path
+
+        Errors while closing are swallowed, so the error that caused the abort is the one raised.
+        """
+        for handle in (self._stream, self._zip):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        self._stream = self._zip = None
+        self._trailing = []
+        if self._part and os.path.exists(self._part):
+            os.unlink(self._part)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,239 @@
+"""Durable render job queue on SQLite, for spreading big rebuilds over processes and hosts.
+
+A producer enqueues manifest jobs into one SQLite file. Workers anywhere that can open
+the file claim jobs one at a time under a lease and render them into a shared output
+directory. While a job renders, a heartbeat thread keeps extending its lease. A job
+whose worker dies stops being renewed, so once the lease lapses another worker claims
+it again. After max_attempts claims it is marked failed. Everything lives in the
+database, so producers and workers can be stopped and restarted at any point of a
+batch.
+
+Claims run inside BEGIN IMMEDIATE transactions, which makes them atomic across
+processes. For hosts sharing the database over a network filesystem, keep SQLite's
+default rollback journal (WAL needs shared memory, so all processes must be on one
+machine) and make sure the filesystem's locking works.
+
+Outputs are rendered to a temporary name and renamed into place. A killed worker
+therefore never leaves a partial document under the real name.
+"""
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+import batch_render
+
+DEFAULT_LEASE = 60
+DEFAULT_MAX_ATTEMPTS = 3
+POLL_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    batch TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, lease_expires);
+"""
+
+STATUSES = ('queued', 'running', 'done', 'failed')
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class JobQueue:
+    def __init__(self, path, wal=False):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        if wal:
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(SCHEMA)
+
+    def _transaction(self, fn):
+        """Run fn(cursor) inside BEGIN IMMEDIATE, so concurrent claimers serialize on the write lock"""
+        with self._lock:
+            cur = self._db.cursor()
+            cur.execute('BEGIN IMMEDIATE')
+            try:
+                result = fn(cur)
+            except BaseException:
+                cur.execute('ROLLBACK')
+                raise
+            cur.execute('COMMIT')
+            return result
+
+    def enqueue(self, jobs, batch=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """Add jobs (manifest dicts); returns their ids"""
+        now = time.time()
+
+        def insert(cur):
+            ids = []
+            for job in jobs:
+                cur.execute('INSERT INTO jobs (batch, payload, max_attempts, created, updated) VALUES (?, ?, ?, ?, ?)',
+                            (batch, json.dumps(job), max_attempts, now, now))
+                ids.append(cur.lastrowid)
+            return ids
+        return self._transaction(insert)
+
+    def claim(self, worker, lease=DEFAULT_LEASE):
+        """Lease the oldest runnable job to worker: (id, job, attempt), or None when nothing is runnable"""
+        def take(cur):
+            now = time.time()
+            # Leases that lapsed on their last allowed attempt end the job
+            cur.execute("UPDATE jobs SET status = 'failed', error = 'worker lost (lease expired)', worker = NULL, "
+                        "updated = ? WHERE status = 'running' AND lease_expires < ? AND attempts >= max_attempts",
+                        (now, now))
+            row = cur.execute("SELECT id, payload, attempts FROM jobs WHERE status = 'queued' "
+                              "OR (status = 'running' AND lease_expires < ?) ORDER BY id LIMIT 1", (now,)).fetchone()
+            if row is None:
+                return None
+            job_id, payload, attempts = row
+            cur.execute("UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?, lease_expires = ?, "
+                        "updated = ? WHERE id = ?", (worker, now + lease, now, job_id))
+            return job_id, json.loads(payload), attempts + 1
+        return self._transaction(take)
+
+    def heartbeat(self, job_id, worker, lease=DEFAULT_LEASE):
+        """Extend a lease; False if the job is no longer this worker's (its lease lapsed and was re-claimed)"""
+        now = time.time()
+        # rowcount is only meaningful before COMMIT runs on the same cursor
+        updated = self._transaction(lambda cur: cur.execute(
+            "UPDATE jobs SET lease_expires = ?, updated = ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (now + lease, now, job_id, worker)).rowcount)
+        return updated == 1
+
+    def complete(self, job_id, worker, result):
+        return self._finish(job_id, worker, 'done', json.dumps(result), None)
+
+    def fail(self, job_id, worker, error, retry=True):
+        """Record a failed attempt; the job goes back in the queue while it has attempts left"""
+        def record(cur):
+            row = cur.execute('SELECT attempts, max_attempts FROM jobs WHERE id = ? AND worker = ?',
+                              (job_id, worker)).fetchone()
+            if row is None:
+                return False
+            status = 'queued' if retry and row[0] < row[1] else 'failed'
+            cur.execute('UPDATE jobs SET status = ?, error = ?, worker = NULL, lease_expires = NULL, updated = ? '
+                        'WHERE id = ?', (status, error, time.time(), job_id))
+            return True
+        return self._transaction(record)
+
+    def _finish(self, job_id, worker, status, result, error):
+        updated = self._transaction(lambda cur: cur.execute(
+            'UPDATE jobs SET status = ?, result = ?, error = ?, worker = NULL, lease_expires = NULL, updated = ? '
+            'WHERE id = ? AND worker = ?', (status, result, error, time.time(), job_id, worker)).rowcount)
+        return updated == 1
+
+    def requeue_failed(self, batch=None):
+        """Give failed jobs a fresh set of attempts; returns how many"""
+        sql = "UPDATE jobs SET status = 'queued', attempts = 0, error = NULL, updated = ? WHERE status = 'failed'"
+        params = [time.time()]
+        if batch is not None:
+            sql += ' AND batch = ?'
+            params.append(batch)
+        return self._transaction(lambda cur: cur.execute(sql, params).rowcount)
+
+    def counts(self, batch=None):
+        sql = 'SELECT status, COUNT(*) FROM jobs' + (' WHERE batch = ?' if batch is not None else '') + ' GROUP BY status'
+        with self._lock:
+            rows = self._db.execute(sql, () if batch is None else (batch,)).fetchall()
+        return dict({s: 0 for s in STATUSES}, **dict(rows))
+
+    def failures(self, batch=None):
+        sql = "SELECT id, payload, attempts, error FROM jobs WHERE status = 'failed'"
+        sql += ' AND batch = ?' if batch is not None else ''
+        with self._lock:
+            rows = self._db.execute(sql, () if batch is None else (batch,)).fetchall()
+        return [(job_id, json.loads(payload), attempts, error) for job_id, payload, attempts, error in rows]
+
+    def close(self):
+        self._db.close()
+
+class _Heartbeat(threading.Thread):
+    """Renews a job's lease every third of its length until stopped"""
+
+    def __init__(self, queue, job_id, worker, lease):
+        super().__init__(daemon=True)
+        self.queue, self.job_id, self.worker, self.lease = queue, job_id, worker, lease
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.lease / 3):
+            if not self.queue.heartbeat(self.job_id, self.worker, self.lease):
+                return
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+def run_claimed(job, out_dir, timeout, cache_dir=None):
+    """Render one claimed job into out_dir under a temporary name, then rename it into place"""
+    job = dict(job)
+    output = os.path.join(out_dir, job['output'])
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    root, ext = os.path.splitext(output)
+    job['output'] = f"{root}.{worker_name().replace(':', '-')}.part{ext}"
+    try:
+        result = batch_render.run_job(0, job, timeout, cache_dir)
+        if result['status'] == 'ok':
+            os.replace(job['output'], output)
+    finally:
+        if os.path.exists(job['output']):
+            os.unlink(job['output'])
+    result['output'] = output
+    return result
+
+def work(db_path, out_dir, lease=DEFAULT_LEASE, timeout=batch_render.DEFAULT_TIMEOUT, cache_dir=None,
+         exit_when_empty=True, poll=POLL_INTERVAL):
+    """Claim and render jobs until the queue has nothing runnable (or forever); returns jobs attempted"""
+    batch_render._warm_worker()
+    queue = JobQueue(db_path)
+    worker = worker_name()
+    attempted = 0
+    try:
+        while True:
+            claimed = queue.claim(worker, lease)
+            if claimed is None:
+                counts = queue.counts()
+                # Jobs still leased elsewhere may come back if their worker dies
+                if exit_when_empty and not counts['queued'] and not counts['running']:
+                    return attempted
+                time.sleep(poll)
+                continue
+            job_id, job, attempt = claimed
+            heartbeat = _Heartbeat(queue, job_id, worker, lease)
+            heartbeat.start()
+            try:
+                result = run_claimed(job, out_dir, job.get('timeout', timeout), cache_dir)
+            finally:
+                heartbeat.stop()
+            attempted += 1
+            if result['status'] == 'ok':
+                queue.complete(job_id, worker, result)
+            else:
+                # Page-budget failures are properties of the inputs and would fail again
+                retry = not (result['error'] or '').startswith('PageBudgetExceeded')
+                queue.fail(job_id, worker, f"attempt {attempt}: {result['status']}: {result['error']}", retry)
+    finally:
+        queue.close()
+
+def run_workers(db_path, out_dir, workers=None, **kwargs):
+    """Run `workers` local worker processes until the queue drains; returns jobs attempted per worker"""
+    workers = workers or os.cpu_count() or 1
+    JobQueue(db_path).close()  # create the schema once, before workers race to
+    with multiprocessing.Pool(workers) as pool:
+        pending = [pool.apply_async(work, (db_path, out_dir), kwargs) for _ in range(workers)]
+        return [p.get() for p in pending]
@@ -0,0 +1,220 @@
+"""Monte Carlo simulation of Series A outcomes for a SAFE vs a priced seed round.
+
+Each path samples when the Series A happens, its pre-money valuation and raise, how
+many bridge SAFEs the company needs to get there, and whether it fails first. Both
+structures are then pushed through the dilution engine on the same sampled paths:
+
+- founder ownership after the Series A;
+- the founders' stake value at the Series A post-money, in $M;
+- the seed investors' multiple on invested capital, marked at the Series A.
+
+Percentiles and 'mean' are taken over the paths that reach a Series A, so every row
+of summary_rows() is on the same basis. For the two value metrics, 'expected' is the
+mean over all paths with failed paths counted as 0.
+
+Paths are generated in fixed-size chunks, each with its own child of one SeedSequence,
+so memory stays bounded and the result for a given seed does not depend on how many
+worker processes ran the chunks. A chunk reduces to fixed-bin histograms and sums,
+which merge by addition in chunk order. Percentiles are read off the merged histograms, to
+within one bin width.
+"""
+import collections
+import multiprocessing
+import os
+
+import numpy as np
+
+import dilution
+
+# Dollar figures in $M, durations in months, fractions as 0-1
+DEFAULT_PARAMS = {
+    'raise_': 1.5,
+    'cap': 8.0,
+    'discount': 0.20,
+    # Months until the Series A closes: lognormal around the median
+    'months_median': 18.0,
+    'months_sigma': 0.35,
+    # Series A pre-money: lognormal around the median at months_median; slower rounds price lower
+    'series_a_pre_median': 24.0,
+    'series_a_pre_sigma': 0.5,
+    'series_a_pre_drift': -0.02,
+    # Series A investors take a uniform share of the post-money in this range
+    'series_a_share': (0.20, 0.30),
+    # Runway from the seed; each bridge SAFE buys bridge_months more and converts at bridge_cap
+    'runway_months': 18.0,
+    'bridge_months': 6.0,
+    'bridge_raise': 0.5,
+    'bridge_cap': 8.0,
+    # Chance of failing before a Series A, plus a little more for each bridge needed
+    'failure_rate': 0.30,
+    'failure_per_bridge': 0.05,
+}
+
+DEFAULT_PATHS = 10_000_000
+CHUNK_SIZE = 250_000
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Histogram ranges for each metric; values beyond the top land in the last bin
+METRIC_BINS = {
+    'founders': (0.0, 1.0, 2000),
+    'founder_value': (0.0, 200.0, 4000),
+    'investor_multiple': (0.0, 50.0, 5000),
+}
+STRUCTURES = ('safe', 'priced')
+# Summaries kept by cached_simulation; warm workers live long, so the least recently used go first
+CACHE_SIZE = 16
+
+_results = collections.OrderedDict()
+
+def simulate_chunk(params, seed_seq, size):
+    """Sample one chunk of paths; returns the number reaching a Series A and, for those paths only,
+    {'safe': {metric: array}, 'priced': {metric: array}}
+    """
+    rng = np.random.default_rng(seed_seq)
+    p = params
+
+    months = p['months_median'] * np.exp(p['months_sigma'] * rng.standard_normal(size))
+    series_a_pre = (p['series_a_pre_median'] * np.exp(p['series_a_pre_sigma'] * rng.standard_normal(size))
+                    * np.exp(p['series_a_pre_drift'] * (months - p['months_median'])))
+    share = rng.uniform(*p['series_a_share'], size)
+    bridges = np.ceil(np.maximum(months - p['runway_months'], 0.0) / p['bridge_months'])
+    failure = np.minimum(p['failure_rate'] + p['failure_per_bridge'] * bridges, 1.0)
+    reached = rng.random(size) >= failure
+
+    # Only the paths that reach a Series A need the dilution maths
+    series_a_pre, share, bridges = series_a_pre[reached], share[reached], bridges[reached]
+    series_a_raise = series_a_pre * share / (1 - share)
+    post_money = series_a_pre + series_a_raise
+    bridge_raise = bridges * p['bridge_raise']
+    safe = dilution.safe_dilution(p['raise_'], p['cap'], p['discount'], series_a_pre, series_a_raise,
+                                  bridge_raise=bridge_raise, bridge_cap=p['bridge_cap'])
+    priced = dilution.priced_dilution(p['raise_'], max(p['cap'] - p['raise_'], 1e-9), series_a_pre,
+                                      series_a_raise, bridge_raise=bridge_raise, bridge_cap=p['bridge_cap'],
+                                      discount=p['discount'])
+    out = {'reached': len(series_a_pre)}
+    for name, result in (('safe', safe), ('priced', priced)):
+        out[name] = {
+            'founders': result['founders'],
+            'founder_value': result['founders'] * post_money,
+            'investor_multiple': result['investors'] * post_money / p['raise_'],
+        }
+    return out
+
+def _histogram(values, metric):
+    low, high, bins = METRIC_BINS[metric]
+    index = ((values - low) * (bins / (high - low))).astype(np.int64)
+    return np.bincount(np.clip(index, 0, bins - 1), minlength=bins)
+
+def _reduce_chunk(args):
+    """Histograms and sums for one chunk; runs in the worker processes"""
+    params, seed_seq, size = args
+    raw = simulate_chunk(params, seed_seq, size)
+    summary = {'paths': size, 'reached': raw['reached'],
+               'safe_better': int(np.count_nonzero(raw['safe']['founders'] > raw['priced']['founders']))}
+    for name in STRUCTURES:
+        for metric, values in raw[name].items():
+            summary[name, metric] = (_histogram(values, metric), float(values.sum()))
+    return summary
+
+def _merge(total, part):
+    if total is None:
+        return part
+    for key, value in part.items():
+        if isinstance(value, tuple):
+            total[key] = (total[key][0] + value[0], total[key][1] + value[1])
+        else:
+            total[key] += value
+    return total
+
+def histogram_percentiles(counts, metric, percentiles=PERCENTILES, zeros=0):
+    """Percentiles from binned counts plus `zeros` exact zeros, interpolating linearly inside a bin"""
+    low, high, bins = METRIC_BINS[metric]
+    total = counts.sum() + zeros
+    if not total:
+        return {q: float('nan') for q in percentiles}
+    width = (high - low) / bins
+    cumulative = zeros + np.cumsum(counts)
+    out = {}
+    for q in percentiles:
+        target = total * q / 100
+        if target <= zeros:
+            out[q] = 0.0
+            continue
+        i = min(int(np.searchsorted(cumulative, target)), bins - 1)
+        below = cumulative[i - 1] if i else zeros
+        inside = (target - below) / counts[i] if counts[i] else 0.0
+        out[q] = low + (i + inside) * width
+    return out
+
+def _chunks(n_paths, seed, chunk_size, params):
+    sizes = [chunk_size] * (n_paths // chunk_size) + ([n_paths % chunk_size] if n_paths % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    return [(params, s, size) for s, size in zip(seeds, sizes)]
+
+def simulate(n_paths=DEFAULT_PATHS, params=None, seed=0, workers=None, chunk_size=CHUNK_SIZE,
+             percentiles=PERCENTILES):
+    """Run n_paths and return a summary dict; the same (n_paths, params, seed, chunk_size) gives the same numbers
+
+    workers: processes to spread the chunks over (default: all cores; 1 runs in-process).
+    """
+    params = dict(DEFAULT_PARAMS, **(params or {}))
+    chunks = _chunks(n_paths, seed, chunk_size, params)
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    total = None
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            # imap keeps chunk order, so the float sums add up identically on every run
+            for part in pool.imap(_reduce_chunk, chunks):
+                total = _merge(total, part)
+    else:
+        for chunk in chunks:
+            total = _merge(total, _reduce_chunk(chunk))
+
+    reached = total['reached']
+    summary = {
+        'paths': total['paths'],
+        'seed': seed,
+        'params': params,
+        'reached_series_a': reached / total['paths'],
+        'safe_better': total['safe_better'] / reached if reached else float('nan'),
+    }
+    for name in STRUCTURES:
+        summary[name] = {}
+        for metric in METRIC_BINS:
+            counts, value_sum = total[name, metric]
+            summary[name][metric] = dict(histogram_percentiles(counts, metric, percentiles),
+                                         mean=value_sum / reached if reached else float('nan'))
+            if metric != 'founders':
+                # Failed paths are worth nothing
+                summary[name][metric]['expected'] = value_sum / total['paths']
+    return summary
+
+def cached_simulation(n_paths, params=None, seed=0, workers=1):
+    """simulate() memoized per process, for renderers that need the same summary many times"""
+    params = dict(DEFAULT_PARAMS, **(params or {}))
+    key = (n_paths, seed, tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())))
+    summary = _results.get(key)
+    if summary is None:
+        summary = _results[key] = simulate(n_paths, params, seed, workers)
+        if len(_results) > CACHE_SIZE:
+            _results.popitem(last=False)
+    else:
+        _results.move_to_end(key)
+    return summary
+
+def summary_rows(summary, percentiles=(10, 50, 90)):
+    """Table rows for the memo: (metric, statistic, SAFE, priced seed) as display strings
+
+    Every row is over the paths that reach a Series A.
+    """
+    formats = {
+        'founders': ("Founder ownership after Series A", "{:.1%}"),
+        'founder_value': ("Founder stake at Series A ($M)", "${:.1f}M"),
+        'investor_multiple': ("Seed investor multiple at Series A", "{:.2f}x"),
+    }
+    rows = []
+    for metric, (label, fmt) in formats.items():
+        for q in percentiles:
+            rows.append((label if q == percentiles[0] else "", f"P{q}",
+                         fmt.format(summary['safe'][metric][q]), fmt.format(summary['priced'][metric][q])))
+    return rows
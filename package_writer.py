@@ -0,0 +1,256 @@
+"""Reproducible OOXML packages with configurable, parallel compression.
+
+python-pptx and python-docx stamp every zip entry with the current local time, and
+zipfile records the host OS, so saving identical content twice gives different files.
+save_package() writes the same parts with a fixed timestamp and fixed entry attributes.
+The part contents are already stable: shape and relationship ids are allocated in order,
+and both default templates carry fixed core properties. Only the memo's DATE line
+depends on the clock, and that comes from the render context.
+
+It also replaces the libraries' save, which deflates every part serially at zlib's
+default level. Each part is classed as 'xml' (XML and relationship parts), 'media'
+(images, audio/video, embedded packages) or 'other'. A compression profile maps each
+class to a deflate level, or to None for stored. Parts over PARALLEL_THRESHOLD, such as
+a long memo's document.xml, are cut into slices that are deflated on a thread pool.
+zlib releases the GIL, so the slices compress on separate cores. The zip is then
+assembled in part order. Profiles:
+
+- 'fast': level 1, for interactive renders (a few percent larger, several times faster)
+- 'default': level 6, zlib's default and what python-pptx/python-docx use
+- 'archive': level 9, the smallest files
+- 'store': no compression at all
+
+Media is stored in every profile: PNG, JPEG and embedded packages are compressed
+already, and deflating them again costs time for no gain.
+"""
+import io
+import os
+import struct
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import instrumentation
+
+# The earliest timestamp a zip entry can hold
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_DOS_TIME, _DOS_DATE = 0, (0 << 9) | (1 << 5) | 1
+
+COMPRESSION_PROFILES = {
+    'fast': {'xml': 1, 'media': None, 'other': 1},
+    'default': {'xml': 6, 'media': None, 'other': 6},
+    'archive': {'xml': 9, 'media': None, 'other': 9},
+    'store': {'xml': None, 'media': None, 'other': None},
+}
+DEFAULT_COMPRESSION = 'default'
+
+MEDIA_EXTENSIONS = frozenset((
+    '.png', '.jpg', '.jpeg', '.gif', '.tif', '.tiff', '.webp', '.jxr',
+    '.mp3', '.m4a', '.mp4', '.m4v', '.mov', '.wmv', '.avi',
+    '.xlsx', '.docx', '.pptx', '.zip', '.odttf', '.fntdata',
+))
+XML_EXTENSIONS = frozenset(('.xml', '.rels', '.vml'))
+
+# Parts at least this large are deflated as PARALLEL_CHUNK slices on a thread pool
+PARALLEL_THRESHOLD = 256 * 1024
+PARALLEL_CHUNK = 128 * 1024
+DEFLATE_WINDOW = 32 * 1024
+
+def zip_info(name, compress_type=zipfile.ZIP_DEFLATED, compresslevel=None):
+    """A ZipInfo whose metadata depends only on the entry name, for use with zipfile"""
+    info = zipfile.ZipInfo(name, ZIP_DATE_TIME)
+    info.compress_type = compress_type
+    # ZipFile.open() has no level argument and ignores the archive's for a ZipInfo (no public setter before 3.13)
+    info._compresslevel = compresslevel
+    info.create_system = 0
+    info.external_attr = 0
+    return info
+
+def part_class(name):
+    ext = os.path.splitext(name)[1].lower()
+    if ext in XML_EXTENSIONS:
+        return 'xml'
+    if ext in MEDIA_EXTENSIONS:
+        return 'media'
+    return 'other'
+
+def resolve_profile(compression):
+    """A {'xml'|'media'|'other': level or None} mapping from a profile name or a partial mapping"""
+    if compression is None:
+        compression = DEFAULT_COMPRESSION
+    if isinstance(compression, str):
+        try:
+            return COMPRESSION_PROFILES[compression]
+        except KeyError:
+            raise ValueError(f"unknown compression profile {compression!r}; "
+                             f"expected one of {', '.join(COMPRESSION_PROFILES)}") from None
+    return dict(COMPRESSION_PROFILES[DEFAULT_COMPRESSION], **compression)
+
+class _PartCollector:
+    """Stands in for the libraries' zip writers and keeps (member name, blob) in write order"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, pack_uri, blob):
+        self.parts.append((pack_uri.membername, blob))
+
+    def close(self):
+        pass
+
+def package_parts(obj):
+    """Serialized [(member name, bytes)] of a Presentation or Document, in the order its own save writes them"""
+    package = obj.part.package
+    collector = _PartCollector()
+    if type(package).__module__.startswith('pptx.'):
+        from pptx.opc.serialized import PackageWriter
+        writer = PackageWriter(None, package._rels, tuple(package.iter_parts()))
+        writer._write_content_types_stream(collector)
+        writer._write_pkg_rels(collector)
+        writer._write_parts(collector)
+    else:
+        from docx.opc.pkgwriter import PackageWriter
+        parts = list(package.parts)
+        for part in parts:
+            part.before_marshal()
+        PackageWriter._write_content_types_stream(collector, parts)
+        PackageWriter._write_pkg_rels(collector, package.rels)
+        PackageWriter._write_parts(collector, parts)
+    return collector.parts
+
+def _deflate(blob, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(blob) + compressor.flush()
+
+def _deflate_chunk(view, start, level):
+    """One slice of a large part as a piece of a single raw deflate stream (as pigz does)
+
+    Each slice is primed with the 32 KiB before it, so back-references still reach across
+    slice boundaries. Every slice but the last ends on a byte-aligned sync flush, so the
+    pieces concatenate into one valid stream.
+    """
+    end = min(start + PARALLEL_CHUNK, len(view))
+    if start:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=view[max(0, start - DEFLATE_WINDOW):start])
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    data = compressor.compress(view[start:end])
+    return data + compressor.flush(zlib.Z_FINISH if end == len(view) else zlib.Z_SYNC_FLUSH)
+
+def _encode(name, blob, level):
+    """(name, method, crc, compressed bytes, size) for one entry"""
+    crc = zlib.crc32(blob)
+    if level is None:
+        return name, zipfile.ZIP_STORED, crc, blob, len(blob)
+    return name, zipfile.ZIP_DEFLATED, crc, _deflate(blob, level), len(blob)
+
+def _assemble(out, entries):
+    """Write a zip of pre-encoded entries; every header field is fixed, so equal entries give equal bytes"""
+    central = []
+    offset = 0
+    for name, method, crc, data, size in entries:
+        encoded = name.encode('utf-8')
+        flags = 0 if encoded.isascii() else 0x800
+        if len(data) > 0xFFFFFFFF or size > 0xFFFFFFFF or offset > 0xFFFFFFFF:
+            raise ValueError(f"{name}: parts and packages over 4 GiB need zip64")
+        header = struct.pack('<4s5H3L2H', b'PK\x03\x04', 20, flags, method, _DOS_TIME, _DOS_DATE,
+                             crc, len(data), size, len(encoded), 0)
+        out.write(header)
+        out.write(encoded)
+        out.write(data)
+        central.append(struct.pack('<4s6H3L5H2L', b'PK\x01\x02', 20, 20, flags, method, _DOS_TIME, _DOS_DATE,
+                                   crc, len(data), size, len(encoded), 0, 0, 0, 0, 0, offset) + encoded)
+        offset += len(header) + len(encoded) + len(data)
+    directory = b''.join(central)
+    out.write(directory)
+    out.write(struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, len(central), len(central), len(directory), offset, 0))
+
+def _encode_parts(parts, levels, workers):
+    """Compress every part under its level; returns (entries, parts deflated in slices, slice count)"""
+    # Which parts are split depends only on their size, so output never depends on the worker count
+    large = {i for i, ((_, blob), level) in enumerate(zip(parts, levels))
+             if level is not None and len(blob) >= PARALLEL_THRESHOLD}
+    if not large:
+        return [_encode(name, blob, level) for (name, blob), level in zip(parts, levels)], 0, 0
+    entries = [None] * len(parts)
+    chunks = 0
+    with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        pending = {}
+        for i in large:
+            view = memoryview(parts[i][1])
+            pending[i] = (pool.submit(zlib.crc32, view),
+                          [pool.submit(_deflate_chunk, view, offset, levels[i])
+                           for offset in range(0, len(view), PARALLEL_CHUNK)])
+            chunks += len(pending[i][1])
+        # Small parts compress here while the pool works through the large ones
+        for i, ((name, blob), level) in enumerate(zip(parts, levels)):
+            if i not in large:
+                entries[i] = _encode(name, blob, level)
+        for i, (crc, pieces) in pending.items():
+            name, blob = parts[i]
+            entries[i] = (name, zipfile.ZIP_DEFLATED, crc.result(),
+                          b''.join(piece.result() for piece in pieces), len(blob))
+    return entries, len(large), chunks
+
+def write_parts(output, parts, compression=DEFAULT_COMPRESSION, workers=None, report=None):
+    """Write [(name, bytes)] in order to output (path or file object) under a compression profile
+
+    If report is a dict it is filled with part counts, byte totals and timings.
+    """
+    profile = resolve_profile(compression)
+    start = time.perf_counter()
+    with instrumentation.span('compress') as span:
+        entries, large, chunks = _encode_parts(parts, [profile[part_class(name)] for name, _ in parts], workers)
+        span.set(parallel_chunks=chunks)
+    compressed = time.perf_counter()
+
+    with instrumentation.span('write'):
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'wb') as f:
+                _assemble(f, entries)
+        else:
+            _assemble(output, entries)
+
+    if report is not None:
+        bytes_in = sum(entry[4] for entry in entries)
+        bytes_out = sum(len(entry[3]) for entry in entries)
+        report.update({
+            'profile': compression if isinstance(compression, str) else profile,
+            'parts': len(entries),
+            'stored': sum(1 for entry in entries if entry[1] == zipfile.ZIP_STORED),
+            'parallel_parts': large,
+            'parallel_chunks': chunks,
+            'bytes_in': bytes_in,
+            'bytes_out': bytes_out,
+            'bytes_saved': bytes_in - bytes_out,
+            'compress_seconds': compressed - start,
+            'seconds': time.perf_counter() - start,
+        })
+    return output
+
+def save_package(obj, output=None, compression=DEFAULT_COMPRESSION, workers=None, report=None):
+    """Save a Presentation or Document reproducibly to output (path or file object), or return the bytes"""
+    start = time.perf_counter()
+    with instrumentation.span('serialize') as span:
+        parts = package_parts(obj)
+        span.set(parts=len(parts), bytes=sum(len(blob) for _, blob in parts) if instrumentation.enabled() else None)
+    serialized = time.perf_counter()
+    target = io.BytesIO() if output is None else output
+    with instrumentation.span('save', compression=compression if isinstance(compression, str) else 'custom'):
+        write_parts(target, parts, compression, workers, report)
+    if report is not None:
+        report['serialize_seconds'] = serialized - start
+        report['seconds'] += serialized - start
+    return target.getvalue() if output is None else output
+
+def repack(src, output=None, compression=DEFAULT_COMPRESSION, workers=None, report=None):
+    """Rewrite an existing .pptx/.docx under another compression profile, keeping its part order
+
+    Writes to output (path or file object), or returns the bytes.
+    """
+    with zipfile.ZipFile(src) as zf:
+        parts = [(info.filename, zf.read(info.filename)) for info in zf.infolist()]
+    target = io.BytesIO() if output is None else output
+    write_parts(target, parts, compression, workers, report)
+    return target.getvalue() if output is None else output
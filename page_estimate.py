@@ -0,0 +1,471 @@
+"""Page-count estimate for .docx documents from cached font metrics, without rendering them.
+
+Each paragraph's properties are resolved through docDefaults, the style chain, numbering
+indents and direct formatting. The paragraph is then line-broken with text_layout's
+glyph tables at the section's text width, and the lines are stacked onto pages of the
+section's text height. The model covers:
+
+- spacing before and after (additive, dropped between same-style paragraphs with contextual spacing)
+- auto, exact and at-least line spacing
+- keep-with-next and keep-lines
+- page-break-before and explicit page breaks
+- unsplittable table rows
+
+It ignores widow/orphan control, floating objects and header/footer growth, so the
+result is an approximation of Word's pagination. It is cheap enough to enforce page
+budgets across thousands of memos.
+"""
+import re
+import zipfile
+from functools import lru_cache
+
+from lxml import etree
+
+import text_layout
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+THEME_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme'
+
+TWIPS_PER_PT = 20
+DEFAULT_FONT = 'Calibri'
+DEFAULT_SIZE_HALF_PT = 20
+# Word's default left/right table cell margin
+CELL_MARGIN_TWIPS = 108
+# A tab advances to the next default stop; a fixed half inch is close enough for body text
+TAB_WIDTH_PT = 36
+
+_PIECE_RE = re.compile(r' +|\n|\t|[^ \n\t]+')
+
+@lru_cache(maxsize=None)
+def _w(tag):
+    return '{%s}%s' % (W_NS, tag)
+
+def _on(el):
+    """Toggle properties (<w:b/>, <w:keepNext w:val="0"/>) are on unless explicitly switched off"""
+    return el.get(_w('val'), 'true') not in ('0', 'false', 'off')
+
+def _paragraph_props(ppr):
+    props = {}
+    if ppr is None:
+        return props
+    spacing = ppr.find(_w('spacing'))
+    if spacing is not None:
+        for key in ('before', 'after', 'line'):
+            value = spacing.get(_w(key))
+            if value is not None:
+                props[key] = int(value)
+        if spacing.get(_w('lineRule')):
+            props['lineRule'] = spacing.get(_w('lineRule'))
+    ind = ppr.find(_w('ind'))
+    if ind is not None:
+        for attr, key in (('left', 'left'), ('start', 'left'), ('right', 'right'), ('end', 'right'),
+                          ('hanging', 'hanging'), ('firstLine', 'firstLine')):
+            value = ind.get(_w(attr))
+            if value is not None:
+                props[key] = int(value)
+    for key in ('keepNext', 'keepLines', 'pageBreakBefore', 'contextualSpacing'):
+        el = ppr.find(_w(key))
+        if el is not None:
+            props[key] = _on(el)
+    num_pr = ppr.find(_w('numPr'))
+    if num_pr is not None:
+        num_id = num_pr.find(_w('numId'))
+        ilvl = num_pr.find(_w('ilvl'))
+        if num_id is not None:
+            props['numId'] = num_id.get(_w('val'))
+        if ilvl is not None:
+            props['ilvl'] = ilvl.get(_w('val'))
+    return props
+
+def _run_props(rpr):
+    props = {}
+    if rpr is None:
+        return props
+    sz = rpr.find(_w('sz'))
+    if sz is not None:
+        props['size'] = int(sz.get(_w('val')))
+    b = rpr.find(_w('b'))
+    if b is not None:
+        props['bold'] = _on(b)
+    fonts = rpr.find(_w('rFonts'))
+    if fonts is not None:
+        if fonts.get(_w('ascii')):
+            props['font'] = ('name', fonts.get(_w('ascii')))
+        elif fonts.get(_w('asciiTheme')):
+            props['font'] = ('theme', fonts.get(_w('asciiTheme')))
+    return props
+
+class StyleResolver:
+    """Effective paragraph/run properties for one set of styles, numbering and theme parts"""
+
+    def __init__(self, styles, numbering=None, theme=None):
+        self.styles = {}
+        self.default_paragraph_style = None
+        for style in styles.iter(_w('style')):
+            style_id = style.get(_w('styleId'))
+            self.styles[style_id] = style
+            if style.get(_w('type')) == 'paragraph' and style.get(_w('default')) in ('1', 'true', 'on'):
+                self.default_paragraph_style = style_id
+
+        defaults = styles.find(_w('docDefaults'))
+        self.default_ppr = _paragraph_props(defaults.find('%s/%s' % (_w('pPrDefault'), _w('pPr')))
+                                            if defaults is not None else None)
+        self.default_rpr = _run_props(defaults.find('%s/%s' % (_w('rPrDefault'), _w('rPr')))
+                                      if defaults is not None else None)
+
+        self.numbering = {}
+        if numbering is not None:
+            abstract = {a.get(_w('abstractNumId')): a for a in numbering.iter(_w('abstractNum'))}
+            for num in numbering.iter(_w('num')):
+                ref = num.find(_w('abstractNumId'))
+                if ref is not None and ref.get(_w('val')) in abstract:
+                    self.numbering[num.get(_w('numId'))] = abstract[ref.get(_w('val'))]
+
+        self.theme_fonts = {}
+        if theme is not None:
+            for kind in ('major', 'minor'):
+                latin = theme.find('.//{%s}%sFont/{%s}latin' % (A_NS, kind, A_NS))
+                if latin is not None and latin.get('typeface'):
+                    self.theme_fonts[kind] = latin.get('typeface')
+        self._style_cache = {}
+        self._numbering_cache = {}
+
+    def style_props(self, style_id):
+        """(paragraph props, run props) for a style with its basedOn chain applied"""
+        cached = self._style_cache.get(style_id)
+        if cached is not None:
+            return cached
+        key = style_id
+        chain = []
+        seen = set()
+        while style_id and style_id in self.styles and style_id not in seen:
+            seen.add(style_id)
+            style = self.styles[style_id]
+            chain.append(style)
+            based_on = style.find(_w('basedOn'))
+            style_id = based_on.get(_w('val')) if based_on is not None else None
+        ppr, rpr = {}, {}
+        for style in reversed(chain):
+            ppr.update(_paragraph_props(style.find(_w('pPr'))))
+            rpr.update(_run_props(style.find(_w('rPr'))))
+        self._style_cache[key] = (ppr, rpr)
+        return ppr, rpr
+
+    def numbering_props(self, num_id, ilvl):
+        key = (num_id, ilvl or '0')
+        if key not in self._numbering_cache:
+            props = {}
+            abstract = self.numbering.get(num_id)
+            if abstract is not None:
+                for lvl in abstract.iter(_w('lvl')):
+                    if lvl.get(_w('ilvl')) == key[1]:
+                        props = _paragraph_props(lvl.find(_w('pPr')))
+                        break
+            self._numbering_cache[key] = props
+        return self._numbering_cache[key]
+
+    def font_name(self, font):
+        if font is None:
+            return self.theme_fonts.get('minor', DEFAULT_FONT)
+        kind, value = font
+        if kind == 'theme':
+            return self.theme_fonts.get('major' if value.startswith('major') else 'minor', DEFAULT_FONT)
+        return value
+
+    def paragraph(self, p):
+        """Effective paragraph props, and run props of the paragraph style, for a <w:p>"""
+        ppr_el = p.find(_w('pPr'))
+        style_el = ppr_el.find(_w('pStyle')) if ppr_el is not None else None
+        style_id = style_el.get(_w('val')) if style_el is not None else self.default_paragraph_style
+        style_ppr, style_rpr = self.style_props(style_id)
+        direct = _paragraph_props(ppr_el)
+
+        ppr = dict(self.default_ppr)
+        ppr.update(style_ppr)
+        num_id = direct.get('numId', ppr.get('numId'))
+        if num_id and num_id != '0':
+            ppr.update(self.numbering_props(num_id, direct.get('ilvl', ppr.get('ilvl'))))
+            ppr['numbered'] = True
+        ppr.update(direct)
+        ppr['style'] = style_id
+
+        rpr = dict(self.default_rpr)
+        rpr.update(style_rpr)
+        return ppr, rpr
+
+    def run(self, r, paragraph_rpr):
+        rpr_el = r.find(_w('rPr'))
+        props = dict(paragraph_rpr)
+        if rpr_el is not None:
+            style_el = rpr_el.find(_w('rStyle'))
+            if style_el is not None:
+                props.update(self.style_props(style_el.get(_w('val')))[1])
+            props.update(_run_props(rpr_el))
+        return (self.font_name(props.get('font')), props.get('bold', False),
+                props.get('size', DEFAULT_SIZE_HALF_PT) / 2)
+
+@lru_cache(maxsize=65536)
+def _word_width(text, font, bold, size_pt):
+    return text_layout.string_width(text, font, bold) * size_pt / 1000
+
+@lru_cache(maxsize=16384)
+def count_lines(segments, first_width_pt, width_pt):
+    """Greedy line count for a paragraph given as ((text, font, bold, size_pt), ...)"""
+    lines = 1
+    line = 0.0
+    word = 0.0
+    limit = first_width_pt
+
+    def place(word_width, space_width):
+        nonlocal lines, line, limit
+        if line > 0 and line + word_width > limit:
+            lines += 1
+            limit = width_pt
+            line = 0.0
+        line += word_width + space_width
+
+    for text, font, bold, size in segments:
+        for piece in _PIECE_RE.findall(text):
+            if piece == '\n':
+                place(word, 0.0)
+                word = 0.0
+                lines += 1
+                limit = width_pt
+                line = 0.0
+            elif piece == '\t':
+                place(word, TAB_WIDTH_PT)
+                word = 0.0
+            elif piece[0] == ' ':
+                place(word, _word_width(piece, font, bold, size))
+                word = 0.0
+            else:
+                word += _word_width(piece, font, bold, size)
+    if word:
+        place(word, 0.0)
+    return lines
+
+def _segments(p, resolver, paragraph_rpr):
+    """Split a paragraph's runs into measurable segments; a page break starts a new segment list"""
+    t_tag, tab_tag, breaks = _w('t'), _w('tab'), (_w('br'), _w('cr'))
+    parts = [[]]
+    for r in p.iter(_w('r')):
+        style = resolver.run(r, paragraph_rpr)
+        for child in r:
+            tag = child.tag
+            if tag == t_tag:
+                parts[-1].append((child.text or '',) + style)
+            elif tag == tab_tag:
+                parts[-1].append(('\t',) + style)
+            elif tag in breaks:
+                if child.get(_w('type')) == 'page':
+                    parts.append([])
+                else:
+                    parts[-1].append(('\n',) + style)
+    return parts
+
+def _line_height(ppr, size_pt, font):
+    single = size_pt * text_layout.LINE_HEIGHTS.get(font, text_layout.LINE_HEIGHT)
+    rule = ppr.get('lineRule', 'auto')
+    line = ppr.get('line')
+    if line is None:
+        return single
+    if rule == 'exact':
+        return line / TWIPS_PER_PT
+    if rule == 'atLeast':
+        return max(line / TWIPS_PER_PT, single)
+    return single * line / 240
+
+def measure_paragraph(p, resolver, text_width_twips):
+    """Layout facts for one <w:p>: spacing, keep flags and the height of each of its lines"""
+    ppr, paragraph_rpr = resolver.paragraph(p)
+    left = ppr.get('left', 0)
+    right = ppr.get('right', 0)
+    width = (text_width_twips - left - right) / TWIPS_PER_PT
+    if ppr.get('numbered'):
+        # The number sits in the hanging indent; the text starts at the left indent
+        first_width = width
+    else:
+        first_width = width + (ppr.get('hanging', 0) - ppr.get('firstLine', 0)) / TWIPS_PER_PT
+
+    lines = []
+    breaks = []
+    default_font = resolver.font_name(paragraph_rpr.get('font'))
+    default_size = paragraph_rpr.get('size', DEFAULT_SIZE_HALF_PT) / 2
+    for i, segments in enumerate(_segments(p, resolver, paragraph_rpr)):
+        if i:
+            breaks.append(len(lines))
+        if segments:
+            size = max(s[3] for s in segments)
+            font = max(segments, key=lambda s: s[3])[1]
+            n = count_lines(tuple(segments), max(first_width, 1.0), max(width, 1.0))
+        else:
+            size, font, n = default_size, default_font, 1
+        lines.extend([_line_height(ppr, size, font)] * n)
+
+    return {
+        'style': ppr['style'],
+        'before': ppr.get('before', 0) / TWIPS_PER_PT,
+        'after': ppr.get('after', 0) / TWIPS_PER_PT,
+        'contextual': ppr.get('contextualSpacing', False),
+        'keep_next': ppr.get('keepNext', False),
+        'keep_lines': ppr.get('keepLines', False),
+        'break_before': ppr.get('pageBreakBefore', False),
+        'page_breaks': breaks,
+        'lines': lines,
+    }
+
+def measure_table(tbl, resolver):
+    """Row heights of a <w:tbl>; rows are treated as unsplittable"""
+    grid = [int(col.get(_w('w'), 0)) for col in tbl.iter(_w('gridCol'))]
+    rows = []
+    for tr in tbl.iterchildren(_w('tr')):
+        col = 0
+        height = 0.0
+        for tc in tr.iterchildren(_w('tc')):
+            span_el = tc.find('%s/%s' % (_w('tcPr'), _w('gridSpan')))
+            span = int(span_el.get(_w('val'))) if span_el is not None else 1
+            width = sum(grid[col:col + span]) - 2 * CELL_MARGIN_TWIPS
+            col += span
+            cell = 0.0
+            for p in tc.iterchildren(_w('p')):
+                m = measure_paragraph(p, resolver, width)
+                cell += m['before'] + sum(m['lines']) + m['after']
+            height = max(height, cell)
+        tr_height = tr.find('%s/%s' % (_w('trPr'), _w('trHeight')))
+        if tr_height is not None:
+            height = max(height, int(tr_height.get(_w('val'), 0)) / TWIPS_PER_PT)
+        rows.append(height)
+    return rows
+
+def _page_geometry(body):
+    """(text width in twips, text height in points) of the body's final section"""
+    sect_pr = body.find(_w('sectPr'))
+    pg_sz = sect_pr.find(_w('pgSz')) if sect_pr is not None else None
+    pg_mar = sect_pr.find(_w('pgMar')) if sect_pr is not None else None
+
+    def twips(el, attr, default):
+        return int(el.get(_w(attr))) if el is not None and el.get(_w(attr)) is not None else default
+
+    width = twips(pg_sz, 'w', 12240) - twips(pg_mar, 'left', 1440) - twips(pg_mar, 'right', 1440)
+    height = twips(pg_sz, 'h', 15840) - twips(pg_mar, 'top', 1440) - twips(pg_mar, 'bottom', 1440)
+    return width, height / TWIPS_PER_PT
+
+def layout(body, resolver):
+    """Stack the body's paragraphs and table rows onto pages; returns the page/line tallies"""
+    text_width, page_height = _page_geometry(body)
+    blocks = []
+    for el in body:
+        if el.tag == _w('p'):
+            blocks.append(('p', measure_paragraph(el, resolver, text_width)))
+        elif el.tag == _w('tbl'):
+            blocks.append(('tbl', measure_table(el, resolver)))
+
+    pages = 1
+    y = 0.0
+    pending_after = 0.0
+    previous = None
+    line_total = 0
+
+    def new_page():
+        nonlocal pages, y, pending_after
+        pages += 1
+        y = 0.0
+        pending_after = 0.0
+
+    for i, (kind, block) in enumerate(blocks):
+        if kind == 'tbl':
+            y += pending_after
+            for row in block:
+                if y + row > page_height and y > 0:
+                    new_page()
+                y += row
+            pending_after = 0.0
+            previous = None
+            continue
+
+        m = block
+        if m['break_before'] and y > 0:
+            new_page()
+        if m['contextual'] and previous is not None and previous['style'] == m['style']:
+            gap = 0.0
+        else:
+            gap = pending_after + m['before']
+        if y == 0:
+            # Space before is suppressed at the top of a page
+            gap = 0.0
+
+        lines = m['lines']
+        needed = gap + (sum(lines) if m['keep_lines'] or m['keep_next'] else lines[0])
+        if m['keep_next'] and i + 1 < len(blocks) and blocks[i + 1][0] == 'p':
+            following = blocks[i + 1][1]
+            needed += m['after'] + following['before'] + following['lines'][0]
+        if y + needed > page_height and y > 0 and needed <= page_height:
+            new_page()
+            gap = 0.0
+
+        y += gap
+        for n, line in enumerate(lines):
+            if n in m['page_breaks']:
+                new_page()
+            elif y + line > page_height and y > 0:
+                new_page()
+            y += line
+        line_total += len(lines)
+        pending_after = m['after']
+        previous = m
+
+    return {
+        'pages': pages,
+        'lines': line_total,
+        'paragraphs': sum(1 for kind, _ in blocks if kind == 'p'),
+        'tables': sum(1 for kind, _ in blocks if kind == 'tbl'),
+        'last_page_fill': y / page_height if page_height else 0.0,
+    }
+
+@lru_cache(maxsize=8)
+def _resolver_for_parts(styles_xml, numbering_xml, theme_xml):
+    """Resolvers for files on disk, shared across documents built from the same template"""
+    return StyleResolver(etree.fromstring(styles_xml),
+                         etree.fromstring(numbering_xml) if numbering_xml else None,
+                         etree.fromstring(theme_xml) if theme_xml else None)
+
+def _theme_part_name(zf):
+    rels = etree.fromstring(zf.read('word/_rels/document.xml.rels'))
+    for rel in rels.iter('{%s}Relationship' % RELS_NS):
+        if rel.get('Type') == THEME_REL:
+            return 'word/' + rel.get('Target').lstrip('/')
+    return None
+
+def estimate_file(path):
+    """Layout tallies for a .docx on disk (path or file object)"""
+    with zipfile.ZipFile(path) as zf:
+        names = set(zf.namelist())
+        theme = _theme_part_name(zf)
+        resolver = _resolver_for_parts(
+            zf.read('word/styles.xml'),
+            zf.read('word/numbering.xml') if 'word/numbering.xml' in names else None,
+            zf.read(theme) if theme in names else None,
+        )
+        document = etree.fromstring(zf.read('word/document.xml'))
+    return layout(document.find(_w('body')), resolver)
+
+def estimate_document(doc):
+    """Layout tallies for an in-memory python-docx Document"""
+    try:
+        numbering = doc.part.numbering_part.element
+    except NotImplementedError:
+        numbering = None
+    theme = None
+    for rel in doc.part.rels.values():
+        if rel.reltype == THEME_REL:
+            theme = etree.fromstring(rel.target_part.blob)
+    resolver = StyleResolver(doc.styles.element, numbering, theme)
+    return layout(doc.element.body, resolver)
+
+def estimate_pages(doc_or_path):
+    """Estimated page count of a python-docx Document or a .docx path"""
+    if hasattr(doc_or_path, 'element'):
+        return estimate_document(doc_or_path)['pages']
+    return estimate_file(doc_or_path)['pages']
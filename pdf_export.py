@@ -0,0 +1,289 @@
+"""PDF export through a pool of warm headless LibreOffice instances.
+
+Starting soffice costs seconds, and converting costs far less, so each instance starts
+once and then converts many files over its UNO socket. Every instance has its own
+user profile and a dedicated thread that feeds it jobs from a shared queue. A job that
+runs past its timeout gets its instance killed. A job whose instance crashes is
+retried once on a fresh instance. Either way the instance is restarted, so one bad
+file cannot stall the pool.
+
+Needs LibreOffice and its Python bridge (the `uno` module, e.g. python3-uno). Both are
+imported/launched only when a pool starts.
+"""
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+DEFAULT_TIMEOUT = 120
+STARTUP_TIMEOUT = 60
+SOFFICE_CANDIDATES = (
+    'soffice',
+    'libreoffice',
+    '/usr/lib/libreoffice/program/soffice',
+    '/Applications/LibreOffice.app/Contents/MacOS/soffice',
+    r'C:\Program Files\LibreOffice\program\soffice.exe',
+)
+
+PDF_FILTERS = {
+    '.docx': 'writer_pdf_Export',
+    '.doc': 'writer_pdf_Export',
+    '.odt': 'writer_pdf_Export',
+    '.pptx': 'impress_pdf_Export',
+    '.ppt': 'impress_pdf_Export',
+    '.odp': 'impress_pdf_Export',
+    '.xlsx': 'calc_pdf_Export',
+}
+
+class ConversionError(Exception):
+    pass
+
+class ConversionTimeout(ConversionError):
+    pass
+
+def find_soffice():
+    """Path of the soffice binary: $SOFFICE, then PATH and the usual install locations"""
+    for candidate in ((os.environ.get('SOFFICE'),) + SOFFICE_CANDIDATES):
+        if not candidate:
+            continue
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    raise ConversionError("LibreOffice (soffice) not found; install it or set $SOFFICE")
+
+def _uno():
+    try:
+        import uno
+    except ImportError:
+        raise ConversionError("LibreOffice's Python bridge (the uno module) is not importable; "
+                              "run with LibreOffice's python or install python3-uno") from None
+    return uno
+
+def check_available(soffice=None):
+    """Raise ConversionError unless both soffice and the uno bridge are usable"""
+    _uno()
+    return soffice or find_soffice()
+
+def pdf_path_for(path, out_dir=None):
+    base = os.path.splitext(os.path.basename(path))[0] + '.pdf'
+    return os.path.join(out_dir or os.path.dirname(os.path.abspath(path)), base)
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def _props(**kwargs):
+    from com.sun.star.beans import PropertyValue
+    values = []
+    for name, value in kwargs.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        values.append(prop)
+    return tuple(values)
+
+class OfficeInstance:
+    """One headless soffice process and its UNO desktop"""
+
+    def __init__(self, soffice=None):
+        self.soffice = soffice or find_soffice()
+        self.process = None
+        self.desktop = None
+        self.profile_dir = None
+        self.conversions = 0
+        self.restarts = -1
+
+    def start(self):
+        uno = _uno()
+
+        self.profile_dir = tempfile.mkdtemp(prefix='pdf_export_profile_')
+        port = _free_port()
+        self.process = subprocess.Popen(
+            [self.soffice, '--headless', '--invisible', '--nologo', '--norestore', '--nodefault',
+             '--nolockcheck', f'-env:UserInstallation={uno.systemPathToFileUrl(self.profile_dir)}',
+             f'--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext('com.sun.star.bridge.UnoUrlResolver', local)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(f'uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext')
+                break
+            except Exception:
+                if self.process.poll() is not None:
+                    raise ConversionError(f"soffice exited during startup (code {self.process.returncode})")
+                if time.monotonic() > deadline:
+                    self.kill()
+                    raise ConversionError(f"soffice did not accept connections within {STARTUP_TIMEOUT}s")
+                time.sleep(0.1)
+        self.desktop = ctx.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', ctx)
+        self.restarts += 1
+
+    def convert(self, src, dst):
+        uno = _uno()
+
+        ext = os.path.splitext(src)[1].lower()
+        if ext not in PDF_FILTERS:
+            raise ConversionError(f"no PDF filter for {ext} files")
+        # Write next to the target and rename, so a killed conversion never leaves a partial PDF
+        tmp = dst + '.part'
+        doc = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(src)), '_blank', 0, _props(Hidden=True, ReadOnly=True))
+        if doc is None:
+            raise ConversionError(f"LibreOffice could not open {src}")
+        stored = False
+        try:
+            doc.storeToURL(uno.systemPathToFileUrl(os.path.abspath(tmp)), _props(FilterName=PDF_FILTERS[ext]))
+            stored = True
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        finally:
+            # Close even a rejected document: the warm instance outlives this conversion.
+            # A close failing in the wake of a store error must not replace that error.
+            try:
+                doc.close(True)
+            except BaseException:
+                if stored:
+                    if os.path.exists(tmp):
+                        os.unlink(tmp)
+                    raise
+        os.replace(tmp, dst)
+        self.conversions += 1
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def kill(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+    def stop(self):
+        if self.desktop is not None and self.alive():
+            try:
+                self.desktop.terminate()
+                self.process.wait(10)
+            except Exception:
+                pass
+        self.kill()
+        self.desktop = None
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+class ConverterPool:
+    """Fan PDF conversions out over `size` warm soffice instances; submit() returns a Future of the PDF path"""
+
+    def __init__(self, size=2, timeout=DEFAULT_TIMEOUT, soffice=None):
+        self.timeout = timeout
+        self._jobs = queue.Queue()
+        self._instances = [OfficeInstance(soffice) for _ in range(size)]
+        self._threads = []
+        try:
+            for instance in self._instances:
+                instance.start()
+        except BaseException:
+            for instance in self._instances:
+                instance.stop()
+            raise
+        for i, instance in enumerate(self._instances):
+            thread = threading.Thread(target=self._serve, args=(instance,), name=f'soffice-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, src, dst=None, timeout=None):
+        future = Future()
+        self._jobs.put((src, dst or pdf_path_for(src), self.timeout if timeout is None else timeout, future))
+        return future
+
+    def convert_all(self, paths, out_dir=None):
+        """Convert many files; returns [(src, pdf path or None, error or None)] in input order"""
+        futures = [(src, self.submit(src, pdf_path_for(src, out_dir))) for src in paths]
+        results = []
+        for src, future in futures:
+            try:
+                results.append((src, future.result(), None))
+            except Exception as exc:
+                results.append((src, None, f"{type(exc).__name__}: {exc}"))
+        return results
+
+    def _run(self, instance, src, dst, timeout):
+        """One conversion under a watchdog that kills the instance when the timeout expires"""
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            instance.kill()
+
+        watchdog = threading.Timer(timeout, expire) if timeout else None
+        if watchdog:
+            watchdog.start()
+        try:
+            instance.convert(src, dst)
+        except Exception:
+            if timed_out.is_set():
+                raise ConversionTimeout(f"exceeded {timeout}s converting {src}")
+            raise
+        finally:
+            if watchdog:
+                watchdog.cancel()
+
+    def _serve(self, instance):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            src, dst, timeout, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            for attempt in (1, 2):
+                try:
+                    if not instance.alive():
+                        instance.restart()
+                    self._run(instance, src, dst, timeout)
+                    future.set_result(dst)
+                    break
+                except ConversionTimeout as exc:
+                    future.set_exception(exc)
+                    break
+                except Exception as exc:
+                    # Only a crashed instance earns a retry; a file LibreOffice rejects fails as is
+                    if instance.alive() or attempt == 2:
+                        future.set_exception(exc)
+                        break
+            if not instance.alive():
+                try:
+                    instance.restart()
+                except Exception:
+                    pass
+
+    def stats(self):
+        return [{'conversions': i.conversions, 'restarts': i.restarts, 'alive': i.alive()} for i in self._instances]
+
+    def close(self):
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        for instance in self._instances:
+            instance.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,480 @@
+"""Command-line entry point for the deck and memo generators.
+
+Only argparse and the standard library load at startup; python-pptx and python-docx are
+imported inside the subcommand that needs them.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Wall-clock budget for `render.py --help` in a fresh interpreter
+STARTUP_BUDGET_SECONDS = 0.25
+HEAVY_MODULES = ('pptx', 'docx', 'numpy', 'pandas', 'lxml')
+# package_writer.COMPRESSION_PROFILES, listed here so --help does not import it
+COMPRESSION_CHOICES = ('fast', 'default', 'archive', 'store')
+
+def _profiled(args, render):
+    """Run render(), recording spans into <args.profile>.json/.folded when --profile is given"""
+    if not args.profile:
+        return render()
+    import instrumentation
+    with instrumentation.recording(memory=args.profile_memory) as recorder:
+        status = render()
+    paths = instrumentation.write_profile(recorder, args.profile)
+    print(f"✓ Profile: {paths[0]} (span tree), {paths[1]} (folded stacks for flame graphs)")
+    for name, entry in list(recorder.summary().items())[:args.profile_top]:
+        print(f"  {name:<40} {entry['calls']:>5} calls {entry['ms']:>9.1f} ms total {entry['self_ms']:>9.1f} ms self")
+    return status
+
+def cmd_deck(args):
+    return _profiled(args, lambda: _render_deck(args))
+
+def _deck_spec(args):
+    """The deck spec selected by --spec/--native-charts/--survey, or None for the built-in DECK_SPEC"""
+    import create_investor_deck
+    spec = None
+    if args.spec:
+        with open(args.spec) as f:
+            spec = json.load(f)
+    if args.native_charts:
+        spec = [dict(s, native=True) if s['type'] == 'bar_chart' else s
+                for s in (create_investor_deck.DECK_SPEC if spec is None else spec)]
+    if args.survey:
+        import survey_data
+        stats = survey_data.load_survey(args.survey)['stats']
+        spec = survey_data.apply_survey_stats(create_investor_deck.DECK_SPEC if spec is None else spec, stats)
+    return spec
+
+def _render_deck(args):
+    import create_investor_deck
+    spec = _deck_spec(args)
+    create_investor_deck.main(args.output or create_investor_deck.DEFAULT_OUTPUT, spec, args.template,
+                              args.compression)
+    return 0
+
+# Modules a preview depends on, reloaded in this order by --watch when their source changes
+PREVIEW_MODULES = ('text_layout', 'deck_theme', 'create_investor_deck', 'deck_preview')
+
+def _write_preview(args, html_path, png_path):
+    import deck_preview
+    start = time.perf_counter()
+    written = deck_preview.preview_spec(_deck_spec(args), html_path, png_path, args.svg_dir, args.template,
+                                        args.columns, args.thumb_width)
+    print(f"✓ Preview in {(time.perf_counter() - start) * 1000:.0f} ms: "
+          f"{', '.join(written[:3])}{f' (+{len(written) - 3} more)' if len(written) > 3 else ''}")
+
+def cmd_preview(args):
+    html_path, png_path = args.html, args.png
+    if not (html_path or png_path or args.svg_dir):
+        html_path = 'deck_preview.html'
+    _write_preview(args, html_path, png_path)
+    if not args.watch:
+        return 0
+
+    # Re-render in this warm process whenever the spec or the builder/preview code changes
+    import importlib
+    watched = [os.path.join(HERE, name + '.py') for name in PREVIEW_MODULES] + [p for p in (args.spec,) if p]
+
+    def mtimes():
+        return [os.stat(path).st_mtime_ns for path in watched]
+
+    print(f"… watching {len(watched)} files (Ctrl-C to stop)")
+    seen = mtimes()
+    try:
+        while True:
+            time.sleep(0.25)
+            current = mtimes()
+            if current == seen:
+                continue
+            seen = current
+            try:
+                for name in PREVIEW_MODULES:
+                    importlib.reload(sys.modules[name])
+                _write_preview(args, html_path, png_path)
+            except Exception as exc:
+                print(f"✗ {type(exc).__name__}: {exc}")
+    except KeyboardInterrupt:
+        return 0
+
+def cmd_memo(args):
+    return _profiled(args, lambda: _render_memo(args))
+
+def _render_memo(args):
+    import MEM_Inc_VC_Financing_Memorandum as memo
+    context = None
+    if args.context:
+        with open(args.context) as f:
+            context = json.load(f)
+    memo.main(args.output or memo.DEFAULT_OUTPUT, context, stream=args.stream, template=args.template,
+              compression=args.compression)
+    return 0
+
+def cmd_survey(args):
+    import survey_data
+    survey = survey_data.load_survey(args.workbook, None if args.no_cache else survey_data.DEFAULT_CACHE_DIR)
+    if args.records:
+        print(json.dumps(survey, indent=2))
+    elif args.answers:
+        print(json.dumps({'stats': survey['stats'], 'answers': survey['answers']}, indent=2))
+    else:
+        print(json.dumps(survey['stats'], indent=2))
+    if args.audit or args.review:
+        import survey_classify
+        rows = survey_data.audit_trail(survey['records'])
+        if args.audit:
+            with open(args.audit, 'w') as f:
+                f.writelines(json.dumps(row) + '\n' for row in rows)
+            print(f"✓ Wrote {len(rows)} audit rows to {args.audit}")
+        if args.review:
+            for row in rows:
+                if row['category'] != survey_classify.BLANK and row['confidence'] < survey_classify.REVIEW_THRESHOLD:
+                    print(f"? {row['scheme']}: {row['answer']!r} -> {row['category']} ({row['confidence']:.2f})")
+    return 0
+
+def cmd_patch(args):
+    import deck_patch
+    if args.list:
+        print('\n'.join(deck_patch.list_shape_names(args.deck)))
+        return 0
+    updates = {}
+    for assignment in args.updates:
+        name, _, value = assignment.partition('=')
+        if name.endswith(':fill'):
+            updates.setdefault(name[:-5], {})['fill'] = value
+        else:
+            updates.setdefault(name, {})['text'] = value.replace('\\n', '\n')
+    start = time.perf_counter()
+    try:
+        patched = deck_patch.patch_deck(args.deck, updates, args.output)
+    except KeyError as exc:
+        print(f"✗ {exc.args[0]}")
+        return 1
+    print(f"✓ Patched {len(patched)} shapes in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+def cmd_pages(args):
+    import page_estimate
+    over = 0
+    for path in args.documents:
+        start = time.perf_counter()
+        est = page_estimate.estimate_file(path)
+        elapsed = (time.perf_counter() - start) * 1000
+        flag = ''
+        if args.max_pages and est['pages'] > args.max_pages:
+            flag = f"  ✗ over {args.max_pages}-page budget"
+            over += 1
+        print(f"{path}: ~{est['pages']} pages, {est['lines']} lines, {est['paragraphs']} paragraphs "
+              f"({elapsed:.1f} ms){flag}")
+    return 1 if over else 0
+
+def cmd_batch(args):
+    import batch_render
+    return batch_render.main([args.manifest, '--timeout', str(args.timeout), '--pdf-workers', str(args.pdf_workers)]
+                             + (['--workers', str(args.workers)] if args.workers else [])
+                             + (['--cache-dir', args.cache_dir] if args.cache_dir is not None else []))
+
+def cmd_pdf(args):
+    import pdf_export
+    start = time.perf_counter()
+    try:
+        pool = pdf_export.ConverterPool(args.workers, args.timeout)
+    except pdf_export.ConversionError as exc:
+        print(f"✗ {exc}")
+        return 1
+    with pool:
+        results = pool.convert_all(args.documents, args.out_dir)
+    failed = 0
+    for src, pdf, error in results:
+        if error:
+            failed += 1
+            print(f"✗ {src}: {error}")
+        else:
+            print(f"✓ {pdf}")
+    print(f"✓ {len(results) - failed}/{len(results)} converted in {time.perf_counter() - start:.2f}s "
+          f"on {args.workers} soffice instances")
+    return 1 if failed else 0
+
+def cmd_simulate(args):
+    import monte_carlo
+    params = {}
+    for assignment in args.params:
+        name, _, value = assignment.partition('=')
+        params[name] = json.loads(value)
+    start = time.perf_counter()
+    summary = monte_carlo.simulate(args.paths, params, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    print(f"{summary['paths']:,} paths in {elapsed:.2f}s; {summary['reached_series_a']:.1%} reach a Series A, "
+          f"SAFE better for founders in {summary['safe_better']:.1%} of those")
+    print(f"  Expected founder stake over all paths (failures as $0): SAFE "
+          f"${summary['safe']['founder_value']['expected']:.1f}M, "
+          f"priced ${summary['priced']['founder_value']['expected']:.1f}M")
+    print("  Over the paths that reach a Series A:")
+    for metric, stat, safe, priced in monte_carlo.summary_rows(summary, monte_carlo.PERCENTILES):
+        print(f"  {metric:<36} {stat:>4}  SAFE {safe:>9}  priced {priced:>9}")
+    return 0
+
+def cmd_serve(args):
+    import render_service
+    render_service.serve(args.host, args.port, args.workers, args.max_concurrent, args.timeout,
+                         cache_bytes=args.cache_mb * 1024 * 1024, verbose=args.verbose, template_dir=args.template_dir)
+    return 0
+
+def cmd_queue(args):
+    import job_queue
+    if args.action == 'enqueue':
+        with open(args.manifest) as f:
+            manifest = json.load(f)
+        jobs = manifest['jobs'] if isinstance(manifest, dict) else manifest
+        queue = job_queue.JobQueue(args.db)
+        ids = queue.enqueue(jobs, args.batch, args.max_attempts)
+        print(f"✓ Enqueued {len(ids)} jobs into {args.db}")
+    elif args.action == 'work':
+        start = time.perf_counter()
+        attempted = job_queue.run_workers(args.db, args.out_dir, args.workers, lease=args.lease,
+                                          cache_dir=args.cache_dir, exit_when_empty=not args.forever)
+        print(f"✓ {sum(attempted)} jobs attempted by {len(attempted)} workers in {time.perf_counter() - start:.2f}s")
+        queue = job_queue.JobQueue(args.db)
+    else:
+        queue = job_queue.JobQueue(args.db)
+        if args.action == 'retry-failed':
+            print(f"✓ Requeued {queue.requeue_failed(args.batch)} failed jobs")
+    counts = queue.counts(args.batch)
+    print(', '.join(f"{n} {status}" for status, n in counts.items()))
+    for job_id, job, attempts, error in queue.failures(args.batch):
+        print(f"✗ [{job_id}] {job.get('kind')} -> {job.get('output')} after {attempts} attempts: {error}")
+    queue.close()
+    return 1 if counts['failed'] else 0
+
+def cmd_repack(args):
+    import tempfile
+    import package_writer
+    if args.output and len(args.documents) > 1:
+        print("✗ --output needs a single document")
+        return 1
+    failed = 0
+    for path in args.documents:
+        output = args.output or path
+        report = {}
+        # Repack under a temporary name and rename, so an interrupted run never truncates the input
+        fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(output)[1],
+                                        dir=os.path.dirname(os.path.abspath(output)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                package_writer.repack(path, f, args.compression, args.workers, report)
+            before = os.path.getsize(path)
+            os.replace(tmp_path, output)
+        except Exception as exc:
+            os.unlink(tmp_path)
+            print(f"✗ {path}: {type(exc).__name__}: {exc}")
+            failed += 1
+            continue
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        print(f"✓ {output}: {before:,} -> {os.path.getsize(output):,} bytes "
+              f"({args.compression}; {report['bytes_saved']:,} bytes saved by compression, "
+              f"{report['stored']} parts stored, {report['parallel_chunks']} parallel chunks, "
+              f"{report['seconds'] * 1000:.1f} ms)")
+    return 1 if failed else 0
+
+def cmd_retheme(args):
+    import deck_theme
+    colors, major_font, minor_font = deck_theme.load_theme(args.theme)
+    start = time.perf_counter()
+    try:
+        output = deck_theme.retheme(args.deck, colors, major_font, minor_font, args.output, args.compression)
+    except ValueError as exc:
+        print(f"✗ {exc}")
+        return 1
+    print(f"✓ Rethemed {output} ({len(colors)} colours"
+          f"{', fonts ' + '/'.join(f for f in (major_font, minor_font) if f) if major_font or minor_font else ''}) "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+def cmd_startup_check(args):
+    """Time `render.py --help` in fresh interpreters and fail if it exceeds the budget or loads heavy modules"""
+    probe = (
+        "import sys, runpy; sys.argv = ['render.py', '--help']\n"
+        "try:\n"
+        "    runpy.run_path(%r, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('loaded:' + ','.join(m for m in %r if m in sys.modules))\n"
+    ) % (os.path.join(HERE, 'render.py'), HEAVY_MODULES)
+
+    timings = []
+    loaded = ''
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout
+        timings.append(time.perf_counter() - start)
+        loaded = out.rsplit('loaded:', 1)[-1].strip()
+
+    best = min(timings)
+    print(f"startup: best {best * 1000:.1f} ms over {args.runs} runs (budget {args.budget * 1000:.0f} ms)")
+    if loaded:
+        print(f"✗ heavy modules imported at startup: {loaded}")
+        return 1
+    if best > args.budget:
+        print("✗ startup over budget")
+        return 1
+    print("✓ startup within budget")
+    return 0
+
+def add_profile_arguments(parser):
+    parser.add_argument('--profile', metavar='PREFIX',
+                        help="record per-stage/per-builder spans to PREFIX.json and PREFIX.folded")
+    parser.add_argument('--profile-memory', action='store_true', help="also trace allocated bytes (slower)")
+    parser.add_argument('--profile-top', type=int, default=15, help="spans to list in the printed summary")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='render.py', description="Render the investor deck and financing memo")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    deck = sub.add_parser('deck', help="render the investor deck (.pptx)")
+    deck.add_argument('-o', '--output', help="output path (default: next to the script)")
+    deck.add_argument('--spec', help="JSON deck spec (default: the built-in DECK_SPEC)")
+    deck.add_argument('--template', help="base .pptx to build on (default: python-pptx's blank template)")
+    deck.add_argument('--native-charts', action='store_true', help="draw bar charts as native chart objects")
+    deck.add_argument('--survey', nargs='?', const=os.path.join(HERE, 'Question for PPM survey.xlsx'),
+                      help="fill survey-backed stats from the workbook (default: the bundled PPM survey)")
+    deck.add_argument('--compression', default='default', choices=COMPRESSION_CHOICES,
+                      help="zip profile: fast for interactive use, archive for the smallest files")
+    add_profile_arguments(deck)
+    deck.set_defaults(func=cmd_deck)
+
+    preview = sub.add_parser('preview', help="render a deck spec to SVG/HTML and PNG contact sheets, without office software")
+    preview.add_argument('--spec', help="JSON deck spec (default: the built-in DECK_SPEC)")
+    preview.add_argument('--template', help="base .pptx to build on (default: python-pptx's blank template)")
+    preview.add_argument('--native-charts', action='store_true', help="draw bar charts as native chart objects")
+    preview.add_argument('--survey', nargs='?', const=os.path.join(HERE, 'Question for PPM survey.xlsx'),
+                         help="fill survey-backed stats from the workbook (default: the bundled PPM survey)")
+    preview.add_argument('--html', help="one page with every slide as inline SVG (default: deck_preview.html)")
+    preview.add_argument('--png', help="PNG contact sheet of every slide")
+    preview.add_argument('--svg-dir', help="write one .svg per slide into this directory")
+    preview.add_argument('--columns', type=int, default=4, help="contact sheet columns")
+    preview.add_argument('--thumb-width', type=int, default=320, help="contact sheet thumbnail width in px")
+    preview.add_argument('--watch', action='store_true',
+                         help="keep running and re-render when the spec or the slide builders change")
+    preview.set_defaults(func=cmd_preview)
+
+    memo = sub.add_parser('memo', help="render the financing memorandum (.docx)")
+    memo.add_argument('-o', '--output', help="output path (default: next to the script)")
+    memo.add_argument('--context', help="JSON object overriding DEFAULT_CONTEXT (company, date, figures, ...)")
+    memo.add_argument('--template', help="base .docx to build on (default: python-docx's blank template)")
+    memo.add_argument('--stream', action='store_true', help="write the body section by section (bounded memory)")
+    memo.add_argument('--compression', default='default', choices=COMPRESSION_CHOICES,
+                      help="zip profile: fast for interactive use, archive for the smallest files")
+    add_profile_arguments(memo)
+    memo.set_defaults(func=cmd_memo)
+
+    survey = sub.add_parser('survey', help="parse the survey workbook and print the computed stats")
+    survey.add_argument('workbook', nargs='?', default=os.path.join(HERE, 'Question for PPM survey.xlsx'))
+    survey.add_argument('--records', action='store_true', help="print respondent records as well")
+    survey.add_argument('--answers', action='store_true', help="print per-question answer category tallies")
+    survey.add_argument('--audit', metavar='PATH',
+                        help="write each distinct answer's classification and evidence as JSONL")
+    survey.add_argument('--review', action='store_true', help="list answers classified with low confidence")
+    survey.add_argument('--no-cache', action='store_true')
+    survey.set_defaults(func=cmd_survey)
+
+    patch = sub.add_parser('patch', help="patch text/fills of a generated deck by stable shape name")
+    patch.add_argument('deck')
+    patch.add_argument('updates', nargs='*', metavar='NAME=TEXT|NAME:fill=HEX|SLOT',
+                       help="e.g. executive-summary/block0/stat2/value=88%%")
+    patch.add_argument('-o', '--output', help="write to a new file instead of patching in place")
+    patch.add_argument('--list', action='store_true', help="list the deck's shape names")
+    patch.set_defaults(func=cmd_patch)
+
+    pages = sub.add_parser('pages', help="estimate page counts of .docx files from font metrics")
+    pages.add_argument('documents', nargs='+')
+    pages.add_argument('--max-pages', type=int, help="exit non-zero if any document is estimated over this")
+    pages.set_defaults(func=cmd_pages)
+
+    batch = sub.add_parser('batch', help="render a JSON manifest of jobs across a process pool")
+    batch.add_argument('manifest')
+    batch.add_argument('-j', '--workers', type=int, default=None)
+    batch.add_argument('--timeout', type=float, default=120)
+    batch.add_argument('--pdf-workers', type=int, default=1, help="warm soffice instances for jobs with \"pdf\": true")
+    batch.add_argument('--cache-dir', nargs='?', const='', default=None,
+                       help="reuse unchanged documents from a render cache (default dir: .render_cache)")
+    batch.set_defaults(func=cmd_batch)
+
+    queue = sub.add_parser('queue', help="durable SQLite job queue shared by workers on any number of hosts")
+    queue.add_argument('action', choices=('enqueue', 'work', 'status', 'retry-failed'))
+    queue.add_argument('manifest', nargs='?', help="batch manifest to enqueue (outputs relative to --out-dir)")
+    queue.add_argument('--db', default='render_queue.sqlite', help="queue database (on shared storage for many hosts)")
+    queue.add_argument('--batch', help="label jobs on enqueue; filter status/retry-failed")
+    queue.add_argument('--max-attempts', type=int, default=3)
+    queue.add_argument('-d', '--out-dir', default='.', help="shared directory that job outputs are written under")
+    queue.add_argument('-j', '--workers', type=int, default=None, help="worker processes on this host")
+    queue.add_argument('--lease', type=float, default=60, help="seconds a claim lasts without a heartbeat")
+    queue.add_argument('--cache-dir', help="reuse unchanged documents from this render cache")
+    queue.add_argument('--forever', action='store_true', help="keep polling for new jobs instead of exiting when idle")
+    queue.set_defaults(func=cmd_queue)
+
+    pdf = sub.add_parser('pdf', help="convert .docx/.pptx files to PDF on a pool of warm LibreOffice instances")
+    pdf.add_argument('documents', nargs='+')
+    pdf.add_argument('-d', '--out-dir', help="write PDFs here (default: next to each document)")
+    pdf.add_argument('-j', '--workers', type=int, default=2, help="soffice instances")
+    pdf.add_argument('--timeout', type=float, default=120, help="per-document timeout in seconds")
+    pdf.set_defaults(func=cmd_pdf)
+
+    simulate = sub.add_parser('simulate', help="Monte Carlo of Series A outcomes, SAFE vs priced seed")
+    simulate.add_argument('-n', '--paths', type=int, default=10_000_000)
+    simulate.add_argument('--seed', type=int, default=0)
+    simulate.add_argument('-j', '--workers', type=int, default=None, help="processes (default: all cores)")
+    simulate.add_argument('params', nargs='*', metavar='NAME=VALUE',
+                          help="override monte_carlo.DEFAULT_PARAMS, values as JSON (e.g. cap=10 failure_rate=0.4)")
+    simulate.add_argument('--json', action='store_true', help="print the full summary as JSON")
+    simulate.set_defaults(func=cmd_simulate)
+
+    serve = sub.add_parser('serve', help="HTTP service rendering decks and memos on warm workers")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('-j', '--workers', type=int, default=None, help="render processes (default: all cores)")
+    serve.add_argument('--max-concurrent', type=int, default=None,
+                       help="renders admitted at once; more wait, then get 503 (default: 2 per worker)")
+    serve.add_argument('--timeout', type=float, default=30, help="per-render timeout in seconds")
+    serve.add_argument('--cache-mb', type=int, default=64, help="in-memory cache of recent outputs (0 disables)")
+    serve.add_argument('--template-dir', help="directory of templates clients may name (default: none accepted)")
+    serve.add_argument('-v', '--verbose', action='store_true', help="log every request")
+    serve.set_defaults(func=cmd_serve)
+
+    repack = sub.add_parser('repack', help="rewrite .pptx/.docx files under another compression profile")
+    repack.add_argument('documents', nargs='+')
+    repack.add_argument('--compression', default='archive', choices=COMPRESSION_CHOICES)
+    repack.add_argument('-o', '--output', help="output path (single document; default: in place)")
+    repack.add_argument('-j', '--workers', type=int, default=None, help="compression threads (default: all cores)")
+    repack.set_defaults(func=cmd_repack)
+
+    retheme = sub.add_parser('retheme', help="rebrand a generated deck by swapping its theme colours/fonts")
+    retheme.add_argument('deck')
+    retheme.add_argument('--theme', required=True,
+                         help='JSON: {"colors": {"accent1": "0F766E", ...}, "fonts": {"major": ..., "minor": ...}}')
+    retheme.add_argument('-o', '--output', help="write to a new file instead of rewriting in place")
+    retheme.add_argument('--compression', default='default', choices=COMPRESSION_CHOICES)
+    retheme.set_defaults(func=cmd_retheme)
+
+    startup = sub.add_parser('startup-check', help="check CLI startup time against the import budget")
+    startup.add_argument('--budget', type=float, default=STARTUP_BUDGET_SECONDS, help="seconds")
+    startup.add_argument('--runs', type=int, default=5)
+    startup.set_defaults(func=cmd_startup_check)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.path.insert(0, HERE)
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""On-disk, content-addressed cache of rendered documents.
+
+Rendering is deterministic (see package_writer), so a document is fully determined by
+its inputs and the code that renders it. The cache key is a SHA-256 over:
+
+- the job kind and its inputs (deck spec, or the resolved memo context with its date);
+- the bytes of any custom template;
+- GENERATOR_VERSION and a digest of this package's Python sources.
+
+Editing the generator therefore invalidates every entry without anyone having to
+remember to bump the version. Artifacts live at <dir>/<key[:2]>/<key><ext>. They are
+written to a temporary file and renamed into place, so concurrent workers and killed
+jobs never leave a partial entry behind.
+"""
+import functools
+import glob
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Bump to invalidate the cache for changes the source digest cannot see (e.g. a library upgrade)
+GENERATOR_VERSION = '1'
+
+DEFAULT_CACHE_DIR = os.path.join(HERE, '.render_cache')
+
+@functools.lru_cache(maxsize=None)
+def source_digest():
+    """SHA-256 over every .py file next to this one, in name order"""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(HERE, '*.py'))):
+        digest.update(os.path.basename(path).encode() + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def cache_key(kind, inputs, template=None):
+    """Hex key for rendering `inputs` (JSON-serializable) as `kind` on `template`"""
+    payload = {
+        'kind': kind,
+        'inputs': inputs,
+        'template': _file_digest(template) if template else None,
+        'generator': GENERATOR_VERSION,
+        'source': source_digest(),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+class RenderCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def path(self, key, ext):
+        return os.path.join(self.directory, key[:2], key + ext)
+
+    def fetch(self, key, output):
+        """Copy the cached artifact for key to output; False on a miss"""
+        cached = self.path(key, os.path.splitext(output)[1])
+        try:
+            shutil.copyfile(cached, output)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def store(self, key, artifact):
+        """Add a freshly rendered file under key"""
+        cached = self.path(key, os.path.splitext(artifact)[1])
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cached), suffix='.part')
+        os.close(fd)
+        try:
+            shutil.copyfile(artifact, tmp)
+            os.replace(tmp, cached)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return cached
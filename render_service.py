@@ -0,0 +1,372 @@
+"""Local HTTP render service: decks and memos on demand from a pool of warm workers.
+
+    POST /deck   {"spec": [...], "template": name, "compression": "fast"}  -> .pptx bytes
+    POST /memo   {"context": {...}, "stream": false, "template": name, "compression": "fast"}  -> .docx bytes
+    GET  /stats  request counts and latency percentiles per endpoint
+    GET  /health
+
+Every field is optional and falls back to the built-in deck spec or memo context. A
+template is a file name inside the directory the service was started with
+(--template-dir). Clients never pass filesystem paths, and without a template directory
+the field is rejected. The
+worker processes import python-pptx/python-docx and parse the templates once, when
+they start (batch_render._warm_worker). A request renders in memory and the bytes go
+straight back to the client, with no temp files.
+
+Admission is bounded by a semaphore. A request that cannot get a slot within
+QUEUE_TIMEOUT gets 503, and a render that runs past its timeout gets 504. A slot is
+held until its render really ends, not until the client gives up. If a worker is
+still stuck on a render when the client times out (hung in C code, past its alarm),
+that worker is killed. The pool then starts a fresh one and the slot is freed.
+Renders are deterministic, so identical requests are answered from a small in-memory
+LRU of recent outputs, keyed like the on-disk render cache. /stats reports cache-hit
+latency separately from render latency. Responses use the 'fast' zip
+profile unless the request asks for another: a few percent larger, but quicker to save.
+"""
+import collections
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import batch_render
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_PORT = 8765
+DEFAULT_TIMEOUT = 30
+QUEUE_TIMEOUT = 5
+LATENCY_WINDOW = 1000
+RESULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_COMPRESSION = 'fast'
+TEMPLATE_EXTENSIONS = {'deck': ('.pptx', '.potx'), 'memo': ('.docx', '.dotx')}
+
+CONTENT_TYPES = {
+    'deck': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    'memo': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+class RequestError(Exception):
+    pass
+
+# Worker side: where each worker announces (task id, pid) when it starts a render
+_started = None
+
+def _init_worker(started):
+    global _started
+    _started = started
+    batch_render._warm_worker()
+
+def _run_task(renderer, task_id, kind, payload, timeout):
+    """Announce which process runs this task, so a hung one can be killed, then render"""
+    _started.put((task_id, os.getpid()))
+    return renderer(kind, payload, timeout)
+
+def render_request(kind, payload, timeout):
+    """Render one request inside a worker and return the document bytes"""
+    signal.alarm(max(1, int(timeout)) if timeout else 0)
+    try:
+        if kind == 'deck':
+            import create_investor_deck
+            return create_investor_deck.build_deck(payload.get('spec'), None, payload.get('template'),
+                                                   payload.get('compression', DEFAULT_COMPRESSION))
+        import MEM_Inc_VC_Financing_Memorandum as memo
+        return memo.build_memo(payload.get('context'), None, stream=payload.get('stream', False),
+                               template=payload.get('template'),
+                               compression=payload.get('compression', DEFAULT_COMPRESSION))
+    finally:
+        signal.alarm(0)
+
+def resolve_template(template_dir, kind, name):
+    """Absolute path of an allow-listed template, from the plain file name a client sent"""
+    if name is None:
+        return None
+    if template_dir is None:
+        raise RequestError("this service does not accept templates")
+    if not isinstance(name, str) or os.path.basename(name) != name or name.startswith('.'):
+        raise RequestError("template must be a file name inside the template directory")
+    if not name.lower().endswith(TEMPLATE_EXTENSIONS[kind]):
+        raise RequestError(f"a {kind} template must be one of {', '.join(TEMPLATE_EXTENSIONS[kind])}")
+    path = os.path.realpath(os.path.join(template_dir, name))
+    if os.path.dirname(path) != os.path.realpath(template_dir) or not os.path.isfile(path):
+        raise RequestError(f"no template {name!r}")
+    return path
+
+def _resolve_payload(kind, payload):
+    """A memo payload with its context resolved, so the cache key and the worker's memo agree across midnight"""
+    if kind != 'memo':
+        return payload
+    import MEM_Inc_VC_Financing_Memorandum as memo
+    return dict(payload, context=memo.memo_context(payload.get('context')))
+
+def _request_inputs(kind, payload):
+    """What the output of a resolved payload depends on, as fed to render_cache.cache_key"""
+    compression = payload.get('compression', DEFAULT_COMPRESSION)
+    if kind == 'deck':
+        return {'spec': payload.get('spec'), 'compression': compression}
+    return {'context': payload['context'], 'stream': payload.get('stream', False), 'compression': compression}
+
+class ResultCache:
+    """LRU of rendered bytes, bounded by total size"""
+
+    def __init__(self, max_bytes=RESULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                return
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, old = self._items.popitem(last=False)
+                self.size -= len(old)
+
+def _percentiles_ms(latencies):
+    latencies = sorted(latencies)
+    out = {f'p{q}': latencies[min(len(latencies) - 1, int(len(latencies) * q / 100))] * 1000 for q in (50, 90, 99)}
+    out['max'] = latencies[-1] * 1000
+    out['window'] = len(latencies)
+    return out
+
+class LatencyStats:
+    """Per-endpoint counters and sliding windows of latencies, one window per source ('render' or 'cache')"""
+
+    SOURCES = ('render', 'cache')
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._latencies = collections.defaultdict(lambda: collections.deque(maxlen=window))
+        self._counts = collections.defaultdict(collections.Counter)
+
+    def record(self, endpoint, status, seconds=None, source='render'):
+        with self._lock:
+            self._counts[endpoint][status] += 1
+            if seconds is not None:
+                self._latencies[endpoint, source].append(seconds)
+
+    def snapshot(self):
+        """Per endpoint: status counts, render latency ('latency_ms') and cache-hit latency ('cache_hit_ms')"""
+        with self._lock:
+            out = {}
+            for endpoint, counts in self._counts.items():
+                entry = {'requests': dict(counts)}
+                for source, field in zip(self.SOURCES, ('latency_ms', 'cache_hit_ms')):
+                    if self._latencies[endpoint, source]:
+                        entry[field] = _percentiles_ms(self._latencies[endpoint, source])
+                out[endpoint] = entry
+            return out
+
+class RenderService:
+    def __init__(self, workers=None, max_concurrent=None, timeout=DEFAULT_TIMEOUT,
+                 queue_timeout=QUEUE_TIMEOUT, cache_bytes=RESULT_CACHE_BYTES, template_dir=None,
+                 renderer=render_request):
+        self.workers = workers or os.cpu_count() or 1
+        self.template_dir = os.path.realpath(template_dir) if template_dir else None
+        # Runs in the workers as renderer(kind, payload, timeout) -> bytes
+        self.renderer = renderer
+        # Let a few requests queue at the pool so a worker never idles between them
+        self.max_concurrent = max_concurrent or self.workers * 2
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.stats = LatencyStats()
+        self.results = ResultCache(cache_bytes) if cache_bytes else None
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._task_ids = itertools.count(1)
+        self._task_pids = {}
+        self.workers_killed = 0
+        self._started = multiprocessing.SimpleQueue()
+        self.pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(self._started,))
+        threading.Thread(target=self._track_started, daemon=True).start()
+
+    def _track_started(self):
+        while True:
+            notice = self._started.get()
+            if notice is None:
+                return
+            task_id, pid = notice
+            with self._lock:
+                # A task that already ended (or was abandoned) has nothing left to track
+                if task_id in self._task_pids:
+                    self._task_pids[task_id] = pid
+
+    def _finished(self, task_id):
+        """Free a task's slot exactly once: when its render ends, or when its stuck worker is killed"""
+        with self._lock:
+            if task_id not in self._task_pids:
+                return
+            del self._task_pids[task_id]
+            self._in_flight -= 1
+        self._slots.release()
+
+    def _abandon(self, task_id):
+        """The client gave up on a task; kill its worker if it is still running it"""
+        with self._lock:
+            pid = self._task_pids.get(task_id)
+        if pid is None:
+            # Not started yet: it will run under its own alarm and free the slot when it ends
+            return
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.workers_killed += 1
+        # The pool replaces the dead worker; the task's own callback will never run
+        self._finished(task_id)
+
+    def render(self, kind, payload):
+        """Document bytes for a request and whether they came from the result cache"""
+        if kind not in CONTENT_TYPES:
+            raise RequestError(f"unknown document kind {kind!r}")
+        payload = _resolve_payload(kind, dict(payload, template=resolve_template(self.template_dir, kind,
+                                                                                 payload.get('template'))))
+        key = None
+        if self.results is not None:
+            import render_cache
+            key = render_cache.cache_key(kind, _request_inputs(kind, payload), payload['template'])
+            data = self.results.get(key)
+            if data is not None:
+                return data, True
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise OverflowError("render queue is full")
+        task_id = next(self._task_ids)
+        with self._lock:
+            self._in_flight += 1
+            self._task_pids[task_id] = None
+        done = lambda _: self._finished(task_id)
+        async_result = self.pool.apply_async(_run_task, (self.renderer, task_id, kind, payload, self.timeout),
+                                             callback=done, error_callback=done)
+        try:
+            # The worker's alarm normally fires first; the grace covers a worker that hangs in C code
+            data = async_result.get(self.timeout + batch_render.LOST_WORKER_GRACE)
+        except multiprocessing.TimeoutError:
+            self._abandon(task_id)
+            raise
+        if key is not None:
+            self.results.put(key, data)
+        return data, False
+
+    def snapshot(self):
+        return {
+            'workers': self.workers,
+            'max_concurrent': self.max_concurrent,
+            'in_flight': self._in_flight,
+            'workers_killed': self.workers_killed,
+            'cached_results': len(self.results) if self.results else 0,
+            'endpoints': self.stats.snapshot(),
+        }
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        self._started.put(None)
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = 'RenderService/1'
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, body, content_type='application/json', headers=()):
+        if not isinstance(body, bytes):
+            body = (json.dumps(body, indent=2) + '\n').encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send(200, self.service.snapshot())
+        elif self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        else:
+            self._send(404, {'error': f"no such endpoint {self.path}"})
+
+    def do_POST(self):
+        kind = self.path.strip('/')
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(payload, dict):
+                raise RequestError("request body must be a JSON object")
+            data, cached = self.service.render(kind, payload)
+        except (RequestError, ValueError, KeyError) as exc:
+            self.service.stats.record(kind, 400)
+            self._send(400, {'error': f"{type(exc).__name__}: {exc}"})
+            return
+        except OverflowError as exc:
+            self.service.stats.record(kind, 503)
+            self._send(503, {'error': str(exc)}, headers=[('Retry-After', '1')])
+            return
+        except (multiprocessing.TimeoutError, batch_render.JobTimeout):
+            self.service.stats.record(kind, 504)
+            self._send(504, {'error': f"render exceeded {self.service.timeout}s"})
+            return
+        except Exception as exc:
+            self.service.stats.record(kind, 500)
+            self._send(500, {'error': f"{type(exc).__name__}: {exc}"})
+            return
+        elapsed = time.perf_counter() - start
+        self.service.stats.record(kind, 200, elapsed, 'cache' if cached else 'render')
+        filename = 'deck.pptx' if kind == 'deck' else 'memo.docx'
+        self._send(200, data, CONTENT_TYPES[kind], headers=[
+            ('Content-Disposition', f'attachment; filename="{filename}"'),
+            ('X-Render-Ms', f"{elapsed * 1000:.1f}"),
+            ('X-Render-Cache', 'hit' if cached else 'miss'),
+        ])
+
+class RenderServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service, verbose=False):
+        super().__init__(address, RenderHandler)
+        self.service = service
+        self.verbose = verbose
+
+def serve(host='127.0.0.1', port=DEFAULT_PORT, workers=None, max_concurrent=None, timeout=DEFAULT_TIMEOUT,
+          cache_bytes=RESULT_CACHE_BYTES, verbose=False, template_dir=None):
+    sys.path.insert(0, HERE)
+    service = RenderService(workers, max_concurrent, timeout, cache_bytes=cache_bytes, template_dir=template_dir)
+    server = RenderServer((host, port), service, verbose)
+    print(f"✓ Render service on http://{host}:{server.server_port} "
+          f"({service.workers} workers, {service.max_concurrent} concurrent renders)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,334 @@
+"""Classify free-text survey answers into canonical categories, with confidence and an audit trail.
+
+Interview answers are messy: "Yes ( purchased by yourself) + employer + personal
+policy", "No (husband, son)", "through work", "not sure, unnatural". Each answer is
+normalized (Unicode, case, quotes, whitespace) and scored against two precompiled
+indexes:
+
+- phrase indexes: the multi-word and regex rules, grouped by the character they can
+  start with and compiled into one alternation per group, so each word start tries
+  only the few rules that could match there. Negation, uncertainty and condition
+  phrases are matched in a first pass, and everything else runs on what they leave.
+  Matched spans are blanked out, which keeps "sure" in "not sure" from also counting
+  as a yes, and "i have" in "i have no idea" from counting at all;
+- a keyword index: a dict from single words to the categories they vote for, looked
+  up once per remaining token.
+
+A negation or uncertainty marker scopes the rest of its clause: "no idea what term
+means" records "term" with zero weight instead of answering term. A condition
+qualifies a yes where the question allows it, so "sure, if it's free" is conditional
+interest.
+
+The first word of an answer carries LEADING_BOOST times its weight, because "No
+(husband, son)" answers no before it explains. A scheme names the categories that
+can be an answer to its question (yes/no/unsure for "Do you have life insurance?").
+The highest-scoring of them is the answer's category. Its confidence is that score
+over all candidate evidence plus a small prior, so a single weak keyword never
+reaches 1.0. All other categories with evidence are kept as labels: an employer
+mention in a yes/no answer still counts toward employer plans. Every hit is recorded
+as (rule, category, matched text, weight) so a tally can be traced back to the words
+that produced it.
+
+Batches are deduplicated before classification. Real answer columns repeat a lot
+("yes", "no", "-"), so only distinct normalized strings are scored, and the tally is
+a count over those weighted by multiplicity.
+
+Known limitation: scoring is per answer, in Python and re, not vectorized. Distinct
+answers classify at about 20k/s on one core; only repeats (served from the cache) are
+faster. That is ample for interview columns but short of a bulk rate of hundreds of
+thousands of distinct answers a second.
+"""
+import bisect
+import functools
+import re
+import unicodedata
+from collections import Counter
+
+UNCLASSIFIED = 'unclassified'
+BLANK = 'blank'
+
+# Weight multiplier for a hit on the answer's first word
+LEADING_BOOST = 2.0
+# Added to the evidence total when computing confidence, so thin evidence stays below 1
+CONFIDENCE_PRIOR = 0.5
+# Distinct (scheme, answer) results kept per classifier; the cache is dropped when it fills
+CACHE_LIMIT = 200_000
+# Answers under this confidence are listed for review by the survey CLI
+REVIEW_THRESHOLD = 0.6
+
+# (category, weight, patterns). A pattern that is one plain word goes into the keyword
+# index. Anything else is a regex in the phrase index, matched on word boundaries.
+RULES = (
+    ('yes', 1.0, ('yes', 'yeah', 'yep', 'yup', 'sure', 'definitely', 'absolutely', 'ok', 'okay',
+                  r'i (?:do|did|have)')),
+    ('no', 1.0, ('no', 'nope', 'nah', 'not at all', 'no need', 'not really',
+                 r"(?:don'?t|do not) (?:really )?(?:have|need|want)")),
+    ('no', 2.0, (r"(?:don'?t|do not) think so", r'not that i know of', r'of course not')),
+    ('no', 0.5, ('none', 'never')),
+    ('unsure', 2.0, (r'not (?:really |quite |too |very )?sure', r'no (?:clue|idea)', r"(?:don'?t|do not) know",
+                     r'not certain', r'little to no', r'have no idea')),
+    ('unsure', 1.0, ('unsure', 'maybe', 'idk', 'perhaps', 'whatever', 'unclear')),
+    ('conditional', 1.5, (r'if (?:it|they|i|you|that|there)', r'i (?:guess|suppose)', 'depends', r'only if',
+                          r'as long as', r'provided (?:that|it)', r'depending on')),
+    ('employer', 2.0, (r'through (?:my |your |the )?(?:work|job|employer|emplyer|company|benefits?)',
+                       'open enrollment', r'standard (?:benefit )?plan', r'employer[- ](?:provided|sponsored)')),
+    ('employer', 1.0, ('employer', 'emplyer', 'work', 'job', 'benefits', 'benefit', 'hr', 'workplace')),
+    ('self', 2.0, (r'(?:purchased|bought|buy|got) (?:it )?(?:by )?(?:my|your)self', 'personal policy',
+                   r'directly from', r'on (?:my|our) own', r'own policy')),
+    ('self', 1.0, ('myself', 'yourself', 'personal', 'individual', 'directly', 'website', 'online')),
+    ('family', 1.0, ('wife', 'husband', 'spouse', 'son', 'daughter', 'parents', 'parent', 'mother', 'father',
+                     'mom', 'dad', 'family', 'fiance', 'fiancee', 'partner')),
+    ('agent', 1.0, ('agent', 'broker', 'advisor', 'adviser', 'planner')),
+    ('term', 2.0, (r'term(?: life)?(?: policy| insurance)?', r'\d+[- ]?(?:year|yr)s? term')),
+    ('whole', 2.0, (r'whole(?: life)?', 'permanent', r'cash value')),
+    ('universal', 2.0, (r'universal(?: life)?', r'variable(?: life)?')),
+    ('never', 2.0, ('never', r'no (?:interactions?|correspondence|contact|communication)', 'hardly ever',
+                    r'no one reaches out', r'never heard', r"(?:don'?t|dont) think i have ever")),
+    ('annual', 2.0, (r'once a year', r'annual(?:ly)?', r'every year', 'yearly', r'once per year')),
+    ('occasional', 1.0, ('sometimes', 'occasionally', 'rarely', r'few times')),
+    ('payroll', 2.0, (r'(?:deducted|dedecuted|deduct|taken) (?:out )?(?:from|of) (?:my |the )?pay ?checks?',
+                      'paycheck', 'payroll', r'pay ?check')),
+    ('autopay', 2.0, (r'auto[- ]?pay', r'automatic(?:ally)?', r'direct debit')),
+    ('check', 1.0, (r'(?:by|a) check', r'check at')),
+    ('cost', 1.0, ('cost', 'costs', 'price', 'expensive', 'afford', 'affordability', 'premium', 'premiums')),
+    ('trust', 1.0, ('trust', 'payout', 'delay', 'delays', 'claim', 'claims')),
+    ('complexity', 1.0, ('clauses', 'jargon', 'confusing', r'not clear', 'complicated', r'edge cases')),
+)
+
+# Negation, uncertainty and condition rules. Their phrases are matched before any other
+# rule, so "not sure" is never read as "sure" and "i have no idea" never as "i have".
+SCOPE_CATEGORIES = ('no', 'unsure', 'conditional', 'never')
+# A negation or uncertainty marker turns the rest of its clause into mentions: in "no idea
+# what term means" the word "term" is kept as zero-weight evidence, not as an answer.
+NEGATING_CATEGORIES = ('no', 'unsure')
+# Evidence that qualifies another category where the scheme allows it: "sure, if it's
+# free" is a conditional yes, but still a plain yes to "Do you have life insurance?".
+QUALIFIERS = {'conditional': 'yes'}
+
+# Categories that can be the answer to each question family, in tie-break order
+SCHEMES = {
+    'yes_no': ('yes', 'no', 'unsure'),
+    'has_insurance': ('yes', 'no', 'unsure'),
+    'policy_type': ('term', 'whole', 'universal', 'unsure', 'no'),
+    'purchase_channel': ('employer', 'self', 'family', 'agent', 'unsure'),
+    'contact_frequency': ('never', 'annual', 'occasional', 'unsure'),
+    'premium_payment': ('payroll', 'autopay', 'check', 'no'),
+    'interest': ('yes', 'conditional', 'no', 'unsure'),
+    'concerns': ('cost', 'trust', 'complexity', 'no'),
+}
+
+# Evidence that means another category within one scheme ("no" to "how often" is never)
+SCHEME_ALIASES = {
+    'contact_frequency': {'no': 'never'},
+}
+
+_NUMERIC_RE = re.compile(r'^[\d.,:/%-]+$')
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_WORD_START_RE = re.compile(r'\b\w')
+_CLAUSE_RE = re.compile(r'[,;.!?()]|\bbut\b')
+_ANY_LEAD = 'abcdefghijklmnopqrstuvwxyz0123456789'
+_SPACE_RE = re.compile(r'\s+')
+_QUOTES = str.maketrans({'’': "'", '‘': "'", '“': '"', '”': '"', '–': '-', '—': '-', ' ': ' '})
+_BLANK_ANSWERS = frozenset(('', '-', '--', 'n/a', 'na', '.', '?'))
+
+def normalize(text):
+    """Canonical form of an answer: NFKC, lower case, plain quotes and dashes, single spaces"""
+    text = unicodedata.normalize('NFKC', str(text)).translate(_QUOTES).lower()
+    return _SPACE_RE.sub(' ', text).strip()
+
+def _is_keyword(pattern):
+    return pattern.isalpha()
+
+def _lead_chars(pattern):
+    """Characters a phrase rule can start with: its first letter, the first letter of each
+    alternative of a leading (?:a|b) group, or digits for \\d. Anything else may start anywhere."""
+    if pattern[0].isalnum():
+        return pattern[0]
+    if pattern.startswith(r'\d'):
+        return '0123456789'
+    if pattern.startswith('(?:'):
+        depth, alternatives, current = 0, [], ''
+        for ch in pattern[3:]:
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                if not depth:
+                    break
+                depth -= 1
+            elif ch == '|' and not depth:
+                alternatives.append(current)
+                current = ''
+                continue
+            current += ch
+        alternatives.append(current)
+        if all(alt and alt[0].isalnum() for alt in alternatives):
+            return ''.join(sorted({alt[0] for alt in alternatives}))
+    return _ANY_LEAD
+
+class Classifier:
+    """Precompiled phrase and keyword indexes over a rule table"""
+
+    def __init__(self, rules=RULES, schemes=SCHEMES, aliases=SCHEME_ALIASES):
+        self.schemes = schemes
+        self.aliases = aliases
+        self.keywords = {}
+        self._phrase_rules = []
+        for category, weight, patterns in rules:
+            for pattern in patterns:
+                if _is_keyword(pattern):
+                    self.keywords.setdefault(pattern, []).append((category, weight))
+                else:
+                    self._phrase_rules.append((category, weight, pattern))
+        scoped = [i for i, rule in enumerate(self._phrase_rules) if rule[0] in SCOPE_CATEGORIES]
+        others = [i for i, rule in enumerate(self._phrase_rules) if rule[0] not in SCOPE_CATEGORIES]
+        self.phrase_indexes = (self._phrase_index(scoped), self._phrase_index(others))
+        self._cache = {}
+
+    def _phrase_index(self, rule_ids):
+        """{lead character: compiled alternation} over the given phrase rules"""
+        # Longer alternatives first, so "not sure" wins over a shorter rule starting at the same place.
+        # Phrases are bucketed by the characters they can start with, so each word start only tries
+        # the few alternatives that could match there rather than the whole table.
+        buckets = {}
+        for i in sorted(rule_ids, key=lambda i: -len(self._phrase_rules[i][2])):
+            pattern = self._phrase_rules[i][2]
+            for ch in _lead_chars(pattern):
+                buckets.setdefault(ch, []).append(f'(?P<r{i}>{pattern})')
+        return {ch: re.compile('(?:' + '|'.join(group) + r')(?![a-z])') for ch, group in buckets.items()}
+
+    def _evidence(self, normalized):
+        """[(rule, category, matched text, weight)] for a normalized answer, in text order"""
+        hits = []
+        first = _TOKEN_RE.search(normalized)
+        first_start = first.start() if first else -1
+        remainder = normalized
+        for index in self.phrase_indexes:
+            blanked = list(remainder)
+            end = 0
+            for start in _WORD_START_RE.finditer(remainder):
+                pos = start.start()
+                pattern = index.get(remainder[pos]) if pos >= end else None
+                match = pattern.match(remainder, pos) if pattern else None
+                if match:
+                    category, weight, rule = self._phrase_rules[int(match.lastgroup[1:])]
+                    boost = LEADING_BOOST if pos == first_start else 1.0
+                    hits.append((pos, rule, category, match.group(), weight * boost, True))
+                    end = match.end()
+                    blanked[pos:end] = ' ' * (end - pos)
+            remainder = ''.join(blanked)
+        for token in _TOKEN_RE.finditer(remainder):
+            word = token.group()
+            for category, weight in self.keywords.get(word, ()):
+                boost = LEADING_BOOST if token.start() == first_start else 1.0
+                hits.append((token.start(), word, category, word, weight * boost, category == 'no'))
+        hits.sort(key=lambda hit: hit[0])
+        # Everything after a negation or uncertainty marker, up to the end of its clause, is demoted.
+        # Uncertain keywords ("maybe", "whatever") hedge without negating, so only phrases and
+        # negation words open a scope.
+        bounds = [m.start() for m in _CLAUSE_RE.finditer(normalized)]
+        evidence, negated = [], None
+        for pos, rule, category, matched, weight, scoping in hits:
+            clause = bisect.bisect_right(bounds, pos)
+            if negated == clause and category not in SCOPE_CATEGORIES:
+                weight = 0.0
+            elif scoping and category in NEGATING_CATEGORIES:
+                negated = clause
+            evidence.append((rule, category, matched, weight))
+        return evidence
+
+    def _score(self, normalized, scheme):
+        if normalized in _BLANK_ANSWERS:
+            return {'category': BLANK, 'confidence': 1.0, 'labels': (), 'evidence': (), 'normalized': normalized}
+        evidence = self._evidence(normalized)
+        scores = {}
+        for _, category, _, weight in evidence:
+            if weight:
+                scores[category] = scores.get(category, 0.0) + weight
+        for source, target in self.aliases.get(scheme, {}).items():
+            if source in scores:
+                scores[target] = scores.get(target, 0.0) + scores.pop(source)
+        candidates = self.schemes[scheme]
+        for qualifier, qualified in QUALIFIERS.items():
+            if qualifier in scores and qualified in scores and qualifier in candidates:
+                scores[qualifier] += scores.pop(qualified)
+        # max() keeps the first of equal scores, so ties go to the scheme's order
+        best = max(candidates, key=lambda c: scores.get(c, 0.0))
+        if best not in scores:
+            category = 'numeric' if _NUMERIC_RE.match(normalized) else UNCLASSIFIED
+            return {'category': category, 'confidence': 0.0, 'labels': tuple(sorted(scores)),
+                    'evidence': tuple(evidence), 'normalized': normalized}
+        total = sum(scores.get(c, 0.0) for c in candidates)
+        return {
+            'category': best,
+            'confidence': round(scores[best] / (total + CONFIDENCE_PRIOR), 3),
+            'labels': tuple(sorted(scores)),
+            'evidence': tuple(evidence),
+            'normalized': normalized,
+        }
+
+    def classify(self, text, scheme='yes_no'):
+        """Classification dict for one answer: category, confidence, labels, evidence, normalized text"""
+        if scheme not in self.schemes:
+            raise ValueError(f"unknown scheme {scheme!r}; expected one of {', '.join(self.schemes)}")
+        normalized = normalize(text) if text is not None else ''
+        key = (scheme, normalized)
+        result = self._cache.get(key)
+        if result is None:
+            if len(self._cache) >= CACHE_LIMIT:
+                self._cache.clear()
+            result = self._cache[key] = self._score(normalized, scheme)
+        return result
+
+    def classify_batch(self, answers, scheme='yes_no'):
+        """Classify a sequence of answers, scoring each distinct one once
+
+        Returns {'results': classification per answer (shared dicts, in input order),
+        'tally': Counter of categories, 'labels': Counter of every label, 'unique': distinct answers}.
+        """
+        counts = Counter(answers)
+        by_answer = {answer: self.classify(answer, scheme) for answer in counts}
+        tally, labels = Counter(), Counter()
+        for answer, n in counts.items():
+            result = by_answer[answer]
+            tally[result['category']] += n
+            for label in result['labels']:
+                labels[label] += n
+        return {
+            'results': [by_answer[answer] for answer in answers],
+            'tally': tally,
+            'labels': labels,
+            'unique': len(by_answer),
+        }
+
+def audit_rows(answers, batch, scheme, question=None):
+    """One row per distinct answer of a classified batch, for review: what it became and why"""
+    counts = Counter(answers)
+    rows = []
+    seen = set()
+    for answer, result in zip(answers, batch['results']):
+        if answer in seen:
+            continue
+        seen.add(answer)
+        rows.append({
+            'question': question,
+            'scheme': scheme,
+            'answer': answer,
+            'normalized': result['normalized'],
+            'count': counts[answer],
+            'category': result['category'],
+            'confidence': result['confidence'],
+            'labels': list(result['labels']),
+            'evidence': [{'rule': rule, 'category': category, 'text': text, 'weight': weight}
+                         for rule, category, text, weight in result['evidence']],
+        })
+    return rows
+
+@functools.lru_cache(maxsize=None)
+def default_classifier():
+    return Classifier()
+
+def classify(text, scheme='yes_no'):
+    return default_classifier().classify(text, scheme)
+
+def classify_batch(answers, scheme='yes_no'):
+    return default_classifier().classify_batch(answers, scheme)
@@ -0,0 +1,316 @@
+"""Streaming ingestion of the PPM survey workbook.
+
+The workbook has one question per row (column A) and one respondent per column. Rows
+without a question hold free-form interview notes. The sheet XML is read with iterparse
+and each row is cleared once consumed, so memory tracks the number of respondents rather
+than the size of the export.
+
+Free-text answers are classified with survey_classify (see QUESTION_SCHEMES), and the
+stats count canonical categories rather than raw strings. "Yes ( purchased by
+yourself) + employer" is a policyholder with an employer plan, and "Dedecuted from
+Paycheck" is a payroll deduction.
+"""
+import hashlib
+import json
+import os
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+import instrumentation
+import survey_classify
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORKBOOK = os.path.join(HERE, 'Question for PPM survey.xlsx')
+DEFAULT_CACHE_DIR = os.path.join(HERE, '.survey_cache')
+
+# Bump when the parse or the stats change so old cache entries are ignored
+CACHE_VERSION = 4
+
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+HEADER_LABEL = 'Question'
+
+# Questions the deck's stat rows are computed from
+Q_HAS_INSURANCE = 'Do you have life insurance?'
+Q_AGE = 'Age'
+Q_GENDER = 'Gender'
+Q_RELATIONSHIP = 'Marriage/ relationship'
+Q_POLICY_TYPE = 'What type of life insurance policy do you currently have?'
+Q_PURCHASE = 'How did you purchase your current life insurance policy?'
+Q_BOUGHT_BY = 'If yes, did you buy it yourself or someone else in your family bought it?'
+Q_CONTACT = 'How often do you hear from or interact with your insurance provider about your policy?'
+Q_PREMIUMS = 'How do you pay your insurance premiums?'
+Q_EDUCATION = ('Would you be interested in receiving educational updates or tools from your insurer '
+               'or agent about optimizing your policy benefits?')
+Q_CONVERSION = ('Before today, did you know that many term policies can be converted to permanent '
+                'coverage without a new medical exam (within a deadline)?')
+Q_CHANGED = 'Have you ever increased or changed your coverage, or switched providers?'
+Q_CONCERNS = 'What are your biggest concerns about life insurance?'
+
+# Classification scheme (survey_classify.SCHEMES) for each free-text question
+QUESTION_SCHEMES = {
+    Q_HAS_INSURANCE: 'has_insurance',
+    Q_POLICY_TYPE: 'policy_type',
+    Q_PURCHASE: 'purchase_channel',
+    Q_BOUGHT_BY: 'purchase_channel',
+    Q_CONTACT: 'contact_frequency',
+    Q_PREMIUMS: 'premium_payment',
+    Q_EDUCATION: 'interest',
+    Q_CONVERSION: 'yes_no',
+    Q_CHANGED: 'yes_no',
+    Q_CONCERNS: 'concerns',
+}
+
+# Stat-row labels in DECK_SPEC that are backed by survey data. Text blocks quoting the
+# same figures carry 'survey_content' templates and highlights a 'survey_text' template,
+# formatted with the stats dict. Bar charts carry 'survey_data', (label, stats key) pairs
+# that replace their data.
+STAT_LABELS = {
+    'Participants Interviewed': ('respondents', '{}'),
+    'Active Policyholders': ('policyholders', '{}'),
+    'Adoption Rate': ('adoption_pct', '{:.0f}%'),
+    'Primary Interviews': ('respondents', '{}'),
+    'Average Age': ('average_age', '{:.0f}'),
+    'Female': ('female_pct', '{:.0f}%'),
+    'Employer Plans': ('employer_plan_pct', '{:.0f}%'),
+}
+
+_COLUMN_RE = re.compile(r'[A-Z]+')
+
+def _column_index(ref):
+    """'C12' -> 2"""
+    letters = _COLUMN_RE.match(ref).group()
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - 64)
+    return index - 1
+
+def _first_sheet_path(zf):
+    """Resolve the first worksheet's part name through workbook.xml and its rels"""
+    with zf.open('xl/workbook.xml') as f:
+        for _, el in iterparse(f):
+            if el.tag == SHEET_NS + 'sheet':
+                rel_id = el.get(REL_NS + 'id')
+                break
+    with zf.open('xl/_rels/workbook.xml.rels') as f:
+        for _, el in iterparse(f):
+            if el.tag == PKG_REL_NS + 'Relationship' and el.get('Id') == rel_id:
+                target = el.get('Target')
+                return target.lstrip('/') if target.startswith('/') else 'xl/' + target
+    raise ValueError("workbook has no worksheets")
+
+def _shared_strings(zf):
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, el in iterparse(f):
+            if el.tag == SHEET_NS + 'si':
+                strings.append(''.join(t.text or '' for t in el.iter(SHEET_NS + 't')))
+                el.clear()
+    return strings
+
+def iter_rows(path):
+    """Yield each sheet row as a list of cell strings (None for empty cells), streaming the sheet XML"""
+    with zipfile.ZipFile(path) as zf:
+        strings = _shared_strings(zf)
+        with zf.open(_first_sheet_path(zf)) as f:
+            for _, el in iterparse(f):
+                if el.tag != SHEET_NS + 'row':
+                    continue
+                row = []
+                for c in el.iter(SHEET_NS + 'c'):
+                    kind = c.get('t')
+                    if kind == 'inlineStr':
+                        value = ''.join(t.text or '' for t in c.iter(SHEET_NS + 't'))
+                    else:
+                        v = c.find(SHEET_NS + 'v')
+                        value = v.text if v is not None else None
+                        if value is not None and kind == 's':
+                            value = strings[int(value)]
+                    if value is not None and value.strip():
+                        col = _column_index(c.get('r')) if c.get('r') else len(row)
+                        row.extend([None] * (col + 1 - len(row)))
+                        row[col] = value
+                el.clear()
+                yield row
+
+def read_responses(path=DEFAULT_WORKBOOK):
+    """Transpose the question-major sheet into respondent-major records"""
+    respondents = None
+    records = []
+    for row in iter_rows(path):
+        if respondents is None:
+            if row and row[0] == HEADER_LABEL:
+                respondents = [name.strip() if name else f"Respondent {i}" for i, name in enumerate(row[1:], 1)]
+                records = [{'respondent': name, 'answers': {}, 'notes': []} for name in respondents]
+            continue
+        question = (row[0] or '').strip() if row else ''
+        for i, value in enumerate(row[1:len(records) + 1]):
+            if value is None:
+                continue
+            if question:
+                records[i]['answers'][question] = value.strip()
+            else:
+                records[i]['notes'].append(value.strip())
+    if respondents is None:
+        raise ValueError(f"no '{HEADER_LABEL}' header row in {path}")
+    return records
+
+def _parse_age(text):
+    """'32' -> 32, '45–54' -> 49.5"""
+    numbers = [float(n) for n in re.findall(r'\d+(?:\.\d+)?', text)]
+    return sum(numbers) / len(numbers) if numbers else None
+
+def _pct(count, total):
+    return 100.0 * count / total if total else 0.0
+
+def classify_answers(records, questions=QUESTION_SCHEMES):
+    """Per question: its scheme, the indexes of the records that answered it, and the classified batch"""
+    classifier = survey_classify.default_classifier()
+    classified = {}
+    for question, scheme in questions.items():
+        answered = [i for i, r in enumerate(records) if question in r['answers']]
+        classified[question] = {
+            'scheme': scheme,
+            'respondents': answered,
+            'batch': classifier.classify_batch([records[i]['answers'][question] for i in answered], scheme),
+        }
+    return classified
+
+def answer_tallies(classified):
+    """{question: {'scheme', 'answered', 'unique', 'categories': {category: count}}}"""
+    return {
+        question: {
+            'scheme': entry['scheme'],
+            'answered': len(entry['respondents']),
+            'unique': entry['batch']['unique'],
+            'categories': dict(entry['batch']['tally'].most_common()),
+        }
+        for question, entry in classified.items()
+    }
+
+def audit_trail(records, classified=None):
+    """Audit rows (survey_classify.audit_rows) for every classified question"""
+    classified = classified or classify_answers(records)
+    rows = []
+    for question, entry in classified.items():
+        answers = [r['answers'][question] for r in records if question in r['answers']]
+        rows.extend(survey_classify.audit_rows(answers, entry['batch'], entry['scheme'], question))
+    return rows
+
+def compute_stats(records, classified=None):
+    """Figures the deck's stat rows use, computed from respondent records"""
+    def answers(question):
+        return [r['answers'][question] for r in records if question in r['answers']]
+
+    classified = classified or classify_answers(records)
+
+    def categories(question):
+        """{record index: classification} for a classified question"""
+        entry = classified[question]
+        return dict(zip(entry['respondents'], entry['batch']['results']))
+
+    def share(question, wanted):
+        """Percent of a question's answers that fall in one of the wanted categories"""
+        results = categories(question)
+        return _pct(sum(1 for result in results.values() if result['category'] in wanted), len(results))
+
+    insured = {i for i, result in categories(Q_HAS_INSURANCE).items() if result['category'] == 'yes'}
+    def policyholders_labelled(label, questions):
+        return {i for question in questions for i, result in categories(question).items()
+                if i in insured and label in result['labels']}
+
+    # A mention in any answer about the policy's origin counts, e.g. "Yes (...) + employer + personal policy"
+    employer = policyholders_labelled('employer', (Q_HAS_INSURANCE, Q_PURCHASE, Q_BOUGHT_BY, Q_POLICY_TYPE))
+    personal = policyholders_labelled('self', (Q_HAS_INSURANCE, Q_PURCHASE, Q_BOUGHT_BY))
+    ages = [age for age in map(_parse_age, answers(Q_AGE)) if age is not None]
+    genders = [a.lower() for a in answers(Q_GENDER)]
+    relationships = [a.lower() for a in answers(Q_RELATIONSHIP)]
+
+    return {
+        'respondents': len(records),
+        'policyholders': len(insured),
+        'adoption_pct': _pct(len(insured), len(answers(Q_HAS_INSURANCE))),
+        'average_age': sum(ages) / len(ages) if ages else 0.0,
+        'female_pct': _pct(sum(1 for g in genders if g.startswith('f')), len(genders)),
+        'male_pct': _pct(sum(1 for g in genders if g.startswith('m')), len(genders)),
+        'married_pct': _pct(sum(1 for r in relationships if r.startswith('marri')), len(relationships)),
+        'single_pct': _pct(sum(1 for r in relationships if r.startswith('single')), len(relationships)),
+        'other_relationship_pct': _pct(sum(1 for r in relationships if not r.startswith(('marri', 'single'))),
+                                       len(relationships)),
+        'employer_plan_pct': _pct(len(employer), len(insured)),
+        'employer_only_pct': _pct(len(employer - personal), len(insured)),
+        'self_only_pct': _pct(len(personal - employer), len(insured)),
+        'mixed_plan_pct': _pct(len(employer & personal), len(insured)),
+        'term_policy_pct': share(Q_POLICY_TYPE, ('term',)),
+        'policy_type_unsure_pct': share(Q_POLICY_TYPE, ('unsure',)),
+        'never_contacted_pct': share(Q_CONTACT, ('never',)),
+        'annual_contact_pct': share(Q_CONTACT, ('annual',)),
+        'payroll_pct': share(Q_PREMIUMS, ('payroll',)),
+        'conversion_unaware_pct': share(Q_CONVERSION, ('no', 'unsure')),
+        'education_interest_pct': share(Q_EDUCATION, ('yes', 'conditional')),
+    }
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+@instrumentation.traced(name='data:survey')
+def load_survey(path=DEFAULT_WORKBOOK, cache_dir=DEFAULT_CACHE_DIR):
+    """Return {'records', 'stats', 'answers'} for a workbook, reusing the cached parse when its content hash matches
+
+    'answers' holds the per-question category tallies behind the stats.
+    """
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"survey-{CACHE_VERSION}-{file_digest(path)}.json")
+        if os.path.exists(cache_path):
+            with open(cache_path) as f:
+                return json.load(f)
+
+    records = read_responses(path)
+    classified = classify_answers(records)
+    survey = {'records': records, 'stats': compute_stats(records, classified),
+              'answers': answer_tallies(classified)}
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(survey, f)
+        os.replace(tmp_path, cache_path)
+    return survey
+
+def _stat_value(value, label, stats):
+    if label not in STAT_LABELS:
+        return value
+    key, fmt = STAT_LABELS[label]
+    return fmt.format(stats[key])
+
+def _survey_block(block, stats):
+    if block['type'] == 'stat_row':
+        return dict(block, stats=[(_stat_value(value, label, stats), label, color)
+                                  for value, label, color in block['stats']])
+    if 'survey_content' in block:
+        return dict(block, content=[line.format(**stats) for line in block['survey_content']])
+    if 'survey_text' in block:
+        return dict(block, text=block['survey_text'].format(**stats))
+    return block
+
+def _survey_slide(slide, stats):
+    if 'survey_data' in slide:
+        slide = dict(slide, data=[(label, round(stats[key])) for label, key in slide['survey_data']])
+    if 'blocks' in slide:
+        slide = dict(slide, blocks=[_survey_block(block, stats) for block in slide['blocks']])
+    return slide
+
+def apply_survey_stats(spec, stats):
+    """Return a copy of a deck spec with survey-backed stat rows, text and chart data filled from stats"""
+    return [_survey_slide(slide, stats) for slide in spec]
@@ -0,0 +1,55 @@
+"""Per-process pool of parsed base templates handed out as in-memory clones.
+
+Presentation() and Document() unzip and parse the bundled default template on every call.
+The pool parses each template once per process. That covers the python-pptx and
+python-docx defaults, any custom .pptx/.docx passed by path, and templates already
+prepared by a setup function (slide size, layouts, styles). Each later request gets a
+deep copy of the parsed package. The copy is a plain lxml tree copy plus a few hundred
+small Python objects, with no zip or XML parsing.
+
+Custom templates are keyed by path and modification time, so an edited file is picked up
+on the next request.
+"""
+import copy
+import os
+
+_templates = {}
+
+def _template_key(kind, path, setup):
+    if path is None:
+        return (kind, None, None, setup)
+    path = os.path.abspath(path)
+    return (kind, path, os.stat(path).st_mtime_ns, setup)
+
+def _clone(kind, path, setup, load):
+    key = _template_key(kind, path, setup)
+    template = _templates.get(key)
+    if template is None:
+        # Drop stale entries for an edited custom template
+        for stale in [k for k in _templates if k[:2] == key[:2]]:
+            del _templates[stale]
+        template = load(path)
+        if setup is not None:
+            setup(template)
+        _templates[key] = template
+    return copy.deepcopy(template)
+
+def _load_presentation(path):
+    from pptx import Presentation
+    return Presentation(path)
+
+def _load_document(path):
+    from docx import Document
+    return Document(path)
+
+def presentation(path=None, setup=None):
+    """A fresh Presentation from `path` (default template if None), after `setup(prs)` has run once"""
+    return _clone('pptx', path, setup, _load_presentation)
+
+def document(path=None, setup=None):
+    """A fresh Document from `path` (default template if None), after `setup(doc)` has run once"""
+    return _clone('docx', path, setup, _load_document)
+
+def clear():
+    """Forget every parsed template"""
+    _templates.clear()
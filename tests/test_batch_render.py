@@ -0,0 +1,45 @@
+import os
+import zipfile
+
+import batch_render
+import create_investor_deck
+
+def _interrupted_save(spec, output, template, compression):
+    with open(output, 'wb') as f:
+        f.write(b'PK\x03\x04 truncated')
+    raise batch_render.JobTimeout()
+
+def test_interrupted_render_leaves_no_output(tmp_path, monkeypatch):
+    output = tmp_path / 'deck.pptx'
+    output.write_bytes(b'previous good render')
+    monkeypatch.setattr(create_investor_deck, 'build_deck', _interrupted_save)
+    result = batch_render.run_job(0, {'kind': 'deck', 'output': str(output)}, timeout=None)
+    assert result['status'] == 'timeout'
+    assert output.read_bytes() == b'previous good render'
+    assert os.listdir(tmp_path) == ['deck.pptx']
+
+def test_rendered_and_cached_outputs_land_under_the_output_name(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    for expected_cached in (False, True):
+        output = tmp_path / f'deck-{expected_cached}.pptx'
+        result = batch_render.run_job(0, {'kind': 'deck', 'output': str(output)}, None, cache_dir)
+        assert result['status'] == 'ok' and result['cached'] is expected_cached
+        assert zipfile.ZipFile(output).testzip() is None
+    assert sorted(name for name in os.listdir(tmp_path) if name.endswith('.pptx')) == [
+        'deck-False.pptx', 'deck-True.pptx']
+
+def test_over_budget_memo_is_neither_written_nor_cached(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    output = tmp_path / 'memo.docx'
+    job = {'kind': 'memo', 'output': str(output), 'max_pages': 1,
+           'context': {'date': '2025-01-01', 'simulation_paths': 10_000}}
+    result = batch_render.run_job(0, job, None, cache_dir)
+    assert result['status'] == 'failed' and 'PageBudgetExceeded' in result['error']
+    # No output, no leftover .part file and no cache entry
+    assert not any(files for _, _, files in os.walk(tmp_path))
+
+    # Within budget the memo is built afresh, then served from the cache, and checked both times
+    for expected_cached in (False, True):
+        result = batch_render.run_job(0, dict(job, max_pages=50), None, cache_dir)
+        assert result['status'] == 'ok' and result['cached'] is expected_cached and result['pages'] > 1
+        assert zipfile.ZipFile(output).testzip() is None
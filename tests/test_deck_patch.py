@@ -0,0 +1,46 @@
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+import create_investor_deck
+import deck_patch
+
+VALUE = 'executive-summary/block0/stat2/value'
+
+@pytest.fixture
+def deck(tmp_path):
+    path = str(tmp_path / 'deck.pptx')
+    create_investor_deck.build_deck(output=path)
+    return path
+
+def _parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+def _shape(path, name):
+    return next(shape for slide in Presentation(path).slides for shape in slide.shapes if shape.name == name)
+
+def test_patch_rewrites_only_the_slide_holding_the_shape(deck, tmp_path):
+    before = _parts(deck)
+    output = str(tmp_path / 'patched.pptx')
+    assert deck_patch.patch_deck(deck, {VALUE: '91%'}, output) == [VALUE]
+
+    assert _shape(output, VALUE).text_frame.text == '91%'
+    # Its neighbours on the same slide keep their text
+    assert _shape(output, 'executive-summary/block0/stat2/label').text_frame.text == "Adoption Rate"
+    after = _parts(output)
+    assert after.keys() == before.keys()
+    changed = [name for name in before if before[name] != after[name]]
+    assert changed == ['ppt/slides/slide2.xml']
+
+def test_patch_sets_fills_in_place(deck):
+    fill = 'executive-summary/block0/stat2/accent'
+    deck_patch.patch_deck(deck, {fill: {'fill': '#123abc'}})
+    assert str(_shape(deck, fill).fill.fore_color.rgb) == '123ABC'
+
+def test_unknown_shape_raises_and_leaves_the_deck_untouched(deck):
+    before = _parts(deck)
+    with pytest.raises(KeyError, match='executive-summary/block0/stat9/value'):
+        deck_patch.patch_deck(deck, {VALUE: '91%', 'executive-summary/block0/stat9/value': 'x'})
+    assert _parts(deck) == before
@@ -0,0 +1,45 @@
+import math
+import os
+from xml.etree import ElementTree
+
+from PIL import Image
+
+import create_investor_deck
+import deck_preview
+
+def test_preview_spec_writes_every_slide(tmp_path):
+    spec = create_investor_deck.DECK_SPEC
+    html_path, png_path, svg_dir = str(tmp_path / 'deck.html'), str(tmp_path / 'deck.png'), str(tmp_path / 'svg')
+    written = deck_preview.preview_spec(spec, html_path, png_path, svg_dir)
+    prs = create_investor_deck.render_deck(spec)
+    keys = [key for key, _ in deck_preview.deck_items(prs)]
+    assert len(keys) == len(prs.slides) > len(spec)
+    assert written[:2] == [html_path, png_path] and len(written) == 2 + len(keys)
+
+    page = open(html_path, encoding='utf-8').read()
+    assert page.count('<figure>') == len(keys)
+    for i, key in enumerate(keys, 1):
+        assert f'<figcaption>{i} · {key}</figcaption>' in page
+    assert "Executive Summary" in page
+
+    svgs = sorted(os.listdir(svg_dir))
+    assert svgs == sorted(f"{i:02d}-{key}.svg" for i, key in enumerate(keys, 1))
+    for name in svgs:
+        assert ElementTree.parse(os.path.join(svg_dir, name)).getroot().tag.endswith('svg')
+
+    # One captioned thumbnail per slide on the contact sheet grid
+    columns = min(deck_preview.SHEET_COLUMNS, len(keys))
+    cell_w = deck_preview.THUMB_WIDTH + deck_preview.SHEET_MARGIN
+    cell_h = (round(prs.slide_height * deck_preview.THUMB_WIDTH / prs.slide_width)
+              + deck_preview.CAPTION_HEIGHT + deck_preview.SHEET_MARGIN)
+    with Image.open(png_path) as sheet:
+        assert sheet.size == (columns * cell_w + deck_preview.SHEET_MARGIN,
+                              math.ceil(len(keys) / columns) * cell_h + deck_preview.SHEET_MARGIN)
+
+def test_slide_png_draws_the_slide(tmp_path):
+    prs = create_investor_deck.render_deck()
+    path = deck_preview.slide_png(prs, 0, str(tmp_path / 'title.png'), width=400)
+    with Image.open(path) as image:
+        assert image.width == 400
+        # Background, shapes and text were drawn, not a blank page
+        assert len(image.getcolors(1 << 16)) > 2
@@ -0,0 +1,46 @@
+import zipfile
+
+import pytest
+from lxml import etree
+
+import create_investor_deck
+import deck_theme
+
+A = '{%s}' % deck_theme.A
+
+@pytest.fixture
+def deck(tmp_path):
+    path = str(tmp_path / 'deck.pptx')
+    create_investor_deck.build_deck(output=path)
+    return path
+
+def _parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+def _scheme(parts):
+    theme = etree.fromstring(parts['ppt/theme/theme1.xml'])
+    scheme = theme.find('a:themeElements/a:clrScheme', deck_theme.NS)
+    return {slot.tag[len(A):]: slot[0].get('val') for slot in scheme}
+
+def test_slides_refer_to_scheme_slots_not_palette_literals(deck):
+    parts = _parts(deck)
+    palette = {str(rgb) for rgb in create_investor_deck.THEME_COLORS.values()}
+    assert _scheme(parts)['accent1'] == str(create_investor_deck.EMERALD)
+    refs = set()
+    for name, data in parts.items():
+        if name.startswith('ppt/slides/slide'):
+            root = etree.fromstring(data)
+            assert not palette & {el.get('val') for el in root.iter(A + 'srgbClr')}, name
+            refs.update(el.get('val') for el in root.iter(A + 'schemeClr'))
+    assert {'accent1', 'accent2', 'accent3', 'accent4', 'tx2', 'bg1'} <= refs
+
+def test_retheme_rewrites_only_the_theme(deck, tmp_path):
+    before = _parts(deck)
+    output = str(tmp_path / 'client.pptx')
+    deck_theme.retheme(deck, {'accent1': '#0f766e', 'tx2': '111111'}, 'Georgia', 'Inter', output)
+    after = _parts(output)
+    assert _scheme(after)['accent1'] == '0F766E' and _scheme(after)['dk2'] == '111111'
+    assert [name for name in before if before[name] != after[name]] == ['ppt/theme/theme1.xml']
+    with pytest.raises(ValueError):
+        deck_theme.retheme(deck, {'accent9': '000000'})
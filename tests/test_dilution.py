@@ -0,0 +1,26 @@
+import numpy as np
+
+import dilution
+import MEM_Inc_VC_Financing_Memorandum as memo
+
+def test_safe_and_priced_agree_without_a_seed_raise():
+    safe = dilution.safe_dilution(0.0, 8.0, 0.2, 24.0, 6.0)
+    priced = dilution.priced_dilution(0.0, 8.0, 24.0, 6.0, seed_pool_target=dilution.EXISTING_POOL)
+    assert np.isclose(safe['founders'], priced['founders'])
+
+def test_dilution_table_difference_column():
+    for value, safe, priced, diff in dilution.dilution_table():
+        assert diff == safe - priced
+
+def test_memo_prose_quotes_the_dilution_table():
+    doc = memo.render_memo({'date': '2025-01-01', 'simulation_paths': 10_000})
+    text = '\n'.join(p.text for p in doc.paragraphs)
+    advantage = [diff for _, _, _, diff in dilution.dilution_table(None, 'cap')]
+    quoted = f"{min(advantage) * 100:.1f}-{max(advantage) * 100:.1f} percentage points"
+    assert text.count(quoted) == 2
+    assert '5-10%' not in text
+
+    # The rendered table shows the same extremes
+    table = next(t for t in doc.tables if t.rows[0].cells[0].text == "Valuation cap")
+    shown = [float(row.cells[3].text.split()[0]) for row in table.rows[1:]]
+    assert f"{min(shown):.1f}-{max(shown):.1f} percentage points" == quoted
@@ -0,0 +1,54 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+import MEM_Inc_VC_Financing_Memorandum as memo
+from docx_stream import StreamingDocxWriter
+
+CONTEXT = {'date': 'January 01, 2025', 'simulation_paths': 10_000}
+
+def _parts(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return [(info.filename, zf.read(info)) for info in zf.infolist()]
+
+def test_streamed_memo_matches_in_memory_part_for_part():
+    in_memory = _parts(memo.build_memo(CONTEXT))
+    streamed = _parts(memo.build_memo(CONTEXT, stream=True))
+    assert [name for name, _ in streamed] == [name for name, _ in in_memory]
+    for (name, expected), (_, actual) in zip(in_memory, streamed):
+        assert actual == expected, name
+
+class BuildFailed(Exception):
+    pass
+
+def test_failed_build_leaves_no_partial_docx(tmp_path):
+    output = tmp_path / 'memo.docx'
+    output.write_bytes(b'previous good render')
+    doc = memo.new_memo_document()
+    with pytest.raises(BuildFailed):
+        with StreamingDocxWriter(str(output), doc) as writer:
+            doc.add_paragraph("First section")
+            writer.flush()
+            raise BuildFailed()
+    assert output.read_bytes() == b'previous good render'
+    assert os.listdir(tmp_path) == ['memo.docx']
+
+def test_error_after_close_is_not_hidden(tmp_path):
+    output = tmp_path / 'memo.docx'
+    doc = memo.new_memo_document()
+    with pytest.raises(BuildFailed):
+        with StreamingDocxWriter(str(output), doc) as writer:
+            doc.add_paragraph("Only section")
+            writer.close()
+            raise BuildFailed()
+    # The finished document was already in place and stays there
+    assert zipfile.ZipFile(output).testzip() is None
+    assert os.listdir(tmp_path) == ['memo.docx']
+
+def test_failed_build_into_a_file_object_closes_cleanly():
+    buffer = io.BytesIO()
+    with pytest.raises(BuildFailed):
+        with StreamingDocxWriter(buffer, memo.new_memo_document()):
+            raise BuildFailed()
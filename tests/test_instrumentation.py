@@ -0,0 +1,33 @@
+import threading
+
+import instrumentation
+
+def test_recorder_only_collects_its_own_threads_spans():
+    seen = []
+
+    def other_thread():
+        seen.append(instrumentation.enabled())
+        with instrumentation.span('other'):
+            pass
+
+    with instrumentation.recording() as rec:
+        with instrumentation.span('outer', kind='deck'):
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join()
+            with instrumentation.span('inner'):
+                pass
+    assert seen == [False]
+    assert [(path, span.attrs) for path, span in rec._walk()] == [
+        (('outer',), {'kind': 'deck'}), (('outer', 'inner'), {})]
+    assert not instrumentation.enabled()
+
+def test_traced_records_only_while_recording():
+    @instrumentation.traced(name='step')
+    def step():
+        return instrumentation.enabled()
+
+    assert step() is False
+    with instrumentation.recording() as rec:
+        assert step() is True
+    assert list(rec.summary()) == ['step']
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import job_queue
+
+LEASE = 0.3
+
+def test_update_methods_report_rows(tmp_path):
+    queue = job_queue.JobQueue(str(tmp_path / 'queue.sqlite'))
+    (job_id,) = queue.enqueue([{'type': 'deck', 'output': 'a.pptx'}], max_attempts=1)
+    assert queue.claim('w1', LEASE)[0] == job_id
+    assert queue.heartbeat(job_id, 'w1', LEASE)
+    assert not queue.heartbeat(job_id, 'w2', LEASE)
+    assert queue.fail(job_id, 'w1', 'boom')
+    assert queue.counts()['failed'] == 1
+    assert queue.requeue_failed() == 1
+    assert queue.claim('w1', LEASE)[0] == job_id
+    assert queue.complete(job_id, 'w1', {'status': 'ok'})
+    assert not queue.complete(job_id, 'w1', {'status': 'ok'})
+    queue.close()
+
+def test_heartbeat_keeps_a_long_job_claimed(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'queue.sqlite')
+    queue = job_queue.JobQueue(db_path)
+    queue.enqueue([{'type': 'deck', 'output': 'slow.pptx'}])
+    started = threading.Event()
+    stolen = []
+
+    def slow_render(job, out_dir, timeout, cache_dir=None):
+        started.set()
+        time.sleep(LEASE * 5)
+        return {'status': 'ok', 'error': None, 'output': job['output']}
+
+    def rival():
+        started.wait()
+        rival_queue = job_queue.JobQueue(db_path)
+        deadline = time.time() + LEASE * 4
+        while time.time() < deadline:
+            claimed = rival_queue.claim('rival', LEASE)
+            if claimed:
+                stolen.append(claimed)
+            time.sleep(LEASE / 10)
+        rival_queue.close()
+
+    monkeypatch.setattr(job_queue.batch_render, '_warm_worker', lambda: None)
+    monkeypatch.setattr(job_queue, 'run_claimed', slow_render)
+    thread = threading.Thread(target=rival)
+    thread.start()
+    attempted = job_queue.work(db_path, str(tmp_path), lease=LEASE, poll=LEASE / 10)
+    thread.join()
+
+    assert attempted == 1
+    assert stolen == []
+    assert queue.counts()['done'] == 1
+    queue.close()
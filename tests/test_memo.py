@@ -0,0 +1,10 @@
+import pytest
+
+import MEM_Inc_VC_Financing_Memorandum as memo
+
+@pytest.mark.parametrize('company', ["MEM, Inc.", "Acme Robotics"])
+def test_closing_sentence_ends_with_one_full_stop(company):
+    doc = memo.render_memo({'date': '2025-01-01', 'company': company, 'simulation_paths': 10_000})
+    closing = next(p.text for p in doc.paragraphs if 'determines is optimal for' in p.text)
+    assert closing.endswith(f"optimal for {company.rstrip('.')}.")
+    assert not closing.endswith('..')
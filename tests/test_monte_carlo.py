@@ -0,0 +1,39 @@
+import pytest
+
+import monte_carlo
+import MEM_Inc_VC_Financing_Memorandum as memo
+
+PATHS = 50_000
+
+def test_every_row_is_conditional_on_reaching_series_a():
+    summary = monte_carlo.simulate(PATHS, workers=1)
+    for name in monte_carlo.STRUCTURES:
+        for metric in ('founder_value', 'investor_multiple'):
+            stats = summary[name][metric]
+            # Failed paths are not in the percentiles, only in the failure-weighted expectation
+            assert stats[10] > 0
+            assert stats['expected'] == pytest.approx(stats['mean'] * summary['reached_series_a'])
+    assert not any(cell in ('$0.0M', '0.00x') for row in monte_carlo.summary_rows(summary) for cell in row[2:])
+
+def test_same_seed_gives_the_same_summary():
+    assert monte_carlo.simulate(PATHS, seed=3, workers=1) == monte_carlo.simulate(PATHS, seed=3, workers=1)
+
+def test_memo_prose_matches_the_simulation_table():
+    doc = memo.render_memo({'date': '2025-01-01', 'simulation_paths': PATHS})
+    summary = monte_carlo.cached_simulation(PATHS)
+    paragraph = next(p.text for p in doc.paragraphs if 'outcomes for both structures' in p.text)
+    safe, priced = summary['safe']['founders'][50], summary['priced']['founders'][50]
+    assert f"{safe:.1%} with a SAFE against {priced:.1%} with a priced seed" in paragraph
+    assert f"a difference of {(safe - priced) * 100:+.1f} percentage points" in paragraph
+    assert "only the outcomes that reach a Series A" in paragraph
+
+def test_cached_simulation_evicts_the_least_recently_used(monkeypatch):
+    runs = []
+    monkeypatch.setattr(monte_carlo, 'simulate', lambda n, params, seed, workers: runs.append(seed) or {'seed': seed})
+    monkeypatch.setattr(monte_carlo, '_results', monte_carlo.collections.OrderedDict())
+    monkeypatch.setattr(monte_carlo, 'CACHE_SIZE', 2)
+    for seed in (1, 2, 1, 3, 1, 2):
+        assert monte_carlo.cached_simulation(10, seed=seed) == {'seed': seed}
+    # 1 stays warm by reuse; 2 is evicted by 3 and simulated again
+    assert runs == [1, 2, 3, 2]
+    assert len(monte_carlo._results) == 2
@@ -0,0 +1,60 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+import create_investor_deck
+import package_writer
+import render
+
+@pytest.fixture(scope='module')
+def deck():
+    return create_investor_deck.render_deck()
+
+def _parts(data_or_path):
+    source = io.BytesIO(data_or_path) if isinstance(data_or_path, bytes) else data_or_path
+    with zipfile.ZipFile(source) as zf:
+        assert zf.testzip() is None
+        return [(info.filename, info.compress_type, zf.read(info.filename)) for info in zf.infolist()]
+
+@pytest.mark.parametrize('profile', sorted(package_writer.COMPRESSION_PROFILES))
+def test_profiles_round_trip_the_same_parts(deck, profile):
+    reference = [(name, blob) for name, _, blob in _parts(package_writer.save_package(deck))]
+    parts = _parts(package_writer.save_package(deck, compression=profile))
+    assert [(name, blob) for name, _, blob in parts] == reference
+    for name, method, _ in parts:
+        level = package_writer.COMPRESSION_PROFILES[profile][package_writer.part_class(name)]
+        assert method == (zipfile.ZIP_STORED if level is None else zipfile.ZIP_DEFLATED)
+
+def test_parallel_deflate_matches_serial_output(deck, monkeypatch):
+    serial = package_writer.save_package(deck, workers=1)
+    # Split every part over 8 KiB into 2 KiB slices
+    monkeypatch.setattr(package_writer, 'PARALLEL_THRESHOLD', 8 * 1024)
+    monkeypatch.setattr(package_writer, 'PARALLEL_CHUNK', 2 * 1024)
+    report = {}
+    parallel = package_writer.save_package(deck, workers=4, report=report)
+    assert report['parallel_chunks'] > report['parallel_parts'] > 0
+    assert [(name, blob) for name, _, blob in _parts(parallel)] == [(name, blob) for name, _, blob in _parts(serial)]
+    # The slicing depends on part size only, never on the worker count
+    assert package_writer.save_package(deck, workers=1) == parallel
+
+def test_repack_replaces_the_input_atomically(deck, tmp_path, monkeypatch):
+    path = str(tmp_path / 'deck.pptx')
+    package_writer.save_package(deck, path)
+    original = open(path, 'rb').read()
+    args = render.build_parser().parse_args(['repack', path, '--compression', 'store'])
+
+    def interrupted(out, entries):
+        out.write(b'PK\x03\x04')
+        raise KeyboardInterrupt
+    monkeypatch.setattr(package_writer, '_assemble', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        args.func(args)
+    assert open(path, 'rb').read() == original
+    assert os.listdir(tmp_path) == ['deck.pptx']
+
+    monkeypatch.undo()
+    assert args.func(args) == 0
+    assert [(name, blob) for name, _, blob in _parts(path)] == [(name, blob) for name, _, blob in _parts(original)]
+    assert os.listdir(tmp_path) == ['deck.pptx']
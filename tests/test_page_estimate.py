@@ -0,0 +1,26 @@
+import io
+
+from docx import Document
+
+import MEM_Inc_VC_Financing_Memorandum as memo
+import page_estimate
+
+CONTEXT = {'date': 'January 02, 2026'}
+
+def test_default_memo_estimate_is_in_range():
+    data = memo.build_memo(memo.memo_context(CONTEXT))
+    pages = page_estimate.estimate_pages(io.BytesIO(data))
+    assert 8 <= pages <= 12
+    # The in-memory and on-disk paths agree
+    assert page_estimate.estimate_pages(memo.render_memo(memo.memo_context(CONTEXT))) == pages
+
+def test_pages_grow_with_content_and_breaks():
+    doc = Document()
+    doc.add_paragraph("Short memo.")
+    assert page_estimate.estimate_pages(doc) == 1
+    doc.add_page_break()
+    doc.add_paragraph("Second page.")
+    assert page_estimate.estimate_pages(doc) == 2
+    for _ in range(120):
+        doc.add_paragraph("A line of body text that fits on one line.")
+    assert page_estimate.estimate_pages(doc) >= 4
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+import time
+
+import render
+
+def _run(code):
+    return subprocess.run([sys.executable, '-c', code], cwd=render.HERE, capture_output=True, text=True, check=True)
+
+def test_help_starts_within_budget():
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(render.HERE, 'render.py'), '--help'],
+                       capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    assert min(timings) < render.STARTUP_BUDGET_SECONDS
+
+def test_parsing_args_imports_no_heavy_modules():
+    out = _run(
+        "import sys, render\n"
+        "parser = render.build_parser()\n"
+        "for argv in (['deck'], ['memo'], ['simulate'], ['survey'], ['batch', 'jobs.json']):\n"
+        "    parser.parse_args(argv)\n"
+        f"print(','.join(m for m in {render.HEAVY_MODULES!r} if m in sys.modules))\n"
+    ).stdout
+    assert out.strip() == ''
+    assert {'pptx', 'docx', 'numpy'} <= set(render.HEAVY_MODULES)
@@ -0,0 +1,40 @@
+import create_investor_deck
+import MEM_Inc_VC_Financing_Memorandum as memo
+import render_cache
+
+def test_rebuilds_are_byte_identical():
+    assert create_investor_deck.build_deck() == create_investor_deck.build_deck()
+    context = memo.memo_context({'date': 'January 02, 2026'})
+    assert memo.build_memo(context) == memo.build_memo(context)
+    assert memo.build_memo(context, stream=True) == memo.build_memo(context, stream=True)
+
+def test_key_changes_with_spec_template_and_generator(tmp_path, monkeypatch):
+    spec = create_investor_deck.DECK_SPEC
+    key = render_cache.cache_key('deck', {'spec': spec})
+    assert render_cache.cache_key('deck', {'spec': list(spec)}) == key
+
+    edited = [dict(spec[1], title="Summary")] + list(spec[2:])
+    assert render_cache.cache_key('deck', {'spec': edited}) != key
+
+    first, second = tmp_path / 'a.pptx', tmp_path / 'b.pptx'
+    first.write_bytes(b'template one')
+    second.write_bytes(b'template two')
+    with_template = render_cache.cache_key('deck', {'spec': spec}, str(first))
+    assert with_template != key
+    assert render_cache.cache_key('deck', {'spec': spec}, str(second)) != with_template
+
+    monkeypatch.setattr(render_cache, 'GENERATOR_VERSION', render_cache.GENERATOR_VERSION + '.1')
+    assert render_cache.cache_key('deck', {'spec': spec}) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(render_cache, 'source_digest', lambda: '0' * 64)
+    assert render_cache.cache_key('deck', {'spec': spec}) != key
+
+def test_store_and_fetch_round_trip(tmp_path):
+    cache = render_cache.RenderCache(str(tmp_path / 'cache'))
+    artifact = tmp_path / 'deck.pptx'
+    artifact.write_bytes(b'rendered')
+    key = render_cache.cache_key('deck', {'spec': []})
+    output = tmp_path / 'copy.pptx'
+    assert not cache.fetch(key, str(output))
+    cache.store(key, str(artifact))
+    assert cache.fetch(key, str(output)) and output.read_bytes() == b'rendered'
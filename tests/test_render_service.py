@@ -0,0 +1,71 @@
+import multiprocessing
+import time
+
+import pytest
+
+import batch_render
+import render_service
+
+def _hang_or_echo(kind, payload, timeout):
+    # No alarm is set here, standing in for a render stuck in C code
+    if payload.get('hang'):
+        time.sleep(60)
+    return b'ok'
+
+def _memo_date(kind, payload, timeout):
+    return repr(payload['context']['date']).encode()
+
+def test_cache_hits_do_not_mix_with_render_latency():
+    stats = render_service.LatencyStats()
+    for _ in range(9):
+        stats.record('deck', 200, 0.0002, 'cache')
+    stats.record('deck', 200, 0.3)
+    entry = stats.snapshot()['deck']
+    assert entry['requests'] == {200: 10}
+    assert entry['latency_ms']['p50'] == pytest.approx(300)
+    assert entry['latency_ms']['window'] == 1
+    assert entry['cache_hit_ms']['window'] == 9
+
+def test_templates_are_limited_to_the_template_directory(tmp_path):
+    (tmp_path / 'brand.pptx').write_bytes(b'')
+    (tmp_path / 'sub').mkdir()
+    assert render_service.resolve_template(str(tmp_path), 'deck', None) is None
+    assert render_service.resolve_template(str(tmp_path), 'deck', 'brand.pptx') == str((tmp_path / 'brand.pptx').resolve())
+    for name in ('/etc/passwd', '../brand.pptx', 'sub/brand.pptx', 'brand.docx', 'missing.pptx', '.pptx', 3):
+        with pytest.raises(render_service.RequestError):
+            render_service.resolve_template(str(tmp_path), 'deck', name)
+    with pytest.raises(render_service.RequestError):
+        render_service.resolve_template(None, 'deck', 'brand.pptx')
+
+def test_hung_worker_is_killed_and_its_slot_freed(monkeypatch):
+    monkeypatch.setattr(batch_render, '_warm_worker', lambda: None)
+    monkeypatch.setattr(batch_render, 'LOST_WORKER_GRACE', 0.2)
+    service = render_service.RenderService(workers=1, max_concurrent=1, timeout=0.3, queue_timeout=5,
+                                           cache_bytes=0, renderer=_hang_or_echo)
+    try:
+        assert service.render('deck', {}) == (b'ok', False)
+        with pytest.raises(multiprocessing.TimeoutError):
+            service.render('deck', {'hang': True})
+        assert service.snapshot()['in_flight'] == 0
+        assert service.workers_killed == 1
+        # The only slot is free again and the pool has replaced the killed worker
+        assert service.render('deck', {}) == (b'ok', False)
+    finally:
+        service.close()
+
+def test_memo_worker_renders_the_context_the_cache_key_was_built_from(monkeypatch):
+    import render_cache
+    monkeypatch.setattr(batch_render, '_warm_worker', lambda: None)
+    keyed = []
+    cache_key = render_cache.cache_key
+    monkeypatch.setattr(render_cache, 'cache_key', lambda kind, inputs, template: keyed.append(inputs) or
+                        cache_key(kind, inputs, template))
+    service = render_service.RenderService(workers=1, max_concurrent=1, timeout=5, queue_timeout=5,
+                                           renderer=_memo_date)
+    try:
+        data, cached = service.render('memo', {'context': {'date': None}})
+        # The date was resolved once in the parent, not left for the worker to resolve again
+        assert not cached and data == repr(keyed[0]['context']['date']).encode()
+        assert service.render('memo', {'context': {'date': None}}) == (data, True)
+    finally:
+        service.close()
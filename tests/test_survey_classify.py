@@ -0,0 +1,44 @@
+import pytest
+
+from survey_classify import UNCLASSIFIED, Classifier
+
+@pytest.fixture(scope='module')
+def classifier():
+    return Classifier()
+
+@pytest.mark.parametrize('answer, scheme, category', [
+    ("I have no idea what term means", 'policy_type', 'unsure'),
+    ("no term policy", 'policy_type', 'no'),
+    ("Sure, if it's free", 'interest', 'conditional'),
+    ("I don't think so", 'yes_no', 'no'),
+    ("I don't think so", 'has_insurance', 'no'),
+    ("not sure", 'yes_no', 'unsure'),
+    ("No idea, just term life needed", 'yes_no', 'unsure'),
+    ("i have term life", 'policy_type', 'term'),
+    ("Yes, through email", 'interest', 'yes'),
+    ("no", 'contact_frequency', 'never'),
+    ("Dedecuted from Paycheck", 'premium_payment', 'payroll'),
+])
+def test_categories(classifier, answer, scheme, category):
+    assert classifier.classify(answer, scheme)['category'] == category
+
+def test_negation_scope_keeps_mentions_as_zero_weight_evidence(classifier):
+    result = classifier.classify("I have no idea what term means", 'policy_type')
+    assert 'term' not in result['labels'] and 'yes' not in result['labels']
+    assert ('term(?: life)?(?: policy| insurance)?', 'term', 'term', 0.0) in result['evidence']
+    # A clause boundary ends the scope
+    assert 'term' in classifier.classify("No idea, just term life needed", 'policy_type')['labels']
+    # Uncertain keywords hedge without negating
+    assert 'employer' in classifier.classify("whatever i get through benefits", 'purchase_channel')['labels']
+
+def test_condition_qualifies_yes_only_where_the_scheme_allows_it(classifier):
+    assert classifier.classify("Sure, if it's free", 'yes_no')['category'] == 'yes'
+
+@pytest.mark.parametrize('answer', ["ig", "big", "sign me up"])
+def test_no_loose_conditional_keyword(classifier, answer):
+    assert 'conditional' not in classifier.classify(answer, 'interest')['labels']
+
+def test_batch_tally_counts_repeats(classifier):
+    batch = classifier.classify_batch(["Yes", "yes ", "No", "", "I don't think so"], 'yes_no')
+    assert batch['tally'] == {'yes': 2, 'no': 2, 'blank': 1}
+    assert classifier.classify("ig", 'yes_no')['category'] == UNCLASSIFIED
@@ -0,0 +1,59 @@
+import io
+
+import pytest
+from pptx import Presentation
+
+import create_investor_deck
+import survey_data
+
+@pytest.fixture(scope='module')
+def stats():
+    return survey_data.load_survey(cache_dir=None)['stats']
+
+def _slide(spec, title):
+    return next(slide for slide in spec if slide.get('title') == title)
+
+def test_survey_stats_fill_stat_rows_and_text(stats):
+    spec = survey_data.apply_survey_stats(create_investor_deck.DECK_SPEC, stats)
+    summary = _slide(spec, "Executive Summary")['blocks'][0]['stats']
+    assert [value for value, _, _ in summary] == [
+        str(stats['respondents']), str(stats['policyholders']), f"{stats['adoption_pct']:.0f}%"]
+
+    profile = _slide(spec, "Participant Profile")['blocks']
+    row = {label: value for value, label, _ in profile[0]['stats']}
+    text = '\n'.join(profile[1]['content'])
+    assert f"Gender: {row['Female']} Female" in text
+    # The coverage lines split the stat row's employer share into employer-only and mixed
+    assert stats['employer_only_pct'] + stats['mixed_plan_pct'] == pytest.approx(stats['employer_plan_pct'])
+    assert f"{stats['employer_only_pct']:.0f}% Employer-provided only" in text
+
+def test_every_survey_template_formats(stats):
+    for slide in survey_data.apply_survey_stats(create_investor_deck.DECK_SPEC, stats):
+        for block in slide.get('blocks', ()):
+            if 'survey_content' in block:
+                assert not any('{' in line for line in block['content'])
+
+def test_builtin_spec_is_unchanged_without_survey():
+    profile = _slide(create_investor_deck.DECK_SPEC, "Participant Profile")['blocks'][1]
+    assert "Gender: 43% Female, 57% Male" in profile['content']
+
+def test_built_deck_charts_and_highlight_match_stats(stats):
+    spec = survey_data.apply_survey_stats(create_investor_deck.DECK_SPEC, stats)
+    prs = Presentation(io.BytesIO(create_investor_deck.build_deck(spec)))
+    shapes = {shape.name: shape for slide in prs.slides for shape in slide.shapes}
+    for slide_spec, key in zip(spec, create_investor_deck.slide_keys(spec)):
+        if 'survey_data' not in slide_spec:
+            continue
+        bars = {shapes[f"{key}/bar{i}/label"].text_frame.text: shapes[f"{key}/bar{i}/value"].text_frame.text
+                for i in range(len(slide_spec['survey_data']))}
+        assert bars == {label: f"{round(stats[stat])}%" for label, stat in slide_spec['survey_data']}
+        # Bars without a workbook figure are dropped, not left with their hand-typed values
+        assert f"{key}/bar{len(bars)}/label" not in shapes
+    texts = [shape.text_frame.text for shape in shapes.values() if shape.has_text_frame]
+    assert any(text.startswith(f"{stats['policy_type_unsure_pct']:.0f}% of respondents") for text in texts)
+    assert not any("72%" in text or "89%" in text for text in texts)
+
+def test_printed_sample_size_comes_from_the_spec(stats, tmp_path, capsys):
+    spec = survey_data.apply_survey_stats(create_investor_deck.DECK_SPEC, stats)
+    create_investor_deck.main(str(tmp_path / 'deck.pptx'), spec)
+    assert f"Sample size: {stats['respondents']} participants, {stats['policyholders']} active" in capsys.readouterr().out
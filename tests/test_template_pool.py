@@ -0,0 +1,37 @@
+import os
+
+from docx import Document
+from pptx import Presentation
+
+import create_investor_deck
+import package_writer
+import template_pool
+
+def _slide_size(prs):
+    prs.slide_width = 12192000
+    prs.slide_height = 6858000
+
+def test_clones_serialize_like_fresh_templates():
+    template_pool.clear()
+    assert package_writer.save_package(template_pool.presentation()) == package_writer.save_package(Presentation())
+    assert package_writer.save_package(template_pool.document()) == package_writer.save_package(Document())
+    fresh = Presentation()
+    _slide_size(fresh)
+    assert (package_writer.save_package(template_pool.presentation(setup=_slide_size))
+            == package_writer.save_package(fresh))
+
+def test_clones_are_independent():
+    first = template_pool.presentation(setup=create_investor_deck.setup_presentation)
+    first.slides.add_slide(first.slide_layouts[0])
+    assert len(template_pool.presentation(setup=create_investor_deck.setup_presentation).slides) == 0
+
+def test_edited_custom_template_is_reloaded(tmp_path):
+    path = str(tmp_path / 'brand.pptx')
+    Presentation().save(path)
+    assert template_pool.presentation(path).slide_width == Presentation().slide_width
+    edited = Presentation()
+    _slide_size(edited)
+    edited.save(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert template_pool.presentation(path).slide_width == 12192000
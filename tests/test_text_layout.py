@@ -0,0 +1,40 @@
+from pptx.util import Inches
+
+import create_investor_deck as deck
+import text_layout
+
+def _blocks():
+    lines = [f"Finding {i}: policyholders describe their coverage in their own words, often at length" for i in range(30)]
+    return [
+        {'type': 'stat_row', 'stats': [("7", "Participants", deck.EMERALD)]},
+        {'type': 'text', 'content': lines[:12] + [""] + lines[12:]},
+        {'type': 'highlight', 'text': "Closing insight", 'color': deck.ROSE},
+    ]
+
+def test_overflowing_blocks_split_across_pages_without_loss():
+    blocks = _blocks()
+    pages = deck.paginate_blocks(blocks)
+    assert len(pages) > 1
+    for page in pages:
+        assert sum(deck.block_height(block) for block in page) <= deck.CONTENT_BOTTOM - deck.CONTENT_TOP
+    placed = [block for page in pages for block in page]
+    assert [b for b in placed if b['type'] != 'text'] == [blocks[0], blocks[2]]
+    # Every paragraph lands on some page, in order; only blank lines at a page break are dropped
+    text = [line for b in placed if b['type'] == 'text' for line in b['content']]
+    assert [line for line in text if line] == [line for line in blocks[1]['content'] if line]
+
+def test_blocks_that_fit_stay_on_one_page():
+    blocks = [dict(block, content=block['content'][:3]) if block['type'] == 'text' else block for block in _blocks()]
+    assert deck.paginate_blocks(blocks) == [blocks]
+
+def test_overflow_becomes_continuation_slides():
+    prs = deck.render_deck([{'type': 'content', 'title': "Findings", 'blocks': _blocks()}])
+    names = [shape.name for slide in prs.slides for shape in slide.shapes]
+    assert len(prs.slides) == len(deck.paginate_blocks(_blocks()))
+    assert any(name.startswith("findings-cont1/") for name in names)
+
+def test_wrapping_follows_measured_width():
+    text = "Comprehensive qualitative study examining life insurance customer experience"
+    assert text_layout.line_count(text, 14, Inches(8)) == 1
+    assert text_layout.line_count(text, 14, Inches(2)) > 2
+    assert text_layout.string_width("WWW") > text_layout.string_width("iii")
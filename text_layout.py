@@ -0,0 +1,153 @@
+"""Text measurement from cached glyph-advance tables.
+
+Widths are in 1/1000 em (AFM units) for the printable ASCII range. They come from the
+standard Helvetica / Helvetica-Bold metrics, which Helvetica Neue tracks closely, and
+from the Calibri / Cambria metrics that .docx documents use. Word widths and wrapped
+line counts are memoized, so laying out thousands of slides or pages measures each
+distinct string once and never renders anything.
+"""
+from functools import lru_cache
+
+EMU_PER_PT = 12700
+EMU_PER_INCH = 914400
+
+# Default python-pptx textbox insets: 0.1in left/right, 0.05in top/bottom
+TEXTBOX_INSET_X = 91440
+TEXTBOX_INSET_Y = 45720
+
+LINE_HEIGHT = 1.2
+
+# Advance widths for chr(32)..chr(126)
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+# Calibri and Cambria are the .docx theme fonts (headings and body text of python-docx documents)
+_CALIBRI = (
+    226, 326, 401, 498, 507, 715, 682, 221, 303, 303, 498, 498, 250, 306, 252, 386,
+    507, 507, 507, 507, 507, 507, 507, 507, 507, 507, 268, 268, 498, 498, 498, 463,
+    894, 579, 544, 533, 615, 488, 459, 631, 623, 252, 319, 520, 420, 855, 646, 662,
+    517, 673, 543, 459, 487, 642, 567, 890, 519, 487, 468, 307, 386, 307, 498, 498,
+    291, 479, 525, 423, 525, 498, 305, 471, 525, 230, 239, 455, 230, 799, 525, 527,
+    525, 525, 349, 391, 335, 525, 452, 715, 433, 453, 395, 314, 460, 314, 498,
+)
+_CALIBRI_BOLD = (
+    226, 326, 438, 498, 507, 729, 705, 233, 312, 312, 498, 498, 258, 306, 267, 430,
+    507, 507, 507, 507, 507, 507, 507, 507, 507, 507, 276, 276, 498, 498, 498, 463,
+    898, 606, 561, 529, 630, 488, 459, 637, 631, 267, 331, 547, 423, 874, 659, 676,
+    532, 686, 563, 473, 495, 653, 591, 906, 551, 520, 478, 325, 430, 325, 498, 498,
+    300, 494, 537, 418, 537, 503, 316, 474, 537, 246, 255, 480, 246, 813, 537, 538,
+    537, 537, 355, 399, 347, 537, 473, 745, 459, 474, 397, 344, 475, 344, 498,
+)
+_CAMBRIA = (
+    220, 276, 404, 550, 550, 845, 729, 220, 334, 334, 430, 550, 250, 313, 250, 460,
+    550, 550, 550, 550, 550, 550, 550, 550, 550, 550, 250, 250, 550, 550, 550, 424,
+    896, 662, 645, 627, 717, 591, 556, 701, 755, 321, 310, 649, 540, 904, 734, 716,
+    590, 716, 658, 527, 576, 716, 634, 963, 609, 571, 563, 334, 460, 334, 550, 412,
+    300, 512, 561, 457, 561, 491, 316, 494, 572, 289, 281, 534, 274, 862, 577, 527,
+    561, 549, 439, 424, 368, 575, 489, 747, 494, 490, 447, 356, 261, 356, 550,
+)
+_CAMBRIA_BOLD = (
+    220, 306, 452, 550, 550, 855, 767, 252, 364, 364, 455, 550, 257, 333, 257, 459,
+    550, 550, 550, 550, 550, 550, 550, 550, 550, 550, 283, 283, 550, 550, 550, 464,
+    920, 695, 665, 627, 732, 617, 580, 698, 778, 345, 332, 680, 554, 934, 751, 745,
+    617, 745, 693, 546, 612, 732, 676, 996, 638, 604, 566, 364, 459, 364, 550, 414,
+    300, 519, 587, 470, 587, 507, 355, 514, 607, 313, 291, 570, 298, 922, 607, 570,
+    587, 587, 451, 437, 387, 603, 512, 814, 511, 510, 442, 376, 276, 376, 550,
+)
+# Characters outside ASCII that the deck uses
+_EXTRA = {
+    '→': 1000, '•': 350, '–': 556, '—': 1000, '‘': 222, '’': 222, '“': 333, '”': 333,
+    '…': 1000, '×': 584, '≥': 549, '≤': 549, ' ': 278,
+}
+_DEFAULT_ADVANCE = 556
+
+FONT_TABLES = {
+    ('Helvetica Neue', False): _HELVETICA,
+    ('Helvetica Neue', True): _HELVETICA_BOLD,
+    ('Helvetica', False): _HELVETICA,
+    ('Helvetica', True): _HELVETICA_BOLD,
+    ('Calibri', False): _CALIBRI,
+    ('Calibri', True): _CALIBRI_BOLD,
+    ('Cambria', False): _CAMBRIA,
+    ('Cambria', True): _CAMBRIA_BOLD,
+}
+
+# Single line spacing as a multiple of the font size: (ascent + descent + line gap) / em
+LINE_HEIGHTS = {
+    'Calibri': 1.2207,
+    'Cambria': 1.1724,
+}
+
+@lru_cache(maxsize=None)
+def advance_table(font='Helvetica Neue', bold=False):
+    """Character -> advance width (1/1000 em) for a font; unknown fonts fall back to Helvetica"""
+    widths = FONT_TABLES.get((font, bold)) or FONT_TABLES[('Helvetica Neue', bold)]
+    table = {chr(32 + i): w for i, w in enumerate(widths)}
+    table.update(_EXTRA)
+    return table
+
+@lru_cache(maxsize=65536)
+def string_width(text, font='Helvetica Neue', bold=False):
+    """Unscaled width of a string in 1/1000 em"""
+    table = advance_table(font, bold)
+    return sum(table.get(ch, _DEFAULT_ADVANCE) for ch in text)
+
+@lru_cache(maxsize=16384)
+def wrap_text(text, size_pt, width_emu, font='Helvetica Neue', bold=False):
+    """Greedy word wrap of one paragraph into a tuple of lines that fit width_emu at size_pt"""
+    # Widths in 1/1000 em at this size: emu = units * size_pt * EMU_PER_PT / 1000
+    limit = width_emu * 1000 / (size_pt * EMU_PER_PT)
+    space = string_width(' ', font, bold)
+
+    lines = []
+    current = ''
+    current_width = 0
+    # Leading indentation is kept on the first line, as the deck's "   → " sub-bullets rely on it
+    indent = len(text) - len(text.lstrip(' '))
+    words = text.split(' ')
+    for i, word in enumerate(words):
+        if i < indent:
+            current += ' '
+            current_width += space
+            continue
+        w = string_width(word, font, bold)
+        if current.strip() and current_width + space + w > limit:
+            lines.append(current)
+            current, current_width = word, w
+        elif current.strip():
+            current += ' ' + word
+            current_width += space + w
+        else:
+            current += word
+            current_width += w
+    lines.append(current)
+    return tuple(lines)
+
+def line_count(text, size_pt, width_emu, font='Helvetica Neue', bold=False):
+    return len(wrap_text(text, size_pt, width_emu, font, bold))
+
+def paragraph_height(text, size_pt, width_emu, space_before_pt=0, space_after_pt=0,
+                     font='Helvetica Neue', bold=False):
+    """Height in EMU of one wrapped paragraph including its spacing"""
+    lines = line_count(text, size_pt, width_emu, font, bold)
+    return int((lines * size_pt * LINE_HEIGHT + space_before_pt + space_after_pt) * EMU_PER_PT)
+
+def textbox_height(texts, size_pt, box_width_emu, space_before_pt=0, space_after_pt=0,
+                   font='Helvetica Neue', bold=False):
+    """Height in EMU a textbox of box_width_emu needs to hold these paragraphs, insets included"""
+    width = box_width_emu - 2 * TEXTBOX_INSET_X
+    body = sum(paragraph_height(t, size_pt, width, space_before_pt, space_after_pt, font, bold) for t in texts)
+    return body + 2 * TEXTBOX_INSET_Y